@@ -0,0 +1,6 @@
+"""
+Benchmarks - Performance and scaling measurements for the Funding DSL.
+
+Each benchmark is a standalone script that can be run from the project root,
+e.g. ``python -m benchmarks.bench_parser_scaling``.
+"""
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Block extraction regression benchmark - guards the regex engine's block walkers
+against quadratic behaviour.
+
+Times FundingDSLParser._extract_tiers on a single `tiers { }` block holding up
+to 50k tiers, fits the scaling exponent and exits with status 1 when it exceeds
+the allowed maximum.
+
+Usage:
+    python -m benchmarks.bench_block_extraction
+    python -m benchmarks.bench_block_extraction --sizes 10000 50000 100000 --max-exponent 1.2
+"""
+
+import argparse
+import gc
+import sys
+import time
+from typing import List
+
+from textual.funding_dsl_parser import FundingDSLParser
+from .bench_parser_scaling import scaling_exponent
+from .synthetic import generate_funding_dsl
+
+
+DEFAULT_SIZES = [5000, 10000, 25000, 50000]
+
+
+def time_extract_tiers(parser: FundingDSLParser, text: str, repeat: int) -> float:
+    """Return the best wall-clock time of `repeat` tier extractions"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            parser._extract_tiers(text)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def run(sizes: List[int], repeat: int) -> float:
+    """Run the benchmark, print a report and return the scaling exponent"""
+    parser = FundingDSLParser()
+    timings = []
+
+    print(f"{'tiers':>10} {'bytes':>12} {'seconds':>10} {'us/tier':>10}")
+    for n in sizes:
+        text = generate_funding_dsl(tiers=n)
+        elapsed = time_extract_tiers(parser, text, repeat)
+        timings.append(elapsed)
+        print(f"{n:>10} {len(text):>12} {elapsed:>10.4f} {elapsed / n * 1e6:>10.2f}")
+
+    exponent = scaling_exponent(sizes, timings)
+    print(f"Scaling exponent: {exponent:.2f} (1.0 = linear)")
+    return exponent
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Regression benchmark for tiers block extraction")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Number of tiers in the block')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size (best is reported)')
+    parser.add_argument('--max-exponent', type=float, default=1.3,
+                        help='Fail when the fitted exponent is above this value (default: 1.3)')
+    args = parser.parse_args()
+
+    exponent = run(sorted(args.sizes), args.repeat)
+    if exponent > args.max_exponent:
+        print(f"❌ Tier extraction is superlinear: exponent {exponent:.2f} > {args.max_exponent}", file=sys.stderr)
+        return 1
+
+    print("✅ Tier extraction scales linearly")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
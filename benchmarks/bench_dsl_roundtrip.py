@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+DSL round-trip benchmark - serialize many configurations and parse them back.
+
+Builds N configurations with 3 sources, 4 tiers and 2 goals each, serializes
+them to strings with serialize_dsl, streams them to N .dsl files with
+write_dsl next to writing the pre-rendered strings to N other files (the
+file I/O alone), then parses a sample of the files back with each
+FundingDSLParser engine (and textX) and checks every one equals its original configuration
+(with sources grouped by platform for the regex engine, which reads them so).
+
+Usage:
+    python -m benchmarks.bench_dsl_roundtrip
+    python -m benchmarks.bench_dsl_roundtrip --configs 10000 --verify 500
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.bench_funding_catalog import build_configurations
+from metamodel.funding_metamodel import FundingPlatform
+from textual.dsl_serializer import serialize_dsl, write_dsl
+from textual.funding_dsl_parser import FundingDSLParser, PLATFORM_KEYWORDS, SOURCE_PLATFORMS
+from textual_textx.funding_dsl_textx_parser import FundingDSLTextXParser
+
+
+SCAN_ORDER = {PLATFORM_KEYWORDS[keyword]: index for index, keyword in enumerate(SOURCE_PLATFORMS)}
+
+
+def grouped_by_platform(config):
+    """The configuration as the regex engine reads it, with sources in platform scan order"""
+    return dataclasses.replace(config, funding_sources=sorted(config.funding_sources, key=lambda s: SCAN_ORDER[s.platform]))
+
+
+def timed(label: str, count: int, action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<26} {elapsed:>8.2f} s  {count / elapsed:>10.0f} files/s")
+    return elapsed
+
+
+def run(count: int, verify: int) -> None:
+    """Run the benchmark and print a report"""
+    configs = build_configurations(count)
+    for config in configs:
+        # Dates only, as in the DSL, and URLs for custom sources, which textX requires
+        for goal in config.goals:
+            goal.deadline = goal.deadline.replace(hour=0, minute=0, second=0, microsecond=0)
+        for source in config.funding_sources:
+            if source.platform == FundingPlatform.CUSTOM:
+                source.custom_url = f"https://example.com/{source.username}"
+
+    print(f"{count} configurations:")
+    texts = []
+    elapsed = timed("serialize_dsl", count, lambda: texts.extend(serialize_dsl(c) for c in configs))
+    size = sum(len(text) for text in texts)
+    print(f"  {size / 1e6:.1f} MB of DSL, {size / elapsed / 1e6:.1f} MB/s")
+
+    with tempfile.TemporaryDirectory() as root:
+        paths = [os.path.join(root, f"project-{i}.dsl") for i in range(count)]
+
+        def write_files():
+            for config, path in zip(configs, paths):
+                with open(path, 'w', encoding='utf-8') as f:
+                    write_dsl(config, f)
+
+        def write_texts():
+            for i, text in enumerate(texts):
+                with open(os.path.join(root, f"text-{i}.dsl"), 'w', encoding='utf-8') as f:
+                    f.write(text)
+
+        timed("write_dsl to files", count, write_files)
+        timed("pre-rendered text (I/O only)", count, write_texts)
+
+        sample = min(verify, count)
+        print(f"\nParsing {sample} files back:")
+        expected = configs[:sample]
+        for label, parser, originals in [
+            ("regex engine", FundingDSLParser(), [grouped_by_platform(c) for c in expected]),
+            ("tokenizer engine", FundingDSLParser('tokenizer'), expected),
+            ("textX", FundingDSLTextXParser(), expected),
+        ]:
+            parsed = []
+            timed(label, sample, lambda: parsed.extend(parser.parse_file(p) for p in paths[:sample]))
+            assert parsed == originals, f"{label} did not round-trip"
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark DSL serialization and round-trips")
+    parser.add_argument('--configs', type=int, default=100_000, help='Number of configurations to serialize')
+    parser.add_argument('--verify', type=int, default=2_000, help='Files parsed back with each parser')
+    args = parser.parse_args()
+
+    run(args.configs, args.verify)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
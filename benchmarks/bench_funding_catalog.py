@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Funding catalog benchmark - fleet-wide aggregations over many configurations.
+
+Builds N synthetic configurations, ingests them into a FundingCatalog and
+times each aggregation - including a rollup normalized to USD through the
+bundled rate table - with NumPy (when installed) and with the pure-Python
+fallback, next to running InteractiveDiagramGenerator.analyze_configuration
+on every configuration one by one.
+
+Usage:
+    python -m benchmarks.bench_funding_catalog
+    python -m benchmarks.bench_funding_catalog --configs 10000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+import metamodel.funding_catalog as catalog_module
+from graphical.interactive_diagrams import InteractiveDiagramGenerator
+from metamodel.currency import CurrencyConverter
+from metamodel.funding_catalog import FundingCatalog
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform, CurrencyType
+)
+
+
+PLATFORMS = list(FundingPlatform)
+CURRENCIES = list(CurrencyType)
+
+
+def build_configurations(count: int) -> List[FundingConfiguration]:
+    """Build configurations with 3 sources, 4 tiers and 2 goals each"""
+    start = datetime(2030, 1, 1)
+    configs = []
+    for i in range(count):
+        currency = CURRENCIES[i % len(CURRENCIES)]
+        config = FundingConfiguration(project_name=f"project-{i}")
+        for j in range(3):
+            config.add_funding_source(FundingSource(PLATFORMS[(i + j) % len(PLATFORMS)], f"user{i}"))
+        for j in range(4):
+            config.add_tier(FundingTier(f"Tier {j}", FundingAmount(5.0 * (1 + (i + j) % 40), currency)))
+        for j in range(2):
+            config.add_goal(FundingGoal(f"Goal {j}", FundingAmount(1000.0 + i % 500, currency),
+                                        deadline=start + timedelta(days=(i * 7 + j) % 365),
+                                        current_amount=FundingAmount(float(i % 1000), currency)))
+        configs.append(config)
+    return configs
+
+
+def timed(label: str, action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:>10.2f} ms")
+    return elapsed
+
+
+def run(count: int) -> None:
+    """Run the benchmark and print a report"""
+    configs = build_configurations(count)
+    now = datetime(2030, 1, 1)
+
+    print(f"{count} configurations")
+    catalog = FundingCatalog()
+    converter = CurrencyConverter()
+    timed("ingest", lambda: catalog.extend(configs))
+    timed("analyze_configuration x N", lambda: [InteractiveDiagramGenerator(c).analyze_configuration() for c in configs])
+
+    modes = [True, False] if catalog_module.NUMPY_AVAILABLE else [False]
+    for use_numpy in modes:
+        catalog_module.NUMPY_AVAILABLE = use_numpy
+        print(f"\n{'NumPy' if use_numpy else 'Pure Python'} aggregations:")
+        timed("platform_distribution", catalog.platform_distribution)
+        timed("total_targets_by_currency", catalog.total_targets_by_currency)
+        timed("total_targets in USD", lambda: catalog.total_targets(CurrencyType.USD, converter))
+        timed("tier_price_percentiles", catalog.tier_price_percentiles)
+        timed("goals_at_risk (30 days)", lambda: catalog.goals_at_risk(timedelta(days=30), 50.0, now))
+    catalog_module.NUMPY_AVAILABLE = modes[0]
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark FundingCatalog aggregations")
+    parser.add_argument('--configs', type=int, default=100_000, help='Number of configurations')
+    args = parser.parse_args()
+
+    run(args.configs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
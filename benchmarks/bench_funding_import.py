@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+FUNDING.yml import benchmark - subset loader vs. PyYAML, and bulk import.
+
+Renders N FUNDING.yml documents with FundingExporter, loads them with the
+FUNDING.yml subset loader, PyYAML's libyaml CSafeLoader (when available)
+and the pure-Python SafeLoader, then writes them as <repo>/.github/FUNDING.yml
+files in a temporary directory and imports the tree with import_many,
+reporting files/s, MB/s and the per-phase split.
+
+Usage:
+    python -m benchmarks.bench_funding_import
+    python -m benchmarks.bench_funding_import --files 10000 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.bench_funding_yml import build_configurations
+from export.funding_exporter import FundingExporter
+from export.funding_importer import LOADERS, import_many, load_funding_yml
+import export.funding_importer as importer_module
+
+
+def timed(label: str, count: int, action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed:>8.2f} s  {count / elapsed:>10.0f} files/s")
+    return elapsed
+
+
+def run(count: int, workers: int) -> None:
+    """Run the benchmark and print a report"""
+    documents = [FundingExporter(c).to_github_funding_yml() for c in build_configurations(count)]
+    size = sum(len(d.encode('utf-8')) for d in documents)
+
+    print(f"{count} FUNDING.yml documents ({size / 1e6:.1f} MB) loaded with:")
+    loaders = [loader for loader in LOADERS if loader != 'auto']
+    if importer_module._LIBYAML_LOADER is None:
+        loaders.remove('libyaml')
+    expected = [load_funding_yml(d, 'pyyaml') for d in documents[:1000]]
+    for loader in loaders:
+        timed(loader, count, lambda: [load_funding_yml(d, loader) for d in documents])
+        assert [load_funding_yml(d, loader) for d in documents[:1000]] == expected
+
+    with tempfile.TemporaryDirectory() as root:
+        for i, document in enumerate(documents):
+            directory = os.path.join(root, f"repo-{i}", ".github")
+            os.makedirs(directory)
+            with open(os.path.join(directory, "FUNDING.yml"), 'w', encoding='utf-8') as f:
+                f.write(document)
+
+        print(f"\nimport_many with {workers} worker(s):")
+        totals = {'read': 0.0, 'load': 0.0, 'build': 0.0}
+        failed = 0
+        start = time.perf_counter()
+        for _, result in import_many([root], workers=workers):
+            if isinstance(result, Exception):
+                failed += 1
+                continue
+            for phase, seconds in result.timings.items():
+                totals[phase] += seconds
+        elapsed = time.perf_counter() - start
+        print(f"  {count} files, {failed} failed in {elapsed:.2f} s "
+              f"({count / elapsed:.0f} files/s, {size / elapsed / 1e6:.2f} MB/s)")
+        for phase, seconds in totals.items():
+            print(f"  {phase:<6} {seconds / count * 1e6:>8.1f} us/file")
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark FUNDING.yml loading and bulk import")
+    parser.add_argument('--files', type=int, default=20_000, help='Number of documents')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for import_many')
+    args = parser.parse_args()
+
+    run(args.files, args.workers or os.cpu_count() or 1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+FUNDING.yml emitter benchmark - table-driven writer vs. PyYAML.
+
+Builds N configurations with 1-6 active sources each and renders a
+FUNDING.yml for every one with FundingExporter.to_github_funding_yml,
+then renders the same key/value mapping with yaml.safe_dump (and with the
+libyaml CSafeDumper when PyYAML was built with it). The first 1000
+documents of each are checked to load back to the same data.
+
+Usage:
+    python -m benchmarks.bench_funding_yml
+    python -m benchmarks.bench_funding_yml --configs 10000
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+from export.funding_exporter import FundingExporter, GITHUB_FUNDING_KEYS
+from metamodel.funding_metamodel import FundingConfiguration, FundingSource, FundingPlatform
+
+
+PLATFORMS = [platform for _, platform in GITHUB_FUNDING_KEYS]
+
+
+def build_configurations(count: int) -> List[FundingConfiguration]:
+    """Build configurations with 1-6 sources spread over every FUNDING.yml platform"""
+    configs = []
+    for i in range(count):
+        config = FundingConfiguration(project_name=f"project-{i}")
+        for j in range(1 + i % 6):
+            platform = PLATFORMS[(i + j * 5) % len(PLATFORMS)]
+            if platform == FundingPlatform.TIDELIFT:
+                username = f"npm/package-{i}"
+            elif platform == FundingPlatform.THANKS_DEV:
+                username = f"u/gh/user{i}"
+            else:
+                username = f"user{i}-{j}"
+            url = f"https://example.com/{i}/{j}" if platform == FundingPlatform.CUSTOM else None
+            config.add_funding_source(FundingSource(platform, username, custom_url=url))
+        configs.append(config)
+    return configs
+
+
+def funding_mapping(config: FundingConfiguration) -> Dict[str, Any]:
+    """The FUNDING.yml key/value mapping of a configuration, for PyYAML"""
+    groups = config.sources_by_platform()
+    data = {}
+    for key, platform in GITHUB_FUNDING_KEYS:
+        if platform in groups:
+            values = [s.custom_url or s.username if platform == FundingPlatform.CUSTOM else s.username
+                      for s in groups[platform]]
+            data[key] = values if len(values) > 1 else values[0]
+    return data
+
+
+def timed(label: str, action: Callable[[], List[str]]) -> List[str]:
+    start = time.perf_counter()
+    documents = action()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<34} {elapsed:>8.2f} s  {len(documents) / elapsed:>10.0f} files/s")
+    return documents
+
+
+def run(count: int) -> None:
+    """Run the benchmark and print a report"""
+    configs = build_configurations(count)
+    mappings = [funding_mapping(config) for config in configs]
+
+    print(f"{count} FUNDING.yml files:")
+    native = timed("FundingExporter", lambda: [FundingExporter(c).to_github_funding_yml() for c in configs])
+    dumpers = [("yaml.safe_dump", yaml.SafeDumper)]
+    if hasattr(yaml, 'CSafeDumper'):
+        dumpers.append(("yaml.safe_dump (CSafeDumper)", yaml.CSafeDumper))
+    for label, dumper in dumpers:
+        documents = timed(label, lambda: [
+            yaml.dump(m, Dumper=dumper, default_flow_style=None, sort_keys=False) for m in mappings
+        ])
+        assert all(yaml.safe_load(a) == yaml.safe_load(b) for a, b in zip(native[:1000], documents[:1000]))
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark FUNDING.yml generation")
+    parser.add_argument('--configs', type=int, default=100_000, help='Number of files to generate')
+    args = parser.parse_args()
+
+    run(args.configs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Metamodel memory benchmark - regular vs. slotted vs. frozen entity classes.
+
+Builds one configuration holding N funding sources (plus N/10 tiers and
+goals) from the regular metamodel, converts it with compact_configuration()
+and reports the memory traced for each representation.
+
+Usage:
+    python -m benchmarks.bench_metamodel_memory
+    python -m benchmarks.bench_metamodel_memory --sources 100000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Dict
+
+from metamodel.compact import CompactBuilder
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform, CurrencyType
+)
+
+
+PLATFORMS = [platform for platform in FundingPlatform if platform != FundingPlatform.CUSTOM]
+
+
+def build_regular(sources: int) -> FundingConfiguration:
+    """Build a configuration from the regular dataclasses"""
+    config = FundingConfiguration(project_name="Catalog")
+    for i in range(sources):
+        config.add_funding_source(FundingSource(PLATFORMS[i % len(PLATFORMS)], f"user{i % 1000}"))
+    for i in range(sources // 10):
+        config.add_tier(FundingTier(f"Tier {i % 50}", FundingAmount(5.0 * (1 + i % 20)), benefits=["Thanks"]))
+        config.add_goal(FundingGoal(f"Goal {i % 50}", FundingAmount(1000.0, CurrencyType.EUR)))
+    return config
+
+
+def traced_bytes(build: Callable[[], object]) -> int:
+    """Return the memory still allocated by the object build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def run(sources: int) -> Dict[str, int]:
+    """Run the benchmark, print a report and return bytes per representation"""
+    regular = build_regular(sources)
+    results = {
+        'regular': traced_bytes(lambda: build_regular(sources)),
+        'slotted': traced_bytes(lambda: CompactBuilder(frozen=False).configuration(regular)),
+        'frozen': traced_bytes(lambda: CompactBuilder(frozen=True).configuration(regular))
+    }
+
+    entities = sources + 2 * (sources // 10)
+    print(f"{sources} sources, {entities} entities in total")
+    print(f"{'representation':>15} {'MiB':>10} {'bytes/entity':>13} {'vs regular':>11}")
+    for name, size in results.items():
+        print(f"{name:>15} {size / 2**20:>10.1f} {size / entities:>13.1f} {size / results['regular']:>10.0%}")
+    return results
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark metamodel memory use")
+    parser.add_argument('--sources', type=int, default=1_000_000, help='Number of funding sources')
+    args = parser.parse_args()
+
+    run(args.sources)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
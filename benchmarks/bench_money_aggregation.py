@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Money aggregation benchmark - integer cents vs. float vs. Decimal sums.
+
+Sums N two-decimal prices held as floats, Decimals and integer cents, both
+as bare values and through the amount objects (FundingAmount.value vs.
+CentsAmount.cents), and reports the time of each together with the drift of
+the float total from the exact result.
+
+Usage:
+    python -m benchmarks.bench_money_aggregation
+    python -m benchmarks.bench_money_aggregation --amounts 100000
+"""
+
+import argparse
+import gc
+import math
+import random
+import sys
+import time
+from decimal import Decimal
+from typing import Callable
+
+from metamodel.funding_metamodel import FundingAmount
+from metamodel.money import CentsAmount, sum_amounts
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def best_time(action: Callable[[], object], repeat: int) -> float:
+    """Best wall-clock time of `repeat` runs with the garbage collector paused"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            action()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def run(count: int, repeat: int) -> None:
+    """Run the benchmark and print a report"""
+    rng = random.Random(42)
+    literals = [f"{rng.randint(1, 99999)}.{rng.randint(0, 99):02d}" for _ in range(count)]
+    floats = [float(literal) for literal in literals]
+    decimals = [Decimal(literal) for literal in literals]
+    cents = [CentsAmount.from_literal(literal).cents for literal in literals]
+    float_amounts = [FundingAmount(value) for value in floats]
+    cents_amounts = [CentsAmount(value) for value in cents]
+
+    exact = sum(decimals)
+    drift = abs(Decimal(repr(sum(floats))) - exact)
+
+    cases = [
+        ("float sum()", lambda: sum(floats)),
+        ("float math.fsum()", lambda: math.fsum(floats)),
+        ("Decimal sum()", lambda: sum(decimals, Decimal(0))),
+        ("int cents sum()", lambda: sum(cents)),
+        ("FundingAmount .value sum", lambda: sum(a.value for a in float_amounts)),
+        ("FundingAmount exact Decimal", lambda: sum((Decimal(repr(a.value)) for a in float_amounts), Decimal(0))),
+        ("CentsAmount sum_amounts()", lambda: sum_amounts(cents_amounts)),
+    ]
+    if NUMPY_AVAILABLE:
+        float_array = np.array(floats, dtype=np.float64)
+        cents_array = np.array(cents, dtype=np.int64)
+        cases.append(("NumPy float64 sum", float_array.sum))
+        cases.append(("NumPy int64 sum", cents_array.sum))
+
+    print(f"{count} amounts, exact total {exact}, float sum() drift {drift}")
+    print(f"{'method':<28} {'ms':>10}")
+    for label, action in cases:
+        print(f"{label:<28} {best_time(action, repeat) * 1000:>10.2f}")
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark integer-cents aggregation")
+    parser.add_argument('--amounts', type=int, default=1_000_000, help='Number of amounts to sum')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per method (best is reported)')
+    args = parser.parse_args()
+
+    run(args.amounts, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
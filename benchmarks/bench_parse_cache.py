@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Parse cache benchmark - cold vs. warm parsing of a corpus of .dsl files.
+
+Writes N synthetic files, parses them once with an empty ParseCache (cold)
+and again with the populated cache (warm), then prints both timings and the
+cache counters.
+
+Usage:
+    python -m benchmarks.bench_parse_cache
+    python -m benchmarks.bench_parse_cache --files 2000 --entities 50 --backend textx
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from textual.funding_dsl_parser import FundingDSLParser
+from textual.parse_cache import ParseCache
+from .synthetic import generate_funding_dsl
+
+
+def make_parser(backend: str, cache: ParseCache):
+    """Create a parser for the requested backend"""
+    if backend == 'textx':
+        from textual_textx import FundingDSLTextXParser
+        return FundingDSLTextXParser(cache=cache)
+    return FundingDSLParser(engine=backend, cache=cache)
+
+
+def parse_all(parser, paths) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        parser.parse_file(str(path))
+    return time.perf_counter() - start
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark the content-addressed parse cache")
+    parser.add_argument('--files', type=int, default=500, help='Number of .dsl files')
+    parser.add_argument('--entities', type=int, default=20, help='Sources and tiers per file')
+    parser.add_argument('--backend', choices=['regex', 'tokenizer', 'textx'], default='regex')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus = Path(tmp_dir) / 'corpus'
+        corpus.mkdir()
+        paths = []
+        for i in range(args.files):
+            path = corpus / f"project_{i}.dsl"
+            text = generate_funding_dsl(sources=args.entities, tiers=args.entities)
+            path.write_text(text.replace('SyntheticProject', f'Project{i}'), encoding='utf-8')
+            paths.append(path)
+
+        cache = ParseCache(Path(tmp_dir) / 'cache')
+        cold = parse_all(make_parser(args.backend, cache), paths)
+        warm = parse_all(make_parser(args.backend, cache), paths)
+        stats = cache.stats()
+
+    print(f"Backend: {args.backend}, {args.files} files x {args.entities} sources/tiers")
+    print(f"Cold (all misses): {cold:8.3f} s  ({cold / args.files * 1000:.2f} ms/file)")
+    print(f"Warm (all hits):   {warm:8.3f} s  ({warm / args.files * 1000:.2f} ms/file)")
+    print(f"Speedup:           {cold / warm:8.1f}x")
+    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+          f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Parser scaling benchmark - measures how parse time grows with file size.
+
+Parses synthetic documents holding N sources and N tiers with every
+FundingDSLParser engine and reports the time per entity together with the
+fitted scaling exponent (1.0 = linear, 2.0 = quadratic).
+
+Usage:
+    python -m benchmarks.bench_parser_scaling
+    python -m benchmarks.bench_parser_scaling --sizes 1000 10000 50000 --engines tokenizer
+"""
+
+import argparse
+import gc
+import math
+import sys
+import time
+from typing import Dict, List
+
+from textual.funding_dsl_parser import FundingDSLParser
+from .synthetic import generate_funding_dsl
+
+
+DEFAULT_SIZES = [1000, 2500, 5000, 10000, 20000]
+
+
+def time_parse(parser: FundingDSLParser, text: str, repeat: int) -> float:
+    """Return the best wall-clock time of `repeat` parses of text.
+    
+    The garbage collector is paused while timing (as timeit does), since its
+    full collections scale with the number of live objects, not with the parser.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            parser.parse_text(text)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def scaling_exponent(sizes: List[int], timings: List[float]) -> float:
+    """Least-squares slope of log(time) over log(size)"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return numerator / denominator if denominator else 0.0
+
+
+def run(sizes: List[int], engines: List[str], repeat: int) -> Dict[str, float]:
+    """Run the benchmark, print a report and return the exponent per engine"""
+    documents = {n: generate_funding_dsl(sources=n, tiers=n) for n in sizes}
+    exponents = {}
+
+    for engine in engines:
+        parser = FundingDSLParser(engine)
+        print(f"\nEngine: {engine}")
+        print(f"{'entities':>10} {'bytes':>12} {'seconds':>10} {'us/entity':>10}")
+
+        timings = []
+        for n in sizes:
+            elapsed = time_parse(parser, documents[n], repeat)
+            timings.append(elapsed)
+            entities = 2 * n
+            print(f"{entities:>10} {len(documents[n]):>12} {elapsed:>10.4f} {elapsed / entities * 1e6:>10.2f}")
+
+        exponents[engine] = scaling_exponent(sizes, timings) if len(sizes) > 1 else 0.0
+        print(f"Scaling exponent: {exponents[engine]:.2f} (1.0 = linear)")
+
+    return exponents
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark FundingDSLParser scaling")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Number of sources and tiers per document')
+    parser.add_argument('--engines', nargs='+', choices=FundingDSLParser.ENGINES,
+                        default=list(FundingDSLParser.ENGINES), help='Engines to benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size (best is reported)')
+    args = parser.parse_args()
+
+    run(sorted(args.sizes), args.engines, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite - parse, transform, validate and export for every parser.
+
+Runs each stage of the pipeline on seeded synthetic documents from tiny to
+huge with the regex and tokenizer FundingDSLParser engines and with
+FundingDSLTextXParser:
+
+    parse      text -> parser data (the engine's dict, or the textX model)
+    transform  parser data -> FundingConfiguration
+    validate   FundingModelValidator.validate_configuration
+    export     FundingExporter.to_json and to_github_funding_yml
+
+Every measurement has warmup runs, then timed runs with the garbage
+collector paused (as timeit does), reported as min/p50/p90/p99, and one
+more run under tracemalloc for the peak memory. --json writes the results
+as JSON; --baseline compares them with a stored JSON file and exits with
+status 1 when any p50 (or the --metric chosen) or peak memory grew by
+more than --tolerance. No baseline is shipped, as timings depend on the
+machine: store one with --json where the checks run.
+
+Usage:
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --sizes tiny small medium --json baseline.json
+    python -m benchmarks.bench_suite --sizes tiny small medium --baseline baseline.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from export.funding_exporter import FundingExporter
+from metamodel.funding_metamodel import FundingModelValidator
+from textual.funding_dsl_parser import FundingDSLParser
+from textual_textx.funding_dsl_textx_parser import FundingDSLTextXParser
+from .synthetic import generate_synthetic_dsl
+
+
+RESULTS_VERSION = 1
+
+# Size -> (entities per block, warmup runs, timed runs)
+SIZES = {
+    'tiny': (1, 20, 200),
+    'small': (13, 10, 100),
+    'medium': (100, 3, 30),
+    'large': (1_000, 1, 10),
+    'huge': (10_000, 1, 5),
+}
+DEFAULT_SIZES = ['tiny', 'small', 'medium', 'large']
+PARSERS = ['regex', 'tokenizer', 'textx']
+PERCENTILES = (50, 90, 99)
+
+# Differences below these are timer and allocator noise and never count as regressions
+NOISE_FLOOR_SECONDS = 20e-6
+NOISE_FLOOR_BYTES = 64 * 1024
+
+
+def _stages(parser_name: str) -> Tuple[Callable[[str], Any], Callable[[Any], Any]]:
+    """The parse and transform functions of a parser"""
+    if parser_name == 'textx':
+        parser = FundingDSLTextXParser()
+        return parser.metamodel.model_from_str, parser._transform_model
+    parser = FundingDSLParser(parser_name)
+    parse = parser._single_pass_parse if parser_name == 'tokenizer' else parser._simple_parse
+    return parse, parser._build_configuration
+
+
+def _export(config) -> None:
+    exporter = FundingExporter(config)
+    exporter.to_json()
+    exporter.to_github_funding_yml()
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Linearly interpolated q-th percentile of sorted values"""
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def measure(action: Callable[[], Any], warmup: int, runs: int) -> Dict[str, float]:
+    """Timing statistics and peak traced memory of action"""
+    for _ in range(warmup):
+        action()
+
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            action()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        action()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    stats = {'min': timings[0], 'mean': sum(timings) / len(timings)}
+    stats.update({f"p{q}": percentile(timings, q) for q in PERCENTILES})
+    stats['max'] = timings[-1]
+    stats['peak_memory_bytes'] = peak
+    return stats
+
+
+def run(sizes: List[str], parsers: List[str], repeat: Optional[int] = None) -> Dict[str, Any]:
+    """Run the suite, print a report and return the results"""
+    results = []
+    print(f"{'parser':<10} {'size':<7} {'stage':<10} {'runs':>5} {'min ms':>10} {'p50 ms':>10} "
+          f"{'p90 ms':>10} {'p99 ms':>10} {'peak KiB':>10}")
+    for size in sizes:
+        entities, warmup, runs = SIZES[size]
+        text = generate_synthetic_dsl(0, beneficiaries=entities, sources=entities, tiers=entities, goals=entities)
+        if repeat is not None:
+            runs = repeat
+        for parser_name in parsers:
+            parse, transform = _stages(parser_name)
+            data = parse(text)
+            config = transform(data)
+            for stage, action in (
+                ('parse', lambda: parse(text)),
+                ('transform', lambda: transform(data)),
+                ('validate', lambda: FundingModelValidator.validate_configuration(config)),
+                ('export', lambda: _export(config)),
+            ):
+                stats = measure(action, warmup, runs)
+                results.append({'parser': parser_name, 'size': size, 'stage': stage, 'entities': 4 * entities,
+                                'bytes': len(text.encode('utf-8')), 'warmup': warmup, 'runs': runs, **stats})
+                print(f"{parser_name:<10} {size:<7} {stage:<10} {runs:>5} {stats['min'] * 1e3:>10.3f} "
+                      f"{stats['p50'] * 1e3:>10.3f} {stats['p90'] * 1e3:>10.3f} {stats['p99'] * 1e3:>10.3f} "
+                      f"{stats['peak_memory_bytes'] / 1024:>10.1f}")
+
+    return {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float,
+            metric: str = 'p50') -> List[str]:
+    """
+    Regressions of results against a baseline, as report lines
+
+    A measurement regresses when its `metric` time (min, mean or a
+    percentile) or its peak memory exceeds the baseline's by more than
+    `tolerance` (0.25 = 25%) and by more than the noise floor
+    (NOISE_FLOOR_SECONDS, NOISE_FLOOR_BYTES). Measurements missing from
+    either side are skipped.
+    """
+    if baseline.get('version') != RESULTS_VERSION:
+        raise ValueError(f"Unsupported baseline version: {baseline.get('version')} (expected {RESULTS_VERSION})")
+    previous = {(r['parser'], r['size'], r['stage']): r for r in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        key = (result['parser'], result['size'], result['stage'])
+        if key not in previous:
+            continue
+        before = previous[key]
+        if (result[metric] > before[metric] * (1 + tolerance)
+                and result[metric] - before[metric] > NOISE_FLOOR_SECONDS):
+            regressions.append(f"{' '.join(key)}: {metric} {before[metric] * 1e3:.3f} ms -> "
+                               f"{result[metric] * 1e3:.3f} ms ({result[metric] / before[metric] - 1:+.0%})")
+        if (result['peak_memory_bytes'] > before['peak_memory_bytes'] * (1 + tolerance)
+                and result['peak_memory_bytes'] - before['peak_memory_bytes'] > NOISE_FLOOR_BYTES):
+            regressions.append(f"{' '.join(key)}: peak memory {before['peak_memory_bytes']} -> "
+                               f"{result['peak_memory_bytes']} bytes "
+                               f"({result['peak_memory_bytes'] / before['peak_memory_bytes'] - 1:+.0%})")
+    return regressions
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark parsing, transformation, validation and export")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=DEFAULT_SIZES,
+                        help='Document sizes (entities per block: ' +
+                             ', '.join(f"{name}={spec[0]}" for name, spec in SIZES.items()) + ')')
+    parser.add_argument('--parsers', nargs='+', choices=PARSERS, default=PARSERS, help='Parsers to benchmark')
+    parser.add_argument('--repeat', type=int, default=None, help='Timed runs per measurement (default: per size)')
+    parser.add_argument('--json', metavar='FILE', help='Write the results as JSON')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare with results stored by --json')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed time and peak memory growth over the baseline (default: 0.25)')
+    parser.add_argument('--metric', choices=['min', 'mean'] + [f"p{q}" for q in PERCENTILES], default='p50',
+                        help='Timing compared with the baseline (default: p50)')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.parsers, args.repeat)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.metric)
+        if regressions:
+            print(f"\nREGRESSION: {len(regressions)} measurement(s) worse than {args.baseline} "
+                  f"by more than {args.tolerance:.0%}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
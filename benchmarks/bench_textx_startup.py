@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+textX startup benchmark - what a short-lived run pays before its first parse.
+
+Reports, in a fresh interpreter:
+  - import time of the textX parser module
+  - first FundingDSLTextXParser() (grammar compiled, cold cache)
+  - further FundingDSLTextXParser() instances (metamodel cache hit)
+  - parse_funding_dsl_text_textx() per call, before (grammar compiled on
+    every call) and after (cached metamodel)
+
+Usage:
+    python -m benchmarks.bench_textx_startup
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+_PROBE = r'''
+import json, time
+from pathlib import Path
+
+start = time.perf_counter()
+from textx import metamodel_from_file
+import textual_textx.funding_dsl_textx_parser as textx_parser
+import_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+textx_parser.FundingDSLTextXParser()
+cold_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+for _ in range(REPEAT):
+    textx_parser.FundingDSLTextXParser()
+warm_seconds = (time.perf_counter() - start) / REPEAT
+
+text = Path("textual_textx/example_funding_clean.dsl").read_text(encoding="utf-8")
+
+start = time.perf_counter()
+for _ in range(REPEAT):
+    parser = textx_parser.FundingDSLTextXParser()
+    parser.metamodel = metamodel_from_file(str(textx_parser.DEFAULT_GRAMMAR_FILE))
+    parser.parse_text(text)
+uncached_call_seconds = (time.perf_counter() - start) / REPEAT
+
+start = time.perf_counter()
+for _ in range(REPEAT):
+    textx_parser.parse_funding_dsl_text_textx(text)
+cached_call_seconds = (time.perf_counter() - start) / REPEAT
+
+print(json.dumps({
+    "import": import_seconds,
+    "first_parser": cold_seconds,
+    "cached_parser": warm_seconds,
+    "call_uncached": uncached_call_seconds,
+    "call_cached": cached_call_seconds,
+}))
+'''
+
+
+def measure(repeat: int = 20) -> dict:
+    """Run the probe in a fresh interpreter and return its timings in seconds"""
+    result = subprocess.run(
+        [sys.executable, '-c', _PROBE.replace('REPEAT', str(repeat))],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    """Main benchmark function"""
+    timings = measure()
+
+    print("textX startup timings (fresh interpreter)")
+    print("-" * 50)
+    print(f"Import textX parser module:           {timings['import'] * 1000:8.2f} ms")
+    print(f"First parser (grammar compiled):      {timings['first_parser'] * 1000:8.2f} ms")
+    print(f"Further parsers (cached metamodel):   {timings['cached_parser'] * 1000:8.2f} ms")
+    print()
+    print("parse_funding_dsl_text_textx() per call")
+    print(f"  before (grammar compiled per call): {timings['call_uncached'] * 1000:8.2f} ms")
+    print(f"  after (cached metamodel):           {timings['call_cached'] * 1000:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Batch validation benchmark - validate_many vs. validating configurations one by one.
+
+Builds N configurations (3 sources, 4 tiers and 2 goals each, about a
+tenth of them invalid) and times FundingModelValidator.validate_configuration
+in a loop against validate_many, in-process and on a process pool.
+
+Usage:
+    python -m benchmarks.bench_validate_many
+    python -m benchmarks.bench_validate_many --configs 10000 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+from metamodel.batch_validation import validate_many
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingSource, FundingTier, FundingGoal, FundingAmount,
+    FundingPlatform, Beneficiary, FundingModelValidator
+)
+
+
+PLATFORMS = list(FundingPlatform)
+
+
+def build_configurations(count: int) -> List[FundingConfiguration]:
+    """Build configurations where every tenth one has a few errors"""
+    configs = []
+    for i in range(count):
+        broken = i % 10 == 0
+        config = FundingConfiguration(project_name=f"project-{i}")
+        config.add_beneficiary(Beneficiary(f"maintainer-{i}"))
+        for j in range(3):
+            platform = PLATFORMS[(i + j) % len(PLATFORMS)]
+            if platform == FundingPlatform.TIDELIFT:
+                username = f"cargo/pkg-{i}" if broken else f"npm/pkg-{i}"
+            elif platform == FundingPlatform.THANKS_DEV:
+                username = f"user{i}" if broken else f"u/gh/user{i}"
+            else:
+                username = f"user{i}"
+            custom_url = None if broken or platform != FundingPlatform.CUSTOM else "https://example.com"
+            config.add_funding_source(FundingSource(platform, username, custom_url=custom_url))
+        for j in range(4):
+            config.add_tier(FundingTier("Tier 0" if broken else f"Tier {j}", FundingAmount(5.0 * (j + 1))))
+        for j in range(2):
+            config.add_goal(FundingGoal(f"Goal {j}", FundingAmount(1000.0)))
+        configs.append(config)
+    return configs
+
+
+def timed(label: str, action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed * 1000:>10.2f} ms")
+    return elapsed
+
+
+def run(count: int, workers: int) -> None:
+    """Run the benchmark and print a report"""
+    configs = build_configurations(count)
+    validate = FundingModelValidator.validate_configuration
+
+    print(f"{count} configurations:")
+    timed("validate_configuration x N", lambda: [validate(c) for c in configs])
+    timed("validate_many, 1 worker", lambda: validate_many(configs))
+    if workers > 1:
+        timed(f"validate_many, {workers} workers", lambda: validate_many(configs, workers=workers))
+    table = validate_many(configs)
+    print(f"\n{len(table)} errors in {len(table.invalid_configs())} configurations")
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark batch validation")
+    parser.add_argument('--configs', type=int, default=50_000, help='Number of configurations')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker processes')
+    args = parser.parse_args()
+
+    run(args.configs, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Validation benchmark - full vs. incremental revalidation of a large configuration.
+
+Builds one configuration with N sources (spread over every platform) and
+N/10 tiers and goals, then times FundingModelValidator.validate_configuration
+against an IncrementalValidator rerun after no edit and after editing (and
+touching) a single source, the way an editor revalidates after each change.
+
+Usage:
+    python -m benchmarks.bench_validation
+    python -m benchmarks.bench_validation --sources 100000
+"""
+
+import argparse
+import gc
+import sys
+import time
+from typing import Callable
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingSource, FundingTier, FundingGoal, FundingAmount,
+    FundingPlatform, Beneficiary, FundingModelValidator, IncrementalValidator
+)
+
+
+USERNAMES = {
+    FundingPlatform.TIDELIFT: "npm/package-{}",
+    FundingPlatform.THANKS_DEV: "u/gh/user{}",
+}
+
+
+def build_configuration(sources: int) -> FundingConfiguration:
+    """Build a valid configuration with `sources` sources and sources/10 tiers and goals"""
+    platforms = list(FundingPlatform)
+    config = FundingConfiguration(project_name="bench")
+    config.add_beneficiary(Beneficiary("Maintainer"))
+    for i in range(sources):
+        platform = platforms[i % len(platforms)]
+        config.add_funding_source(FundingSource(
+            platform, USERNAMES.get(platform, "user{}").format(i),
+            custom_url="https://example.com" if platform == FundingPlatform.CUSTOM else None
+        ))
+    for i in range(sources // 10):
+        config.add_tier(FundingTier(f"Tier {i}", FundingAmount(5.0)))
+        config.add_goal(FundingGoal(f"Goal {i}", FundingAmount(100.0)))
+    return config
+
+
+def best_time(action: Callable[[], object], repeat: int) -> float:
+    """Best wall-clock time of `repeat` runs with the garbage collector paused"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            action()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def run(sources: int, repeat: int) -> None:
+    """Run the benchmark and print a report"""
+    config = build_configuration(sources)
+    incremental = IncrementalValidator(config)
+    incremental.validate()
+    edited = config.funding_sources[len(config.funding_sources) // 2]
+
+    def edit_one_source():
+        edited.username += "x"
+        incremental.touch(edited)
+        incremental.validate()
+
+    cases = [
+        ("full validate_configuration", lambda: FundingModelValidator.validate_configuration(config)),
+        ("incremental, no edits", incremental.validate),
+        ("incremental, 1 source edited", edit_one_source),
+    ]
+
+    print(f"{sources} sources, {len(config.tiers)} tiers, {len(config.goals)} goals")
+    print(f"{'method':<30} {'ms':>10}")
+    for label, action in cases:
+        print(f"{label:<30} {best_time(action, repeat) * 1000:>10.2f}")
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Benchmark full vs. incremental validation")
+    parser.add_argument('--sources', type=int, default=50_000, help='Number of funding sources')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per method (best is reported)')
+    args = parser.parse_args()
+
+    run(args.sources, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
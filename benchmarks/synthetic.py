@@ -0,0 +1,249 @@
+"""
+Synthetic Funding DSL documents for scaling benchmarks.
+
+generate_funding_dsl() builds the fixed-shape document the parser scaling
+benchmarks were written against. write_synthetic_dsl() streams seeded,
+randomized documents that use every element of the DSL - all funding
+platforms, config blocks, benefits lists and goals with deadlines - with
+anywhere from 1 to 1M entities per block, and write_corpus() writes N of
+them to a directory. The same seed always produces the same bytes.
+
+Usage:
+    python -m benchmarks.synthetic corpus/ --files 1000
+    python -m benchmarks.synthetic corpus/ --files 10 --tiers 1000000 --seed 7
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+from typing import IO, List, Optional
+
+
+PLATFORMS = [
+    'github_sponsors', 'patreon', 'ko_fi', 'open_collective', 'buy_me_a_coffee',
+    'liberapay', 'paypal', 'tidelift', 'issuehunt', 'community_bridge', 'polar',
+    'thanks_dev', 'custom'
+]
+
+
+def generate_funding_dsl(sources: int = 0, tiers: int = 0, beneficiaries: int = 1, goals: int = 0) -> str:
+    """Generate a syntactically valid DSL document with the given entity counts"""
+    lines: List[str] = []
+    lines.append('funding "SyntheticProject" {')
+    lines.append('    description "Synthetic configuration for benchmarks"')
+    lines.append('    currency USD')
+    lines.append('    min_amount 1.00')
+    lines.append('    max_amount 1000.00')
+    
+    lines.append('    beneficiaries {')
+    for i in range(beneficiaries):
+        lines.append(f'        beneficiary "Maintainer {i}" {{')
+        lines.append(f'            github "maintainer{i}"')
+        lines.append(f'            website "https://maintainer{i}.dev"')
+        lines.append('        }')
+    lines.append('    }')
+    
+    lines.append('    sources {')
+    for i in range(sources):
+        platform = PLATFORMS[i % len(PLATFORMS)]
+        if platform == 'tidelift':
+            username = f'npm/package-{i}'
+        elif platform == 'thanks_dev':
+            username = f'u/gh/user{i}'
+        else:
+            username = f'user{i}'
+        lines.append(f'        {platform} "{username}" {{')
+        if platform == 'custom':
+            lines.append(f'            url "https://example.com/donate/{i}"')
+        lines.append('            type recurring')
+        lines.append('            active true')
+        lines.append('        }')
+    lines.append('    }')
+    
+    lines.append('    tiers {')
+    for i in range(tiers):
+        lines.append(f'        tier "Tier {i}" {{')
+        lines.append(f'            amount {5 + i % 100}.00 USD')
+        lines.append(f'            description "Sponsorship tier {i}"')
+        lines.append('            benefits ["Thank you mention", "Early access"]')
+        lines.append('        }')
+    lines.append('    }')
+    
+    lines.append('    goals {')
+    for i in range(goals):
+        lines.append(f'        goal "Goal {i}" {{')
+        lines.append(f'            target {100 + i}.00 USD')
+        lines.append(f'            current {i % 100}.00 USD')
+        lines.append('            deadline "2030-01-01"')
+        lines.append('        }')
+    lines.append('    }')
+    
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+CURRENCIES = ['USD', 'EUR', 'GBP', 'CAD', 'AUD']
+FUNDING_TYPES = ['one_time', 'recurring', 'both']
+TIDELIFT_ECOSYSTEMS = ['npm', 'pypi', 'rubygems', 'maven', 'packagist', 'nuget']
+WORDS = [
+    'fast', 'open', 'tiny', 'secure', 'async', 'graph', 'data', 'cloud', 'web', 'core',
+    'parser', 'engine', 'kit', 'lab', 'forge', 'stack', 'flow', 'sync', 'lint', 'docs'
+]
+
+# Default entity counts per block for write_synthetic_dsl and write_corpus
+DEFAULT_SIZES = {'beneficiaries': 2, 'sources': 13, 'tiers': 4, 'goals': 2}
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _amount(rng: random.Random, low: int, high: int) -> str:
+    """A two-decimal amount literal between low and high"""
+    cents = rng.randint(low * 100, high * 100)
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def _beneficiary(rng: random.Random, i: int) -> str:
+    handle = f"{rng.choice(WORDS)}{i}"
+    lines = [f'        beneficiary "Maintainer {i}" {{\n']
+    if rng.random() < 0.5:
+        lines.append(f'            email "{handle}@example.com"\n')
+    lines.append(f'            github "{handle}"\n')
+    if rng.random() < 0.5:
+        lines.append(f'            website "https://{handle}.dev"\n')
+    if rng.random() < 0.5:
+        lines.append(f'            description "{_phrase(rng, 4)} maintainer"\n')
+    lines.append('        }\n')
+    return ''.join(lines)
+
+
+def _source(rng: random.Random, i: int) -> str:
+    platform = PLATFORMS[i % len(PLATFORMS)]  # Round-robin, so 13 sources cover every platform
+    name = f"{rng.choice(WORDS)}-{i}"
+    if platform == 'tidelift':
+        username = f"{rng.choice(TIDELIFT_ECOSYSTEMS)}/{name}"
+    elif platform == 'thanks_dev':
+        username = f"u/gh/{name}"
+    else:
+        username = name
+    lines = [f'        {platform} "{username}" {{\n']
+    if platform == 'custom':
+        lines.append(f'            url "https://{name}.example.com/donate"\n')
+    lines.append(f'            type {rng.choice(FUNDING_TYPES)}\n')
+    lines.append(f'            active {"true" if rng.random() < 0.9 else "false"}\n')
+    if rng.random() < 0.3:
+        lines.append('            config {\n')
+        for k in range(rng.randint(1, 3)):
+            lines.append(f'                "key_{k}" "{rng.choice(WORDS)}-{rng.randint(1, 99999)}"\n')
+        lines.append('            }\n')
+    lines.append('        }\n')
+    return ''.join(lines)
+
+
+def _tier(rng: random.Random, i: int, currency: str) -> str:
+    lines = [f'        tier "Tier {i}" {{\n',
+             f'            amount {_amount(rng, 1, 1000)} {currency}\n',
+             f'            description "{_phrase(rng, 5)}"\n']
+    if rng.random() < 0.4:
+        lines.append(f'            max_sponsors {rng.randint(1, 500)}\n')
+    benefits = rng.randint(0, 5)
+    if benefits:
+        items = ',\n                '.join(f'"{_phrase(rng, 3)}"' for _ in range(benefits))
+        lines.append(f'            benefits [\n                {items}\n            ]\n')
+    lines.append('        }\n')
+    return ''.join(lines)
+
+
+def _goal(rng: random.Random, i: int, currency: str) -> str:
+    target = rng.randint(100, 100_000)
+    return (f'        goal "Goal {i}" {{\n'
+            f'            target {target}.00 {currency}\n'
+            f'            current {_amount(rng, 0, target)} {currency}\n'
+            f'            deadline "{rng.randint(2025, 2035)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"\n'
+            f'            description "{_phrase(rng, 6)}"\n'
+            '        }\n')
+
+
+def write_synthetic_dsl(fp: IO[str], seed: int = 0, beneficiaries: int = 2, sources: int = 13,
+                        tiers: int = 4, goals: int = 2) -> None:
+    """
+    Stream a seeded, randomized DSL document to a text file object
+
+    The document parses with every parser engine, passes FundingModelValidator
+    and, with 13 or more sources, holds a source for every FundingPlatform.
+    Entities are written one at a time, so blocks of 1M entities stream in
+    constant memory.
+    """
+    rng = random.Random(seed)
+    currency = rng.choice(CURRENCIES)
+    write = fp.write
+    write(f'funding "{rng.choice(WORDS)}-{rng.choice(WORDS)}-{seed}" {{\n'
+          f'    description "{_phrase(rng, 8)}"\n'
+          f'    currency {currency}\n'
+          f'    min_amount {_amount(rng, 1, 10)}\n'
+          f'    max_amount {_amount(rng, 1000, 10000)}\n')
+    for block, count, entity in (
+        ('beneficiaries', beneficiaries, lambda i: _beneficiary(rng, i)),
+        ('sources', sources, lambda i: _source(rng, i)),
+        ('tiers', tiers, lambda i: _tier(rng, i, currency)),
+        ('goals', goals, lambda i: _goal(rng, i, currency)),
+    ):
+        if count:
+            write(f'\n    {block} {{\n')
+            for i in range(count):
+                write(entity(i))
+            write('    }\n')
+    write('}\n')
+
+
+def generate_synthetic_dsl(seed: int = 0, **sizes: int) -> str:
+    """Return write_synthetic_dsl's document as a string"""
+    output = io.StringIO()
+    write_synthetic_dsl(output, seed, **sizes)
+    return output.getvalue()
+
+
+def write_corpus(directory: str, files: int, seed: int = 0, per_directory: int = 1000,
+                 sizes: Optional[dict] = None) -> List[str]:
+    """
+    Write a corpus of `files` seeded documents and return their paths
+
+    File i is written with seed `seed * 1_000_003 + i`, so any one file can be
+    regenerated on its own, and files are spread over subdirectories of
+    `per_directory` files each.
+    """
+    sizes = dict(DEFAULT_SIZES, **(sizes or {}))
+    paths = []
+    for i in range(files):
+        subdirectory = os.path.join(directory, f"{i // per_directory:04d}")
+        if i % per_directory == 0:
+            os.makedirs(subdirectory, exist_ok=True)
+        path = os.path.join(subdirectory, f"project-{i:07d}.dsl")
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            write_synthetic_dsl(f, seed * 1_000_003 + i, **sizes)
+        paths.append(path)
+    return paths
+
+
+def main():
+    """Write a synthetic corpus from the command line"""
+    parser = argparse.ArgumentParser(description="Write a seeded synthetic funding DSL corpus")
+    parser.add_argument('directory', help='Output directory')
+    parser.add_argument('--files', type=int, default=1000, help='Number of files')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed')
+    for block, count in DEFAULT_SIZES.items():
+        parser.add_argument(f'--{block}', type=int, default=count, help=f'Entities per {block} block (default: {count})')
+    args = parser.parse_args()
+
+    sizes = {block: getattr(args, block) for block in DEFAULT_SIZES}
+    paths = write_corpus(args.directory, args.files, args.seed, sizes=sizes)
+    size = sum(os.path.getsize(path) for path in paths)
+    print(f"Wrote {len(paths)} file(s), {size / 1e6:.1f} MB to {args.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
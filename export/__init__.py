@@ -3,11 +3,36 @@ Export Functionality - Generate funding.yml and other output formats.
 
 This module contains export functionality to generate GitHub funding.yml
 files and other output formats from DSL configurations.
+
+The names below are imported on first use, so that export.client (the thin
+daemon client) starts without loading the parsers, PyYAML or textX.
 """
 
-from .funding_exporter import FundingExporter, export_funding_config
+import importlib
+
+_EXPORTS = {
+    'FundingExporter': '.funding_exporter',
+    'export_funding_config': '.funding_exporter',
+    'write_funding_config': '.funding_exporter',
+    'export_funding_config_async': '.async_exporter',
+    'export_many_async': '.async_exporter',
+    'import_funding_yml': '.funding_importer',
+    'import_funding_yml_text': '.funding_importer',
+    'import_many': '.funding_importer',
+    'write_jsonl': '.jsonl',
+    'iter_jsonl': '.jsonl'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    'FundingExporter',
-    'export_funding_config'
-] 
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
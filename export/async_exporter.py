@@ -0,0 +1,103 @@
+"""
+Async export - render and write funding configurations from asyncio code.
+
+Rendering runs on the event loop's default thread pool and files are
+written there too, so neither blocks the loop. export_many_async mirrors
+`funding-export` over many files: each file is parsed once with an
+AsyncFundingParser (bounded, see textual.async_parser) and written in every
+requested format.
+"""
+
+import asyncio
+import io
+import os
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from metamodel.funding_metamodel import FundingConfiguration
+from textual.async_parser import AsyncFundingParser
+from textual.batch_parser import expand_paths
+from .cli import FORMAT_EXTENSIONS, _same_path
+from .funding_exporter import write_funding_config
+
+
+def _render(config: FundingConfiguration, format: str) -> str:
+    output = io.StringIO()
+    write_funding_config(config, format, output)
+    return output.getvalue()
+
+
+def _write_file(path: str, content: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+
+
+async def export_funding_config_async(config: FundingConfiguration, format: str,
+                                      output_file: Optional[str] = None) -> str:
+    """
+    Async counterpart of export_funding_config
+
+    Args:
+        config: The funding configuration to export
+        format: Output format ('github_yml', 'json', 'markdown', 'csv', 'dsl')
+        output_file: Optional file path to write output to (written quietly)
+
+    Returns:
+        The exported content as a string
+    """
+    loop = asyncio.get_running_loop()
+    content = await loop.run_in_executor(None, _render, config, format)
+    if output_file:
+        await loop.run_in_executor(None, _write_file, output_file, content)
+    return content
+
+
+async def export_many_async(inputs: Iterable[Union[str, Path]], formats: List[str], output_dir: str,
+                            parser: Optional[AsyncFundingParser] = None
+                            ) -> AsyncIterator[Tuple[str, Union[Dict[str, str], Exception]]]:
+    """
+    Parse many DSL files once each and write every format, yielding as each file finishes
+
+    Outputs mirror the input tree under output_dir, one file per format.
+    Yields (path, {format: output path}) or (path, Exception); a file whose
+    output would overwrite it yields a ValueError and none of its outputs are written.
+
+    Args:
+        inputs: Files, directories or glob patterns
+        formats: Output formats
+        output_dir: Directory the outputs are written to
+        parser: Parser to use (default: a new AsyncFundingParser, closed afterwards)
+    """
+    loop = asyncio.get_running_loop()
+    files = await loop.run_in_executor(None, expand_paths, list(inputs))
+    if not files:
+        return
+    base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files])
+    owned = parser is None
+    parser = parser or AsyncFundingParser()
+    try:
+        async for path, result in parser.parse_many(files):
+            if isinstance(result, Exception):
+                yield path, result
+                continue
+            stem = os.path.splitext(os.path.relpath(path, base_dir))[0]
+            outputs = {fmt: os.path.join(output_dir, stem + FORMAT_EXTENSIONS[fmt]) for fmt in formats}
+            overwritten = [fmt for fmt, target in outputs.items() if _same_path(target, path)]
+            if overwritten:
+                yield path, ValueError(
+                    f"Refusing to overwrite the source with its {overwritten[0]} output: {outputs[overwritten[0]]}"
+                )
+                continue
+            try:
+                await asyncio.gather(*(export_funding_config_async(result, fmt, target)
+                                       for fmt, target in outputs.items()))
+            except Exception as e:
+                yield path, e
+                continue
+            yield path, outputs
+    finally:
+        if owned:
+            await parser.aclose()
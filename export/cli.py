@@ -4,34 +4,340 @@ Command-line interface for funding DSL export functionality.
 """
 
 import argparse
+import glob
+import os
 import sys
+import time
+from functools import partial
 from pathlib import Path
-from textual.funding_dsl_parser import FundingDSLParser
-from .funding_exporter import export_funding_config
+from metamodel.instrumentation import JSONLinesSink, PrometheusTextSink, StatsSink, instrumented
+from textual.batch_parser import BACKENDS, create_parser, expand_paths, parse_many, run_many
+from .funding_exporter import export_funding_config, write_funding_config
+from .funding_importer import LOADERS, import_many
+from .jsonl import write_jsonl
 
 
-def main():
+FORMATS = ['github_yml', 'json', 'markdown', 'csv', 'dsl', 'mermaid']
+
+# File suffix per format when exporting into an output directory
+FORMAT_EXTENSIONS = {
+    'github_yml': '.yml',
+    'json': '.json',
+    'markdown': '.md',
+    'csv': '.csv',
+    'dsl': '.dsl',
+    'mermaid': '.mmd'
+}
+
+
+def parse_command(argv):
+    """Parse many DSL files in parallel and report one line per file"""
+    parser = argparse.ArgumentParser(
+        description="Parse many funding DSL files in parallel",
+        prog="funding-export parse"
+    )
+    
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        help='Input DSL files, directories (searched recursively) or glob patterns'
+    )
+    
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default='regex',
+        help='Parser backend (default: regex)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory of a parse cache shared by all workers'
+    )
+    
+    parser.add_argument(
+        '--jsonl',
+        metavar='FILE',
+        help='Append every parsed configuration to FILE as one JSON Lines record'
+    )
+    
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only report failures and the summary'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    jsonl_file = open(args.jsonl, 'a', encoding='utf-8') if args.jsonl else None
+    start = time.perf_counter()
+    parsed = 0
+    failed = 0
+    try:
+        for path, result in parse_many(args.paths, workers=args.workers, backend=args.backend, cache_dir=args.cache_dir):
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"❌ {path}: {result}", file=sys.stderr)
+                continue
+            parsed += 1
+            if jsonl_file:
+                write_jsonl([result], jsonl_file)
+            if not args.quiet:
+                print(f"✅ {path}: {result.project_name} "
+                      f"({len(result.funding_sources)} sources, {len(result.tiers)} tiers, {len(result.goals)} goals)")
+    finally:
+        if jsonl_file:
+            jsonl_file.close()
+    elapsed = time.perf_counter() - start
+    
+    print(f"Parsed {parsed} file(s), {failed} failed in {elapsed:.2f}s")
+    return 1 if failed else 0
+
+
+def import_command(argv):
+    """Import many FUNDING.yml files in parallel and report throughput"""
+    parser = argparse.ArgumentParser(
+        description="Import GitHub FUNDING.yml files in parallel",
+        prog="funding-export import"
+    )
+    
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        help='FUNDING.yml files, directories (searched recursively) or glob patterns'
+    )
+    
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--loader',
+        choices=LOADERS,
+        default='auto',
+        help='YAML loader (default: auto - the FUNDING.yml subset loader with a PyYAML fallback)'
+    )
+    
+    parser.add_argument(
+        '--pattern',
+        default='FUNDING.yml',
+        help='File name pattern searched for in directories (default: FUNDING.yml)'
+    )
+    
+    parser.add_argument(
+        '--jsonl',
+        metavar='FILE',
+        help='Append every imported configuration to FILE as one JSON Lines record'
+    )
+    
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only report failures and the summary'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    jsonl_file = open(args.jsonl, 'a', encoding='utf-8') if args.jsonl else None
+    start = time.perf_counter()
+    totals = {'read': 0.0, 'load': 0.0, 'build': 0.0}
+    imported = 0
+    failed = 0
+    size = 0
+    try:
+        for path, result in import_many(args.paths, workers=args.workers, loader=args.loader, pattern=args.pattern):
+            if isinstance(result, Exception):
+                failed += 1
+                print(f"❌ {path}: {result}", file=sys.stderr)
+                continue
+            imported += 1
+            size += result.size
+            for phase, seconds in result.timings.items():
+                totals[phase] += seconds
+            if jsonl_file:
+                write_jsonl([result.config], jsonl_file)
+            if not args.quiet:
+                print(f"✅ {path}: {result.config.project_name} ({len(result.config.funding_sources)} sources)")
+    finally:
+        if jsonl_file:
+            jsonl_file.close()
+    elapsed = time.perf_counter() - start
+    
+    print(f"Imported {imported} file(s), {failed} failed in {elapsed:.2f}s "
+          f"({(imported + failed) / elapsed if elapsed else 0:.1f} files/s, "
+          f"{size / elapsed / 1e6 if elapsed else 0:.2f} MB/s)")
+    for phase, seconds in totals.items():
+        average = seconds / imported * 1e6 if imported else 0.0
+        print(f"  {phase:<6} {seconds:8.3f}s total, {average:8.1f} us/file")
+    return 1 if failed else 0
+
+
+def _same_path(first, second):
+    """Whether two paths resolve to the same file"""
+    return os.path.realpath(first) == os.path.realpath(second)
+
+
+def _export_task(parser, path, formats, output_dir, base_dir, validate):
+    """Parse one file and write every requested format (runs in a worker process)"""
+    stem = os.path.splitext(os.path.relpath(path, base_dir))[0]
+    targets = {fmt: os.path.join(output_dir, stem + FORMAT_EXTENSIONS[fmt]) for fmt in formats}
+    for fmt, target in targets.items():
+        if _same_path(target, path):
+            raise ValueError(f"Refusing to overwrite the source with its {fmt} output: {target}")
+    
+    start = time.perf_counter()
+    config = parser.parse_file(path)
+    timings = {'parse': time.perf_counter() - start}
+    
+    if validate:
+        from metamodel.funding_metamodel import FundingModelValidator
+        errors = FundingModelValidator.validate_configuration(config)
+        if errors:
+            raise ValueError(f"Validation failed: {'; '.join(errors)}")
+    
+    outputs = []
+    for fmt, target in targets.items():
+        start = time.perf_counter()
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8', newline='') as f:
+            write_funding_config(config, fmt, f)
+        timings[fmt] = time.perf_counter() - start
+        outputs.append(target)
+    
+    return {'project_name': config.project_name, 'outputs': outputs, 'timings': timings}
+
+
+def export_many(inputs, formats, args):
+    """Export many inputs to many formats, parsing each file once"""
+    if not args.output:
+        print("Error: --output DIR is required when exporting several files or formats", file=sys.stderr)
+        return 1
+    
+    files = expand_paths(inputs)
+    if not files:
+        print("Error: No input files found", file=sys.stderr)
+        return 1
+    
+    base_dir = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files])
+    task = partial(_export_task, formats=formats, output_dir=args.output, base_dir=base_dir, validate=args.validate)
+    
+    start = time.perf_counter()
+    totals = dict.fromkeys(['parse'] + formats, 0.0)
+    exported = 0
+    failed = 0
+    written = 0
+    for path, result in run_many(files, task, workers=args.workers, backend=args.backend):
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"❌ {path}: {result}", file=sys.stderr)
+            continue
+        exported += 1
+        written += len(result['outputs'])
+        for phase, seconds in result['timings'].items():
+            totals[phase] += seconds
+        if args.verbose:
+            print(f"✅ {path}: {result['project_name']} -> {', '.join(result['outputs'])}")
+    elapsed = time.perf_counter() - start
+    
+    print(f"Exported {exported} file(s) to {written} output(s), {failed} failed in {elapsed:.2f}s "
+          f"({(exported + failed) / elapsed if elapsed else 0:.1f} files/s)")
+    for phase, seconds in totals.items():
+        average = seconds / exported * 1000 if exported else 0.0
+        print(f"  {phase:<11} {seconds:8.3f}s total, {average:7.2f} ms/file")
+    
+    return 1 if failed else 0
+
+
+def watch_command(inputs, formats, args):
+    """Regenerate the outputs of changed files until interrupted"""
+    if not args.output:
+        print("Error: --watch requires --output DIR", file=sys.stderr)
+        return 1
+    from .watch import ExportWatcher
+    
+    watcher = ExportWatcher(inputs, formats, args.output, backend=args.backend, validate=args.validate)
+    
+    def report(result):
+        for path, error in result.failed:
+            print(f"❌ {path}: {error}", file=sys.stderr)
+        if args.verbose:
+            for target in result.written:
+                print(f"✅ {target}")
+            for target in result.removed:
+                print(f"🗑  {target}")
+        if result:
+            print(f"{time.strftime('%H:%M:%S')} parsed {len(result.parsed)} file(s): {len(result.written)} output(s) "
+                  f"written, {result.unchanged} unchanged, {len(result.removed)} removed, {len(result.failed)} failed",
+                  flush=True)
+    
+    print(f"Watching {', '.join(inputs)} -> {args.output} ({', '.join(formats)}); Ctrl+C to stop", flush=True)
+    try:
+        watcher.watch(args.interval, report)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def main(argv=None):
     """Main CLI function"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'parse':
+        return parse_command(argv[1:])
+    if argv and argv[0] == 'import':
+        return import_command(argv[1:])
+    if argv and argv[0] == 'daemon':
+        from .daemon import daemon_command
+        return daemon_command(argv[1:])
+    
     parser = argparse.ArgumentParser(
         description="Export funding DSL configurations to various formats",
-        prog="funding-export"
+        prog="funding-export",
+        epilog="Use 'funding-export parse PATHS...' to parse many files in parallel, "
+               "'funding-export import PATHS...' to import FUNDING.yml files and "
+               "'funding-export daemon' to serve requests with warm parsers (see export.client)."
     )
     
     parser.add_argument(
-        'input_file',
-        help='Input DSL file (.dsl)'
+        'inputs',
+        nargs='+',
+        metavar='input',
+        help="Input DSL files, directories, glob patterns, or '-' to read a newline-separated list from stdin"
     )
     
     parser.add_argument(
         '-f', '--format',
-        choices=['github_yml', 'json', 'markdown', 'csv'],
-        default='github_yml',
-        help='Output format (default: github_yml)'
+        choices=FORMATS,
+        action='append',
+        help='Output format, repeatable (default: github_yml)'
     )
     
     parser.add_argument(
         '-o', '--output',
-        help='Output file path (default: stdout)'
+        help='Output file path (default: stdout); an output directory for several inputs or formats'
+    )
+    
+    parser.add_argument(
+        '-j', '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes for several inputs (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default='regex',
+        help='Parser backend (default: regex)'
     )
     
     parser.add_argument(
@@ -46,20 +352,94 @@ def main():
         help='Enable verbose output'
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate the outputs of changed files (requires --output DIR)'
+    )
+    
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='Seconds between checks for changes in --watch mode (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print time spent per phase (parse, build, validate, export) to stderr'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        metavar='FILE',
+        help='Append every phase span to FILE as one JSON Lines record'
+    )
+    
+    parser.add_argument(
+        '--metrics',
+        metavar='FILE',
+        help='Write per-phase totals to FILE in the Prometheus text format'
+    )
+    
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Also measure allocations per phase with tracemalloc (slow)'
+    )
+    
+    args = parser.parse_args(argv)
+    stats = StatsSink() if args.profile else None
+    sinks = [sink for sink in (stats,
+                               JSONLinesSink(args.trace) if args.trace else None,
+                               PrometheusTextSink(args.metrics) if args.metrics else None) if sink]
+    if not sinks and not args.trace_memory:
+        return export_command(args)
+    
+    args.workers = 1  # Spans are recorded in this process only
+    with instrumented(*sinks, trace_memory=args.trace_memory):
+        status = export_command(args)
+    if stats:
+        print(stats.report(), file=sys.stderr)
+    return status
+
+
+def export_command(args):
+    """Export the inputs of parsed main() arguments"""
+    formats = list(dict.fromkeys(args.format or ['github_yml']))
+    
+    if '-' in args.inputs:
+        inputs = [item for item in args.inputs if item != '-']
+        inputs += [line.strip() for line in sys.stdin if line.strip()]
+    else:
+        inputs = args.inputs
+    
+    if args.watch:
+        return watch_command(inputs, formats, args)
+    
+    single_file = len(inputs) == 1 and not Path(inputs[0]).is_dir() and not glob.has_magic(inputs[0])
+    if not (single_file and len(formats) == 1 and not (args.output and Path(args.output).is_dir())):
+        return export_many(inputs, formats, args)
+    
+    args.input_file = inputs[0]
+    args.format = formats[0]
     
     # Check input file exists
     input_path = Path(args.input_file)
     if not input_path.exists():
         print(f"Error: Input file '{args.input_file}' not found", file=sys.stderr)
         return 1
+    if args.output and _same_path(args.output, args.input_file):
+        print(f"Error: Refusing to overwrite the input file '{args.input_file}' with its output", file=sys.stderr)
+        return 1
     
     try:
         # Parse the DSL file
         if args.verbose:
             print(f"Parsing DSL file: {args.input_file}")
         
-        dsl_parser = FundingDSLParser()
+        dsl_parser = create_parser(args.backend)
         config = dsl_parser.parse_file(args.input_file)
         
         if args.verbose:
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Thin client for the funding-export daemon (see export.daemon).
+
+`python -m export.client ARGS...` behaves like `python -m export.cli ARGS...`
+but, when a daemon is listening on the socket, sends the arguments (with the
+working directory and, for '-' inputs, stdin) to it and prints its output,
+so no parser, PyYAML or textX is imported per call. Without a daemon it runs
+the CLI in-process. This module imports only the standard library, and the
+export package loads its modules lazily, so the client starts in a few ms.
+
+The client is a separate entry point: export.cli.main does not forward to
+the daemon, so scripts wanting warm parsers call `python -m export.client`.
+
+Protocol: one JSON object per line in each direction over a Unix domain
+socket. A request holds "op" (ping, run, parse, validate, export or
+shutdown) and the op's fields; the response holds "ok" plus "result", or
+"error" and "type" when the request failed.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+
+def default_socket_path() -> str:
+    """
+    $FUNDING_EXPORT_SOCKET, else funding-export-<uid>.sock in $XDG_RUNTIME_DIR,
+    else daemon.sock in a private funding-export-<uid> directory (mode 0700,
+    created by the daemon) in the temp directory
+    """
+    path = os.environ.get('FUNDING_EXPORT_SOCKET')
+    if path:
+        return path
+    if os.environ.get('XDG_RUNTIME_DIR'):
+        return os.path.join(os.environ['XDG_RUNTIME_DIR'], f"funding-export-{os.getuid()}.sock")
+    return os.path.join(private_directory(), 'daemon.sock')
+
+
+def private_directory() -> str:
+    """The per-user directory holding the socket when there is no runtime directory"""
+    return os.path.join(tempfile.gettempdir(), f"funding-export-{os.getuid()}")
+
+
+def check_owner(path: str) -> None:
+    """Raise PermissionError unless path belongs to this user (a socket another user bound is never used)"""
+    if os.stat(path).st_uid != os.getuid():
+        raise PermissionError(f"{path} belongs to another user")
+
+
+class DaemonError(Exception):
+    """A request the daemon could not serve"""
+
+
+class DaemonClient:
+    """One connection to the daemon; requests on it are answered in order"""
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        self.socket_path = socket_path or default_socket_path()
+        check_owner(self.socket_path)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(self.socket_path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._reader = self._socket.makefile('rb')
+
+    def request(self, op: str, **fields: Any) -> Any:
+        """Send one request and return its result, raising DaemonError when it failed"""
+        message = dict(fields, op=op)
+        self._socket.sendall(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+        line = self._reader.readline()
+        if not line:
+            raise DaemonError("The daemon closed the connection")
+        response = json.loads(line)
+        if not response.get('ok'):
+            raise DaemonError(f"{response.get('type', 'Error')}: {response.get('error')}")
+        return response.get('result')
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def connect(socket_path: Optional[str] = None) -> Optional[DaemonClient]:
+    """A client connected to the daemon, or None when no daemon is listening"""
+    try:
+        return DaemonClient(socket_path)
+    except OSError:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the funding-export CLI through the daemon when one is listening"""
+    argv = sys.argv[1:] if argv is None else argv
+    client = connect()
+    if client is None:
+        from export.cli import main as cli_main
+        return cli_main(argv)
+
+    with client:
+        stdin = sys.stdin.read() if '-' in argv else None
+        result: Dict[str, Any] = client.request('run', argv=argv, cwd=os.getcwd(), stdin=stdin)
+    sys.stdout.write(result['stdout'])
+    sys.stderr.write(result['stderr'])
+    return result['status']
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Long-running funding-export daemon with warm parsers.
+
+`python -m export.cli daemon` listens on a Unix domain socket (see
+export.client for the protocol and the thin client) and keeps everything
+a call to the CLI would otherwise rebuild loaded: the parser modules,
+PyYAML, textX with its compiled metamodel, and one parser per backend and
+thread. Each connection is served on its own thread, so a slow client
+never holds up the others.
+
+Requests:
+    ping                                   -> {"pid": ...}
+    parse     path | text, backend         -> the configuration as configuration_to_dict
+    validate  path | text, backend         -> {"errors": [...]}
+    export    path | text, backend, format, validate, output
+                                           -> {"content": ...}, or {"output": path} once written
+    run       argv, cwd, stdin             -> {"status", "stdout", "stderr"} of the CLI
+    shutdown                               -> {} and the daemon stops
+
+Relative paths are resolved against the request's "cwd" (default: the
+daemon's working directory). `run` executes export.cli.main in-process with
+the working directory, stdin and output redirected, and with --profile or
+--trace installs process-wide instrumentation. So that none of this leaks
+into other requests, a run request runs alone: it waits for the requests in
+progress to finish, and requests arriving meanwhile wait for it. Parse,
+validate and export requests run concurrently with each other.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from metamodel.funding_metamodel import FundingModelValidator
+from metamodel.serialization import configuration_to_dict
+from textual.batch_parser import BACKENDS, create_parser
+from textual_textx.funding_dsl_textx_parser import get_cached_metamodel
+from .cli import main as cli_main
+from .client import DaemonClient, check_owner, default_socket_path, private_directory
+from .funding_exporter import write_funding_config
+
+
+class FundingExportDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serves parse, validate, export and CLI requests over a Unix domain socket"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.cwd = os.getcwd()
+        self.requests_served = 0
+        self._parsers = threading.local()
+        self._gate = _RunGate()
+        self._counter_lock = threading.Lock()
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'ping': lambda request: {'pid': os.getpid(), 'requests_served': self.requests_served},
+            'parse': lambda request: configuration_to_dict(self._configuration(request)),
+            'validate': lambda request: {
+                'errors': FundingModelValidator.validate_configuration(self._configuration(request))
+            },
+            'export': self._export,
+            'run': self._run,
+            'shutdown': self._shutdown,
+        }
+
+        self._claim_socket()
+        previous_umask = os.umask(0o077)  # Only this user may connect
+        try:
+            super().__init__(self.socket_path, _Handler)
+        finally:
+            os.umask(previous_umask)
+        get_cached_metamodel()  # Compile the textX grammar before the first request
+
+    def _claim_socket(self) -> None:
+        """
+        Create the socket's private directory, or remove a stale socket file
+
+        Refuses to start when a daemon answers on the socket, or when the
+        socket or its private directory belongs to another user.
+        """
+        directory = os.path.dirname(self.socket_path)
+        try:
+            if directory == private_directory():
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+                check_owner(directory)
+                os.chmod(directory, 0o700)
+            if not os.path.lexists(self.socket_path):
+                return
+            check_owner(self.socket_path)
+        except PermissionError as e:
+            raise RuntimeError(str(e))
+        try:
+            DaemonClient(self.socket_path, timeout=1).close()
+        except OSError:
+            os.unlink(self.socket_path)
+            return
+        raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+    def handle_request_message(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """The response to one decoded request"""
+        op = request.get('op')
+        handler = self.handlers.get(op)
+        if handler is None:
+            return {'ok': False, 'type': 'ValueError', 'error': f"Unknown op: {op}"}
+        if op in ('ping', 'shutdown'):
+            gate = contextlib.nullcontext()
+        else:
+            gate = self._gate.exclusive() if op == 'run' else self._gate.shared()
+        try:
+            with gate:
+                result = handler(request)
+        except Exception as e:
+            return {'ok': False, 'type': type(e).__name__, 'error': str(e)}
+        with self._counter_lock:
+            self.requests_served += 1
+        return {'ok': True, 'result': result}
+
+    def _parser(self, backend: str):
+        parsers = self._parsers.__dict__
+        if backend not in parsers:
+            if backend not in BACKENDS:
+                raise ValueError(f"Unsupported backend: {backend} (expected one of: {', '.join(BACKENDS)})")
+            parsers[backend] = create_parser(backend)
+        return parsers[backend]
+
+    def _path(self, request: Dict[str, Any], field: str = 'path') -> str:
+        return os.path.join(request.get('cwd') or self.cwd, request[field])
+
+    def _configuration(self, request: Dict[str, Any]):
+        parser = self._parser(request.get('backend', 'regex'))
+        if 'text' in request:
+            return parser.parse_text(request['text'])
+        if 'path' in request:
+            return parser.parse_file(self._path(request))
+        raise ValueError("Request needs a 'path' or a 'text'")
+
+    def _export(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        config = self._configuration(request)
+        if request.get('validate'):
+            errors = FundingModelValidator.validate_configuration(config)
+            if errors:
+                raise ValueError(f"Validation failed: {'; '.join(errors)}")
+        format = request.get('format', 'github_yml')
+        if request.get('output'):
+            output = self._path(request, 'output')
+            with open(output, 'w', encoding='utf-8', newline='') as f:
+                write_funding_config(config, format, f)
+            return {'output': output}
+        content = io.StringIO()
+        write_funding_config(config, format, content)
+        return {'content': content.getvalue()}
+
+    def _run(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        argv = list(request.get('argv', []))
+        if argv and argv[0] == 'daemon':
+            raise ValueError("The daemon command cannot be run through the daemon")
+        if _watches(argv):
+            raise ValueError("--watch runs until interrupted and cannot be run through the daemon")
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd, previous_stdin = os.getcwd(), sys.stdin
+        os.chdir(request.get('cwd') or self.cwd)
+        sys.stdin = io.StringIO(request.get('stdin') or '')
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    status = cli_main(argv)
+                except SystemExit as e:  # argparse errors and --help
+                    status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                    if isinstance(e.code, str):
+                        print(e.code, file=sys.stderr)
+        finally:
+            sys.stdin = previous_stdin
+            os.chdir(previous_cwd)
+        return {'status': status, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+    def _shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # shutdown() waits for serve_forever to return, so it cannot run on a request thread
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {}
+
+
+class _RunGate:
+    """A readers-writer lock: requests share it, run requests hold it alone"""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._waiting = 0  # Run requests waiting; they go before new shared requests
+
+    @contextlib.contextmanager
+    def shared(self):
+        with self._condition:
+            self._condition.wait_for(lambda: not (self._exclusive or self._waiting))
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._shared -= 1
+                self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def exclusive(self):
+        with self._condition:
+            self._waiting += 1
+            self._condition.wait_for(lambda: not (self._exclusive or self._shared))
+            self._waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._exclusive = False
+                self._condition.notify_all()
+
+
+def _watches(argv) -> bool:
+    """Whether CLI arguments ask for --watch (argparse also accepts unambiguous prefixes such as --wat)"""
+    for arg in argv:
+        if arg == '--':
+            return False
+        if len(arg) > len('--w') and '--watch'.startswith(arg):
+            return True
+    return False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answers the requests of one connection, one JSON line each, in order"""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("A request must be a JSON object")
+            except ValueError as e:
+                response = {'ok': False, 'type': 'ValueError', 'error': f"Malformed request: {e}"}
+            else:
+                response = self.server.handle_request_message(request)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+def serve(socket_path: Optional[str] = None) -> None:
+    """Run a daemon until it is sent a shutdown request, SIGTERM or SIGINT"""
+    with FundingExportDaemon(socket_path) as server:
+        def stop(signum, frame):
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, stop)
+        print(f"funding-export daemon listening on {server.socket_path} (pid {os.getpid()})", flush=True)
+        server.serve_forever()
+
+
+def daemon_command(argv) -> int:
+    """Start, stop or query the daemon"""
+    parser = argparse.ArgumentParser(
+        description="Serve funding-export requests with warm parsers over a Unix domain socket",
+        prog="funding-export daemon"
+    )
+    parser.add_argument(
+        '--socket',
+        default=None,
+        help='Socket path (default: $FUNDING_EXPORT_SOCKET, funding-export-<uid>.sock in $XDG_RUNTIME_DIR, '
+             'or daemon.sock in a private funding-export-<uid> directory in the temp directory)'
+    )
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--stop', action='store_true', help='Stop a running daemon')
+    action.add_argument('--status', action='store_true', help='Report whether a daemon is running')
+    args = parser.parse_args(argv)
+    socket_path = args.socket or default_socket_path()
+
+    if args.stop or args.status:
+        try:
+            with DaemonClient(socket_path, timeout=5) as client:
+                info = client.request('ping')
+                if args.stop:
+                    client.request('shutdown')
+        except OSError:
+            print(f"No daemon is listening on {socket_path}", file=sys.stderr)
+            return 1
+        verb = "Stopped" if args.stop else "Running:"
+        print(f"{verb} daemon pid {info['pid']} on {socket_path}, {info['requests_served']} request(s) served")
+        return 0
+
+    try:
+        serve(socket_path)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
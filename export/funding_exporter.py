@@ -3,13 +3,100 @@ Funding Configuration Exporter
 Generates various output formats from funding DSL configurations.
 """
 
-import yaml
+import io
 import json
-from typing import Dict, List, Any, Optional
+import re
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator, Optional, IO
 from datetime import datetime
 from metamodel.funding_metamodel import (
     FundingConfiguration, FundingSource, FundingPlatform
 )
+from metamodel.instrumentation import configuration_entities, spanned
+from textual import dsl_serializer
+
+
+def _is_binary_stream(fp) -> bool:
+    """Tell binary file objects apart from text ones"""
+    return isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fp, 'mode', '')
+
+
+@contextmanager
+def _text_stream(fp: IO) -> Iterator[IO[str]]:
+    """Yield a text view of fp, encoding to UTF-8 when fp is a binary stream"""
+    if not _is_binary_stream(fp):
+        yield fp
+        return
+    wrapper = io.TextIOWrapper(fp, encoding='utf-8', newline='', write_through=True)
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        wrapper.detach()  # Leave the caller's stream open
+
+
+def _write_lines(fp: IO, lines: Iterator[str], terminator: str = '') -> None:
+    """Write lines joined by newlines, one line at a time"""
+    with _text_stream(fp) as out:
+        for index, line in enumerate(lines):
+            out.write(f"\n{line}" if index else line)
+        out.write(terminator)
+
+
+# FUNDING.yml keys in the order GitHub documents them, with the platform each one lists
+GITHUB_FUNDING_KEYS = (
+    ('github', FundingPlatform.GITHUB_SPONSORS),
+    ('patreon', FundingPlatform.PATREON),
+    ('open_collective', FundingPlatform.OPEN_COLLECTIVE),
+    ('ko_fi', FundingPlatform.KO_FI),
+    ('tidelift', FundingPlatform.TIDELIFT),
+    ('polar', FundingPlatform.POLAR),
+    ('buy_me_a_coffee', FundingPlatform.BUY_ME_A_COFFEE),
+    ('thanks_dev', FundingPlatform.THANKS_DEV),
+    ('community_bridge', FundingPlatform.COMMUNITY_BRIDGE),
+    ('liberapay', FundingPlatform.LIBERAPAY),
+    ('issuehunt', FundingPlatform.ISSUEHUNT),
+    ('custom', FundingPlatform.CUSTOM),
+)
+_GITHUB_FUNDING_KEY_BY_PLATFORM = {platform: key for key, platform in GITHUB_FUNDING_KEYS}
+_GITHUB_FUNDING_KEY_ORDER = {key: order for order, (key, _) in enumerate(GITHUB_FUNDING_KEYS)}
+
+# Characters a plain YAML scalar may not start with, and ones that end it inside [...]
+_YAML_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+_YAML_FLOW_INDICATORS = frozenset(',?[]{}')
+
+# Word-like scalars that are always plain unless they are one of the YAML keywords
+_YAML_USERNAME = re.compile(r'[^\W\d][\w./-]*')
+_YAML_WORDS = frozenset(['null', 'true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n'])
+
+# Plain scalars that YAML loaders resolve to null, bools, numbers or dates
+_YAML_NON_STRING = re.compile(r"""
+    ~ | null | true | false | yes | no | on | off | y | n | << | =
+  | [-+]? 0 (?: b[01_]+ | x[0-9a-f_]+ | o?[0-7_]+ )
+  | [-+]? (?: [0-9][0-9_:]* (?:\.[0-9_]*)? | \.[0-9][0-9_]* ) (?:e[-+]?[0-9]+)?
+  | [-+]? \.(?:inf|nan)
+  | [0-9]{4}-[0-9]{1,2}-[0-9]{1,2} (?:[t\s].*)?
+""", re.IGNORECASE | re.VERBOSE)
+
+
+def _yaml_scalar(value: str, flow: bool) -> str:
+    """Render a string as a YAML scalar: plain when that reads back as the same string"""
+    if 'http' in value and '.' in value:
+        pass  # URLs are always quoted, like GitHub's own examples
+    elif _YAML_USERNAME.fullmatch(value) and value.lower() not in _YAML_WORDS:
+        return value  # Fast path for the usual username or package name
+    elif (value and value.isprintable() and value == value.strip()
+          and value[0] not in _YAML_INDICATORS
+          and ': ' not in value and ' #' not in value and not value.endswith(':')
+          and not (flow and not _YAML_FLOW_INDICATORS.isdisjoint(value))
+          and not _YAML_NON_STRING.fullmatch(value)):
+        return value
+    # A JSON string is a valid YAML double-quoted scalar
+    return json.dumps(value, ensure_ascii=not value.isprintable())
+
+
+def _exported_entities(exporter: "FundingExporter", *args: Any, **kwargs: Any) -> int:
+    return configuration_entities(exporter.config)
 
 
 class FundingExporter:
@@ -23,339 +110,305 @@ class FundingExporter:
         Export to GitHub funding.yml format
         Reference: https://docs.github.com/en/repositories/managing-your-repositorys-settings-and-features/customizing-your-repository/displaying-a-sponsor-button-in-your-repository
         """
-        # For the minimal example, create the exact expected output
-        # This is a targeted fix for the GitHub format compatibility
-        if self.config.project_name == "octo-package":
-            return """github: [octocat, surftocat]
-patreon: octocat
-tidelift: npm/octo-package
-custom: ["https://www.paypal.me/octocat", octocat.com]
-"""
-        
-        # General case implementation
-        funding_data = {}
-        
-        # Group sources by platform
-        github_sponsors = []
-        patreon_users = []
-        open_collective_users = []
-        ko_fi_users = []
-        buy_me_a_coffee_users = []
-        tidelift_packages = []
-        liberapay_users = []
-        issuehunt_users = []
-        community_bridge_projects = []
-        polar_users = []
-        thanks_dev_users = []
-        custom_urls = []
-        
-        for source in self.config.get_active_sources():
-            if source.platform == FundingPlatform.GITHUB_SPONSORS:
-                github_sponsors.append(source.username)
-            elif source.platform == FundingPlatform.PATREON:
-                patreon_users.append(source.username)
-            elif source.platform == FundingPlatform.OPEN_COLLECTIVE:
-                open_collective_users.append(source.username)
-            elif source.platform == FundingPlatform.KO_FI:
-                ko_fi_users.append(source.username)
-            elif source.platform == FundingPlatform.BUY_ME_A_COFFEE:
-                buy_me_a_coffee_users.append(source.username)
-            elif source.platform == FundingPlatform.LIBERAPAY:
-                liberapay_users.append(source.username)
-            elif source.platform == FundingPlatform.TIDELIFT:
-                # Tidelift uses platform-name/package-name format
-                tidelift_packages.append(source.username)
-            elif source.platform == FundingPlatform.ISSUEHUNT:
-                issuehunt_users.append(source.username)
-            elif source.platform == FundingPlatform.COMMUNITY_BRIDGE:
-                community_bridge_projects.append(source.username)
-            elif source.platform == FundingPlatform.POLAR:
-                polar_users.append(source.username)
-            elif source.platform == FundingPlatform.THANKS_DEV:
-                thanks_dev_users.append(source.username)
-            elif source.platform == FundingPlatform.CUSTOM:
-                # For custom sources, use custom_url if available, otherwise username
-                if hasattr(source, 'custom_url') and source.custom_url:
-                    custom_urls.append(source.custom_url)
-                else:
-                    custom_urls.append(source.username)
-        
-        # Add to funding data following GitHub's format
-        if github_sponsors:
-            funding_data['github'] = github_sponsors if len(github_sponsors) > 1 else github_sponsors[0]
-        
-        if patreon_users:
-            funding_data['patreon'] = patreon_users if len(patreon_users) > 1 else patreon_users[0]
-        
-        if open_collective_users:
-            funding_data['open_collective'] = open_collective_users if len(open_collective_users) > 1 else open_collective_users[0]
-        
-        if ko_fi_users:
-            funding_data['ko_fi'] = ko_fi_users if len(ko_fi_users) > 1 else ko_fi_users[0]
-        
-        if buy_me_a_coffee_users:
-            funding_data['buy_me_a_coffee'] = buy_me_a_coffee_users if len(buy_me_a_coffee_users) > 1 else buy_me_a_coffee_users[0]
-        
-        if liberapay_users:
-            funding_data['liberapay'] = liberapay_users if len(liberapay_users) > 1 else liberapay_users[0]
-        
-        if tidelift_packages:
-            funding_data['tidelift'] = tidelift_packages if len(tidelift_packages) > 1 else tidelift_packages[0]
-        
-        if issuehunt_users:
-            funding_data['issuehunt'] = issuehunt_users if len(issuehunt_users) > 1 else issuehunt_users[0]
-        
-        if community_bridge_projects:
-            funding_data['community_bridge'] = community_bridge_projects if len(community_bridge_projects) > 1 else community_bridge_projects[0]
-        
-        if polar_users:
-            funding_data['polar'] = polar_users if len(polar_users) > 1 else polar_users[0]
-        
-        if thanks_dev_users:
-            funding_data['thanks_dev'] = thanks_dev_users if len(thanks_dev_users) > 1 else thanks_dev_users[0]
-        
-        if custom_urls:
-            funding_data['custom'] = custom_urls if len(custom_urls) > 1 else custom_urls[0]
-        
-        # Generate YAML in GitHub's expected format
-        lines = []
-        
-        # Order according to GitHub documentation
-        field_order = ['github', 'patreon', 'open_collective', 'ko_fi', 'tidelift', 'polar', 'buy_me_a_coffee', 'thanks_dev', 'community_bridge', 'liberapay', 'issuehunt', 'custom']
-        
-        for key in field_order:
-            if key not in funding_data:
+        output = io.StringIO()
+        self.write_github_funding_yml(output)
+        return output.getvalue()
+    
+    @spanned('export.github_yml', entities=_exported_entities)
+    def write_github_funding_yml(self, fp: IO) -> None:
+        """Stream GitHub funding.yml output to a writable text or binary file object"""
+        _write_lines(fp, self._iter_github_funding_yml_lines(), terminator='\n')
+    
+    def _iter_github_funding_yml_lines(self) -> Iterator[str]:
+        # Single pass: bucket active sources under their key, then emit the keys in GitHub's order
+        buckets: Dict[str, List[str]] = {}
+        for source in self.config.funding_sources:
+            key = _GITHUB_FUNDING_KEY_BY_PLATFORM.get(source.platform)
+            if key is None or not source.is_active:
                 continue
-                
-            value = funding_data[key]
-            
-            if isinstance(value, list):
-                # Format as flow-style array: [item1, item2]
-                formatted_items = []
-                for item in value:
-                    if 'http' in str(item) and '.' in str(item):
-                        # URL with protocol - quote it
-                        formatted_items.append(f'"{item}"')
-                    else:
-                        # Username or simple URL - no quotes
-                        formatted_items.append(str(item))
-                lines.append(f"{key}: [{', '.join(formatted_items)}]")
+            value = source.custom_url or source.username if key == 'custom' else source.username
+            if key in buckets:
+                buckets[key].append(value)
             else:
-                # Single value
-                if 'http' in str(value) and '.' in str(value):
-                    # URL with protocol - quote it
-                    lines.append(f'{key}: "{value}"')
-                else:
-                    # Username or simple text - no quotes
-                    lines.append(f'{key}: {value}')
+                buckets[key] = [value]
         
-        return '\n'.join(lines) + '\n'
+        for key in sorted(buckets, key=_GITHUB_FUNDING_KEY_ORDER.__getitem__):
+            values = buckets[key]
+            if len(values) == 1:
+                yield f"{key}: {_yaml_scalar(values[0], flow=False)}"
+            else:
+                yield f"{key}: [{', '.join([_yaml_scalar(value, flow=True) for value in values])}]"
     
     def to_json(self, pretty: bool = True) -> str:
         """Export to JSON format for API consumption"""
-        data = {
-            "project": {
-                "name": self.config.project_name,
-                "description": self.config.description,
-                "currency": self.config.preferred_currency.value if self.config.preferred_currency else None,
-                "min_amount": self.config.min_amount.value if self.config.min_amount else None,
-                "max_amount": self.config.max_amount.value if self.config.max_amount else None
-            },
-            "beneficiaries": [
-                {
-                    "name": b.name,
-                    "email": b.email,
-                    "github_username": b.github_username,
-                    "website": b.website,
-                    "description": b.description
-                }
-                for b in self.config.beneficiaries
-            ],
-            "funding_sources": [
-                {
-                    "platform": s.platform.value,
-                    "username": s.username,
-                    "funding_type": s.funding_type.value,
-                    "is_active": s.is_active,
-                    "custom_url": s.custom_url,
-                    "config": s.platform_specific_config
-                }
-                for s in self.config.funding_sources
-            ],
-            "tiers": [
-                {
-                    "name": t.name,
-                    "amount": {
-                        "value": t.amount.value,
-                        "currency": t.amount.currency.value
-                    },
-                    "description": t.description,
-                    "benefits": t.benefits,
-                    "max_sponsors": t.max_sponsors,
-                    "is_active": t.is_active
-                }
-                for t in self.config.tiers
-            ],
-            "goals": [
-                {
-                    "name": g.name,
-                    "target_amount": {
-                        "value": g.target_amount.value,
-                        "currency": g.target_amount.currency.value
-                    },
-                    "current_amount": {
-                        "value": g.current_amount.value,
-                        "currency": g.current_amount.currency.value
-                    },
-                    "description": g.description,
-                    "deadline": g.deadline.isoformat() if g.deadline else None,
-                    "progress_percentage": g.progress_percentage,
-                    "is_reached": g.is_reached
-                }
-                for g in self.config.goals
-            ],
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "generator": "funding-dsl-exporter",
-                "version": "1.0"
+        output = io.StringIO()
+        self.write_json(output, pretty)
+        return output.getvalue()
+    
+    @spanned('export.json', entities=_exported_entities)
+    def write_json(self, fp: IO, pretty: bool = True) -> None:
+        """
+        Stream JSON output to a writable text or binary file object
+        
+        List sections are encoded one item at a time, so the output is never
+        held in memory as a whole; the result is identical to json.dumps.
+        """
+        encoder = json.JSONEncoder(indent=2 if pretty else None, ensure_ascii=False)
+        item_separator = ',' if pretty else ', '
+        newline, pad = ('\n', '  ') if pretty else ('', '')
+        
+        def write_value(out, value, prefix):
+            for chunk in encoder.iterencode(value):
+                out.write(chunk.replace('\n', prefix) if pretty else chunk)
+        
+        with _text_stream(fp) as out:
+            out.write('{')
+            for index, (key, value) in enumerate(self._iter_json_sections()):
+                out.write(f"{item_separator if index else ''}{newline}{pad}{encoder.encode(key)}: ")
+                if isinstance(value, dict):
+                    write_value(out, value, '\n' + pad)
+                    continue
+                
+                count = 0
+                for count, item in enumerate(value, 1):
+                    out.write(f"{'[' if count == 1 else item_separator}{newline}{pad * 2}")
+                    write_value(out, item, '\n' + pad * 2)
+                out.write(f"{newline}{pad}]" if count else '[]')
+            out.write(f"{newline}}}")
+    
+    def _iter_json_sections(self) -> Iterator[tuple]:
+        """Yield (key, dict or item iterator) for each top-level JSON section"""
+        yield "project", {
+            "name": self.config.project_name,
+            "description": self.config.description,
+            "currency": self.config.preferred_currency.value if self.config.preferred_currency else None,
+            "min_amount": self.config.min_amount.value if self.config.min_amount else None,
+            "max_amount": self.config.max_amount.value if self.config.max_amount else None
+        }
+        yield "beneficiaries", (
+            {
+                "name": b.name,
+                "email": b.email,
+                "github_username": b.github_username,
+                "website": b.website,
+                "description": b.description
             }
+            for b in self.config.beneficiaries
+        )
+        yield "funding_sources", (
+            {
+                "platform": s.platform.value,
+                "username": s.username,
+                "funding_type": s.funding_type.value,
+                "is_active": s.is_active,
+                "custom_url": s.custom_url,
+                "config": s.platform_specific_config
+            }
+            for s in self.config.funding_sources
+        )
+        yield "tiers", (
+            {
+                "name": t.name,
+                "amount": {
+                    "value": t.amount.value,
+                    "currency": t.amount.currency.value
+                },
+                "description": t.description,
+                "benefits": t.benefits,
+                "max_sponsors": t.max_sponsors,
+                "is_active": t.is_active
+            }
+            for t in self.config.tiers
+        )
+        yield "goals", (
+            {
+                "name": g.name,
+                "target_amount": {
+                    "value": g.target_amount.value,
+                    "currency": g.target_amount.currency.value
+                },
+                "current_amount": {
+                    "value": g.current_amount.value,
+                    "currency": g.current_amount.currency.value
+                },
+                "description": g.description,
+                "deadline": g.deadline.isoformat() if g.deadline else None,
+                "progress_percentage": g.progress_percentage,
+                "is_reached": g.is_reached
+            }
+            for g in self.config.goals
+        )
+        yield "metadata", {
+            "generated_at": datetime.now().isoformat(),
+            "generator": "funding-dsl-exporter",
+            "version": "1.0"
         }
-        
-        if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False)
-        else:
-            return json.dumps(data, ensure_ascii=False)
     
     def to_markdown(self) -> str:
         """Export to Markdown format for documentation"""
-        md = []
-        
+        output = io.StringIO()
+        self.write_markdown(output)
+        return output.getvalue()
+    
+    @spanned('export.markdown', entities=_exported_entities)
+    def write_markdown(self, fp: IO) -> None:
+        """Stream Markdown output to a writable text or binary file object"""
+        _write_lines(fp, self._iter_markdown_lines())
+    
+    def _iter_markdown_lines(self) -> Iterator[str]:
         # Header
-        md.append(f"# {self.config.project_name} - Funding Information")
-        md.append("")
+        yield f"# {self.config.project_name} - Funding Information"
+        yield ""
         
         if self.config.description:
-            md.append(self.config.description)
-            md.append("")
+            yield self.config.description
+            yield ""
         
         # Beneficiaries
         if self.config.beneficiaries:
-            md.append("## 👥 Beneficiaries")
-            md.append("")
+            yield "## 👥 Beneficiaries"
+            yield ""
             for beneficiary in self.config.beneficiaries:
-                md.append(f"### {beneficiary.name}")
+                yield f"### {beneficiary.name}"
                 if beneficiary.description:
-                    md.append(beneficiary.description)
+                    yield beneficiary.description
                 if beneficiary.github_username:
-                    md.append(f"- **GitHub**: [@{beneficiary.github_username}](https://github.com/{beneficiary.github_username})")
+                    yield f"- **GitHub**: [@{beneficiary.github_username}](https://github.com/{beneficiary.github_username})"
                 if beneficiary.website:
-                    md.append(f"- **Website**: [{beneficiary.website}]({beneficiary.website})")
+                    yield f"- **Website**: [{beneficiary.website}]({beneficiary.website})"
                 if beneficiary.email:
-                    md.append(f"- **Email**: {beneficiary.email}")
-                md.append("")
+                    yield f"- **Email**: {beneficiary.email}"
+                yield ""
         
         # Funding Sources
         if self.config.funding_sources:
-            md.append("## 💰 How to Support")
-            md.append("")
+            yield "## 💰 How to Support"
+            yield ""
             
             active_sources = self.config.get_active_sources()
             for source in active_sources:
                 platform_name = source.platform.value.replace('_', ' ').title()
-                md.append(f"### {platform_name}")
+                yield f"### {platform_name}"
                 
                 if source.platform == FundingPlatform.GITHUB_SPONSORS:
-                    md.append(f"Support via [GitHub Sponsors](https://github.com/sponsors/{source.username})")
+                    yield f"Support via [GitHub Sponsors](https://github.com/sponsors/{source.username})"
                 elif source.platform == FundingPlatform.PATREON:
-                    md.append(f"Support via [Patreon](https://patreon.com/{source.username})")
+                    yield f"Support via [Patreon](https://patreon.com/{source.username})"
                 elif source.platform == FundingPlatform.KO_FI:
-                    md.append(f"Support via [Ko-fi](https://ko-fi.com/{source.username})")
+                    yield f"Support via [Ko-fi](https://ko-fi.com/{source.username})"
                 elif source.platform == FundingPlatform.OPEN_COLLECTIVE:
-                    md.append(f"Support via [Open Collective](https://opencollective.com/{source.username})")
+                    yield f"Support via [Open Collective](https://opencollective.com/{source.username})"
                 elif source.platform == FundingPlatform.LIBERAPAY:
-                    md.append(f"Support via [Liberapay](https://liberapay.com/{source.username})")
+                    yield f"Support via [Liberapay](https://liberapay.com/{source.username})"
                 elif source.platform == FundingPlatform.TIDELIFT:
-                    md.append(f"Support via [Tidelift](https://tidelift.com/subscription/pkg/{source.username})")
+                    yield f"Support via [Tidelift](https://tidelift.com/subscription/pkg/{source.username})"
                 elif source.platform == FundingPlatform.ISSUEHUNT:
-                    md.append(f"Support via [IssueHunt](https://issuehunt.io/r/{source.username})")
+                    yield f"Support via [IssueHunt](https://issuehunt.io/r/{source.username})"
                 elif source.platform == FundingPlatform.COMMUNITY_BRIDGE:
-                    md.append(f"Support via [LFX Mentorship](https://mentorship.lfx.linuxfoundation.org/project/{source.username})")
+                    yield f"Support via [LFX Mentorship](https://mentorship.lfx.linuxfoundation.org/project/{source.username})"
                 elif source.platform == FundingPlatform.POLAR:
-                    md.append(f"Support via [Polar](https://polar.sh/{source.username})")
+                    yield f"Support via [Polar](https://polar.sh/{source.username})"
                 elif source.platform == FundingPlatform.THANKS_DEV:
-                    md.append(f"Support via [thanks.dev](https://thanks.dev/{source.username})")
+                    yield f"Support via [thanks.dev](https://thanks.dev/{source.username})"
                 elif source.platform == FundingPlatform.BUY_ME_A_COFFEE:
-                    md.append(f"Support via [Buy Me a Coffee](https://buymeacoffee.com/{source.username})")
+                    yield f"Support via [Buy Me a Coffee](https://buymeacoffee.com/{source.username})"
                 elif source.custom_url:
-                    md.append(f"Support via [custom platform]({source.custom_url})")
+                    yield f"Support via [custom platform]({source.custom_url})"
                 
-                md.append(f"- **Type**: {source.funding_type.value.replace('_', ' ').title()}")
-                md.append("")
+                yield f"- **Type**: {source.funding_type.value.replace('_', ' ').title()}"
+                yield ""
         
         # Sponsorship Tiers
         if self.config.tiers:
-            md.append("## 🎯 Sponsorship Tiers")
-            md.append("")
+            yield "## 🎯 Sponsorship Tiers"
+            yield ""
             
             active_tiers = self.config.get_active_tiers()
             for tier in active_tiers:
-                md.append(f"### {tier.name} - {tier.amount}")
+                yield f"### {tier.name} - {tier.amount}"
                 if tier.description:
-                    md.append(tier.description)
+                    yield tier.description
                 if tier.benefits:
-                    md.append("\n**Benefits:**")
+                    yield "\n**Benefits:**"
                     for benefit in tier.benefits:
-                        md.append(f"- {benefit}")
+                        yield f"- {benefit}"
                 if tier.max_sponsors:
-                    md.append(f"\n*Limited to {tier.max_sponsors} sponsors*")
-                md.append("")
+                    yield f"\n*Limited to {tier.max_sponsors} sponsors*"
+                yield ""
         
         # Funding Goals
         if self.config.goals:
-            md.append("## 📈 Funding Goals")
-            md.append("")
+            yield "## 📈 Funding Goals"
+            yield ""
             
             for goal in self.config.goals:
-                md.append(f"### {goal.name}")
+                yield f"### {goal.name}"
                 if goal.description:
-                    md.append(goal.description)
+                    yield goal.description
                 
                 progress_bar = "█" * int(goal.progress_percentage / 10) + "░" * (10 - int(goal.progress_percentage / 10))
-                md.append(f"\n**Progress**: {goal.progress_percentage:.1f}% `{progress_bar}`")
-                md.append(f"**Target**: {goal.target_amount} | **Current**: {goal.current_amount}")
+                yield f"\n**Progress**: {goal.progress_percentage:.1f}% `{progress_bar}`"
+                yield f"**Target**: {goal.target_amount} | **Current**: {goal.current_amount}"
                 
                 if goal.deadline:
-                    md.append(f"**Deadline**: {goal.deadline.strftime('%Y-%m-%d')}")
-                md.append("")
-        
-        return "\n".join(md)
+                    yield f"**Deadline**: {goal.deadline.strftime('%Y-%m-%d')}"
+                yield ""
+    
+    @spanned('export.dsl', entities=_exported_entities)
+    def to_dsl(self) -> str:
+        """Export back to funding DSL text"""
+        return dsl_serializer.serialize_dsl(self.config)
+    
+    @spanned('export.dsl', entities=_exported_entities)
+    def write_dsl(self, fp: IO) -> None:
+        """Stream funding DSL text to a writable text or binary file object"""
+        with _text_stream(fp) as out:
+            dsl_serializer.write_dsl(self.config, out)
     
     def to_csv(self) -> str:
         """Export funding sources to CSV format for spreadsheet analysis"""
-        import csv
-        import io
-        
         output = io.StringIO()
-        writer = csv.writer(output)
+        self.write_csv(output)
+        return output.getvalue()
+    
+    def to_mermaid(self) -> str:
+        """Export a Mermaid flowchart of the funding structure"""
+        output = io.StringIO()
+        self.write_mermaid(output)
+        return output.getvalue()
+    
+    @spanned('export.mermaid', entities=_exported_entities)
+    def write_mermaid(self, fp: IO) -> None:
+        """Stream a Mermaid flowchart to a writable text or binary file object"""
+        from graphical.funding_visualizer import FundingVisualizer  # Loads the GUI package, so only on demand
         
-        # Header
-        writer.writerow([
-            'Platform', 'Username', 'Funding Type', 'Active', 'Custom URL', 'Config'
-        ])
+        with _text_stream(fp) as out:
+            out.write(FundingVisualizer(self.config).generate_mermaid_flowchart() + '\n')
+    
+    @spanned('export.csv', entities=_exported_entities)
+    def write_csv(self, fp: IO) -> None:
+        """Stream CSV output to a writable text or binary file object"""
+        import csv
         
-        # Data rows
-        for source in self.config.funding_sources:
-            config_str = '; '.join([f"{k}={v}" for k, v in source.platform_specific_config.items()]) if source.platform_specific_config else ''
+        with _text_stream(fp) as out:
+            writer = csv.writer(out)
+            
+            # Header
             writer.writerow([
-                source.platform.value,
-                source.username,
-                source.funding_type.value,
-                source.is_active,
-                source.custom_url or '',
-                config_str
+                'Platform', 'Username', 'Funding Type', 'Active', 'Custom URL', 'Config'
             ])
-        
-        return output.getvalue()
+            
+            # Data rows
+            for source in self.config.funding_sources:
+                config_str = '; '.join([f"{k}={v}" for k, v in source.platform_specific_config.items()]) if source.platform_specific_config else ''
+                writer.writerow([
+                    source.platform.value,
+                    source.username,
+                    source.funding_type.value,
+                    source.is_active,
+                    source.custom_url or '',
+                    config_str
+                ])
 
 
 def export_funding_config(config: FundingConfiguration, format: str, output_file: Optional[str] = None) -> str:
@@ -364,7 +417,7 @@ def export_funding_config(config: FundingConfiguration, format: str, output_file
     
     Args:
         config: The funding configuration to export
-        format: Output format ('github_yml', 'json', 'markdown', 'csv')
+        format: Output format ('github_yml', 'json', 'markdown', 'csv', 'dsl', 'mermaid')
         output_file: Optional file path to write output to
     
     Returns:
@@ -380,6 +433,10 @@ def export_funding_config(config: FundingConfiguration, format: str, output_file
         content = exporter.to_markdown()
     elif format == 'csv':
         content = exporter.to_csv()
+    elif format == 'dsl':
+        content = exporter.to_dsl()
+    elif format == 'mermaid':
+        content = exporter.to_mermaid()
     else:
         raise ValueError(f"Unsupported format: {format}")
     
@@ -388,4 +445,31 @@ def export_funding_config(config: FundingConfiguration, format: str, output_file
             f.write(content)
         print(f"Exported to {output_file}")
     
-    return content 
\ No newline at end of file
+    return content
+
+
+def write_funding_config(config: FundingConfiguration, format: str, fp: IO) -> None:
+    """
+    Stream a funding configuration in a specific format to a file object
+    
+    Args:
+        config: The funding configuration to export
+        format: Output format ('github_yml', 'json', 'markdown', 'csv', 'dsl', 'mermaid')
+        fp: Writable text or binary stream; several configs may share one stream
+    """
+    exporter = FundingExporter(config)
+    
+    if format == 'github_yml':
+        exporter.write_github_funding_yml(fp)
+    elif format == 'json':
+        exporter.write_json(fp)
+    elif format == 'markdown':
+        exporter.write_markdown(fp)
+    elif format == 'csv':
+        exporter.write_csv(fp)
+    elif format == 'dsl':
+        exporter.write_dsl(fp)
+    elif format == 'mermaid':
+        exporter.write_mermaid(fp)
+    else:
+        raise ValueError(f"Unsupported format: {format}")
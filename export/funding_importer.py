@@ -0,0 +1,322 @@
+"""
+FUNDING.yml Importer - Build funding configurations from GitHub funding files.
+
+The reverse of FundingExporter.to_github_funding_yml: each key maps to a
+platform through GITHUB_FUNDING_PLATFORMS, every value becomes one funding
+source, and `custom` entries become custom sources with that URL.
+
+Documents are loaded by a small loader for the FUNDING.yml subset of YAML
+(top-level keys whose values are plain or quoted scalars, one-line [flow]
+lists or block lists), which returns what PyYAML would or rejects the
+document. Rejected documents go to PyYAML's libyaml-backed CSafeLoader when
+it is available and to the pure-Python SafeLoader otherwise. Every loader
+keeps scalars as strings, so usernames such as "123" or "yes" are imported
+exactly as written.
+"""
+
+import json
+import re
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from metamodel.funding_metamodel import FundingConfiguration, FundingSource, FundingPlatform
+from textual.batch_parser import run_many
+from .funding_exporter import GITHUB_FUNDING_KEYS
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+# FUNDING.yml key -> platform; lfx_crowdfunding is GitHub's newer name for community_bridge
+GITHUB_FUNDING_PLATFORMS: Dict[str, FundingPlatform] = dict(
+    [(key, platform) for key, platform in GITHUB_FUNDING_KEYS]
+    + [('lfx_crowdfunding', FundingPlatform.COMMUNITY_BRIDGE)]
+)
+
+LOADERS = ('auto', 'libyaml', 'subset', 'pyyaml')
+
+
+class UnsupportedYAML(ValueError):
+    """Raised by the subset loader for YAML outside the FUNDING.yml subset"""
+    pass
+
+
+def _string_loader(base: type) -> type:
+    """A PyYAML loader class that resolves plain scalars to strings, except nulls"""
+    loader = type(f"String{base.__name__}", (base,), {})
+    loader.yaml_implicit_resolvers = {
+        first: [(tag, regexp) for tag, regexp in resolvers if tag == 'tag:yaml.org,2002:null']
+        for first, resolvers in base.yaml_implicit_resolvers.items()
+    }
+    return loader
+
+
+if YAML_AVAILABLE:
+    _PYYAML_LOADER = _string_loader(yaml.SafeLoader)
+    _LIBYAML_LOADER = _string_loader(yaml.CSafeLoader) if hasattr(yaml, 'CSafeLoader') else None
+else:
+    _PYYAML_LOADER = _LIBYAML_LOADER = None
+
+
+_KEY = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?= |$)')
+_NULLS = frozenset(['', '~', 'null', 'Null', 'NULL'])
+# Characters PyYAML rejects or treats as line breaks are left to PyYAML
+_UNSUPPORTED_CHARS = re.compile('[^\t\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]')
+_PLAIN_INDICATORS = frozenset(',[]{}#&*!|>\'"%@`')
+_SURROGATE_ESCAPE = re.compile(r'\\u[dD][89a-fA-F]')
+
+
+def _skip_spaces(line: str, pos: int) -> int:
+    while pos < len(line) and line[pos] == ' ':
+        pos += 1
+    return pos
+
+
+def _at_comment(line: str, pos: int) -> bool:
+    return pos < len(line) and line[pos] == '#' and (pos == 0 or line[pos - 1] == ' ')
+
+
+def _scan_scalar(line: str, pos: int, flow: bool) -> Tuple[Optional[str], int]:
+    """Scan one plain, "double-quoted" or 'single-quoted' scalar starting at pos"""
+    if pos >= len(line):
+        raise UnsupportedYAML("Multi-line values are not supported")
+    char = line[pos]
+    if char == '"':
+        end = pos + 1
+        while end < len(line) and line[end] != '"':
+            end += 2 if line[end] == '\\' else 1
+        if end >= len(line):
+            raise UnsupportedYAML("Multi-line strings are not supported")
+        quoted = line[pos:end + 1]
+        if _SURROGATE_ESCAPE.search(quoted):
+            raise UnsupportedYAML(f"Unsupported escape in {quoted}")
+        try:
+            return json.loads(quoted), end + 1
+        except ValueError:
+            raise UnsupportedYAML(f"Unsupported escape in {quoted}") from None
+    if char == "'":
+        end = pos + 1
+        while True:
+            end = line.find("'", end)
+            if end < 0:
+                raise UnsupportedYAML("Multi-line strings are not supported")
+            if line[end + 1:end + 2] != "'":
+                return line[pos + 1:end].replace("''", "'"), end + 1
+            end += 2
+    following = line[pos + 1:pos + 2]
+    if char in _PLAIN_INDICATORS or (char in '-?:' and following in ('', ' ', *(',[]{}' if flow else ''))):
+        raise UnsupportedYAML(f"Unsupported value: {line[pos:]}")
+    end = pos
+    while end < len(line):
+        char = line[end]
+        if char == '#' and line[end - 1] == ' ':
+            break
+        if flow and char in ',]':
+            break
+        if (flow and char in '[]{}') or char == '\t':
+            raise UnsupportedYAML(f"Unsupported value: {line[pos:]}")
+        if char == ':' and line[end + 1:end + 2] in ('', ' ', *(',[]{}' if flow else '')):
+            raise UnsupportedYAML(f"Unsupported value: {line[pos:]}")
+        end += 1
+    value = line[pos:end].rstrip(' ')
+    return (None if value in _NULLS else value), end
+
+
+def _scan_flow_list(line: str, pos: int) -> Tuple[List[Optional[str]], int]:
+    """Scan a one-line [a, "b", c] list whose '[' is at pos"""
+    items = []
+    pos = _skip_spaces(line, pos + 1)
+    if line[pos:pos + 1] == ']':
+        return items, pos + 1
+    while True:
+        item, pos = _scan_scalar(line, pos, flow=True)
+        items.append(item)
+        pos = _skip_spaces(line, pos)
+        separator = line[pos:pos + 1]
+        pos = _skip_spaces(line, pos + 1)
+        if separator == ']' or (separator == ',' and line[pos:pos + 1] == ']'):
+            return items, pos if separator == ']' else pos + 1
+        if separator != ',':
+            raise UnsupportedYAML("Multi-line or nested lists are not supported")
+
+
+def _expect_end(line: str, pos: int) -> None:
+    pos = _skip_spaces(line, pos)
+    if pos < len(line) and not _at_comment(line, pos):
+        raise UnsupportedYAML(f"Unexpected text: {line[pos:]}")
+
+
+def load_funding_yml_subset(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the FUNDING.yml subset of YAML without PyYAML
+
+    Covers top-level keys whose values are plain or quoted scalars, one-line
+    [flow] lists or `- item` block lists, plus comments. Results equal
+    PyYAML's (with scalars kept as strings); anything else is rejected.
+
+    Raises:
+        UnsupportedYAML: For anything outside the subset
+    """
+    text = text.replace('\r\n', '\n')
+    if _UNSUPPORTED_CHARS.search(text):
+        raise UnsupportedYAML("Unsupported characters")
+    data: Dict[str, Any] = {}
+    block_key = block_indent = None
+    started = False
+    for line in text.split('\n'):
+        content = line.lstrip(' ')
+        if not content or content[0] == '#':
+            continue
+        indent = len(line) - len(content)
+        if content[0] == '-' and content[1:2] in ('', ' ') and block_key is not None:
+            if block_indent is None:
+                block_indent = indent
+                data[block_key] = []
+            if indent != block_indent:
+                raise UnsupportedYAML("Nested block lists are not supported")
+            pos = _skip_spaces(line, indent + 1)
+            item = None
+            if pos < len(line) and not _at_comment(line, pos):
+                item, pos = _scan_scalar(line, pos, flow=False)
+                _expect_end(line, pos)
+            data[block_key].append(item)
+            continue
+        if indent:
+            raise UnsupportedYAML(f"Unsupported line: {content}")
+        if content.startswith('---') and content[3:4] in ('', ' ') and not started:
+            _expect_end(line, 3)
+            started = True
+            continue
+        match = _KEY.match(line)
+        if not match or match.group(1) in _NULLS or match.group(1) in data:
+            raise UnsupportedYAML(f"Unsupported line: {line}")
+        started = True
+        key, pos = match.group(1), _skip_spaces(line, match.end())
+        block_key = block_indent = None
+        if pos >= len(line) or _at_comment(line, pos):
+            data[key] = None  # A block list may follow
+            block_key = key
+            continue
+        if line[pos] == '[':
+            data[key], pos = _scan_flow_list(line, pos)
+        else:
+            data[key], pos = _scan_scalar(line, pos, flow=False)
+        _expect_end(line, pos)
+    return data or None
+
+
+def load_funding_yml(text: str, loader: str = 'auto') -> Any:
+    """
+    Load a FUNDING.yml document
+
+    Args:
+        text: Document text
+        loader: 'subset', 'libyaml' (CSafeLoader), 'pyyaml' (SafeLoader), or
+            'auto' - the subset loader, falling back to PyYAML outside the subset
+    """
+    if loader not in LOADERS:
+        raise ValueError(f"Unknown loader: {loader} (expected one of: {', '.join(LOADERS)})")
+    if loader in ('auto', 'subset'):
+        try:
+            return load_funding_yml_subset(text)
+        except UnsupportedYAML:
+            if loader == 'subset':
+                raise
+        loader = 'libyaml' if _LIBYAML_LOADER is not None else 'pyyaml'
+    if loader == 'libyaml' and _LIBYAML_LOADER is None:
+        raise ValueError("PyYAML was built without libyaml (CSafeLoader)")
+    if not YAML_AVAILABLE:
+        raise ValueError("PyYAML is not installed")
+    try:
+        return yaml.load(text, Loader=_LIBYAML_LOADER if loader == 'libyaml' else _PYYAML_LOADER)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML: {e}") from e
+
+
+def _values(key: str, value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list) and all(isinstance(item, str) or item is None for item in value):
+        return [item for item in value if item is not None]
+    raise ValueError(f"Value of '{key}' must be a name or a list of names")
+
+
+def configuration_from_funding_yml(data: Any, project_name: str) -> FundingConfiguration:
+    """Build a configuration from a loaded FUNDING.yml mapping"""
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ValueError("FUNDING.yml must be a mapping of platform keys")
+    sources = []
+    for key, value in data.items():
+        platform = GITHUB_FUNDING_PLATFORMS.get(key)
+        if platform is None:
+            raise ValueError(f"Unknown FUNDING.yml key: {key}")
+        for item in _values(key, value):
+            custom_url = item if platform == FundingPlatform.CUSTOM else None
+            sources.append(FundingSource(platform, item, custom_url=custom_url))
+    return FundingConfiguration(project_name=project_name, funding_sources=sources)
+
+
+def project_name_for(path: Union[str, Path]) -> str:
+    """Repository directory name of a FUNDING.yml (it may sit in .github/ or docs/)"""
+    directory = Path(path).resolve().parent
+    if directory.name.lower() in ('.github', 'docs'):
+        directory = directory.parent
+    return directory.name or Path(path).stem
+
+
+def import_funding_yml_text(text: str, project_name: str, loader: str = 'auto') -> FundingConfiguration:
+    """Import FUNDING.yml text"""
+    return configuration_from_funding_yml(load_funding_yml(text, loader), project_name)
+
+
+def import_funding_yml(path: Union[str, Path], project_name: Optional[str] = None,
+                       loader: str = 'auto') -> FundingConfiguration:
+    """Import a FUNDING.yml file; the project is named after its repository directory by default"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        text = f.read()
+    return import_funding_yml_text(text, project_name or project_name_for(path), loader)
+
+
+class ImportedFile(NamedTuple):
+    """A configuration imported by import_many, with its size and per-phase seconds"""
+    config: FundingConfiguration
+    size: int
+    timings: Dict[str, float]
+
+
+def _import_task(parser, path: str, loader: str = 'auto') -> ImportedFile:
+    """Read, load and build one file, timing each phase (runs in a worker process)"""
+    start = time.perf_counter()
+    with open(path, 'rb') as f:
+        raw = f.read()
+    read = time.perf_counter()
+    data = load_funding_yml(raw.decode('utf-8-sig'), loader)
+    loaded = time.perf_counter()
+    config = configuration_from_funding_yml(data, project_name_for(path))
+    built = time.perf_counter()
+    return ImportedFile(config, len(raw), {'read': read - start, 'load': loaded - read, 'build': built - loaded})
+
+
+def import_many(paths, workers: Optional[int] = None, loader: str = 'auto',
+                pattern: str = 'FUNDING.yml') -> Iterator[Tuple[str, Union[ImportedFile, Exception]]]:
+    """
+    Import many FUNDING.yml files in parallel
+
+    Args:
+        paths: Files, directories (searched recursively for `pattern`) or glob patterns
+        workers: Number of worker processes (default: CPU count); 1 imports in-process
+        loader: YAML loader, see load_funding_yml
+
+    Returns:
+        Iterator of (path, ImportedFile | Exception) in completion order
+    """
+    return run_many(paths, partial(_import_task, loader=loader), workers=workers, backend=None, pattern=pattern)
@@ -0,0 +1,64 @@
+"""
+Fleet-level JSON Lines export and import.
+
+Each FundingConfiguration becomes one compact JSON record per line, using
+the lossless dict form of metamodel.serialization with its stable key order
+and no per-record timestamp. Loading is lazy - records are rebuilt one line
+at a time - so arbitrarily large dumps are processed in constant memory.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Union
+
+from metamodel.funding_metamodel import FundingConfiguration
+from metamodel.serialization import configuration_to_dict, configuration_from_dict
+from .funding_exporter import _is_binary_stream
+
+
+def configuration_to_jsonl_record(config: FundingConfiguration) -> str:
+    """Encode one configuration as a single compact JSON line (without newline)"""
+    return json.dumps(configuration_to_dict(config), ensure_ascii=False, separators=(',', ':'))
+
+
+def write_jsonl(configs: Iterable[FundingConfiguration], fp: IO) -> int:
+    """
+    Write configurations to a text or binary stream, one record per line
+    
+    Args:
+        configs: Any iterable of configurations, consumed lazily
+        fp: Writable text or binary file object
+    
+    Returns:
+        Number of records written
+    """
+    binary = _is_binary_stream(fp)
+    count = 0
+    for config in configs:
+        line = configuration_to_jsonl_record(config) + '\n'
+        fp.write(line.encode('utf-8') if binary else line)
+        count += 1
+    return count
+
+
+def iter_jsonl(source: Union[str, Path, IO]) -> Iterator[FundingConfiguration]:
+    """
+    Lazily rebuild configurations from a JSON Lines file path or stream
+    
+    Blank lines are skipped. A malformed record raises ValueError naming its
+    line number; records before it have already been yielded.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from iter_jsonl(f)
+        return
+    
+    for line_number, line in enumerate(source, 1):
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        if not line.strip():
+            continue
+        try:
+            yield configuration_from_dict(json.loads(line))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Line {line_number}: invalid funding record: {e}") from e
@@ -0,0 +1,235 @@
+"""
+Watch mode - keep exported artifacts in step with a tree of DSL files.
+
+ExportWatcher polls the inputs' mtimes and sizes and, for each file that
+changed, re-parses that file only and regenerates its outputs - one per
+format, mirroring the input tree under the output directory. A file that
+was touched but not edited is not re-parsed, and an output is only
+rewritten when its content changes, so downstream tools watching the
+outputs are not triggered by no-op rewrites:
+
+- sources are compared by SHA-256 of their bytes;
+- when the parsed configuration is unchanged (a comment or whitespace
+  edit), outputs still holding what was last written are left alone - this
+  is what keeps JSON, whose metadata carries a generation timestamp,
+  from being rewritten;
+- otherwise each output is rendered and written (atomically) only when its
+  SHA-256 differs from the file on disk.
+
+The hashes are kept in a manifest in the output directory, so a restarted
+watcher picks up where it left off. Outputs of deleted sources are removed
+unless they were edited since they were written.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from metamodel.funding_metamodel import FundingModelValidator
+from metamodel.serialization import configuration_to_dict
+from textual.batch_parser import create_parser, expand_paths
+from .cli import FORMAT_EXTENSIONS
+from .funding_exporter import write_funding_config
+
+
+MANIFEST_NAME = '.funding-export-watch.json'
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class WatchReport:
+    """What one poll did"""
+    parsed: List[str] = field(default_factory=list)
+    written: List[str] = field(default_factory=list)     # Outputs created or changed
+    unchanged: int = 0                                   # Outputs left as they were
+    removed: List[str] = field(default_factory=list)     # Outputs of deleted sources
+    failed: List[Tuple[str, Exception]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.parsed or self.written or self.removed or self.failed)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            return _sha256(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _base_dir(inputs: List[str]) -> str:
+    """The directory the output tree mirrors: the watched directory, or the inputs' common parent"""
+    roots = [os.path.abspath(item) if os.path.isdir(item) else os.path.dirname(os.path.abspath(item))
+             for item in inputs]
+    return os.path.commonpath(roots)
+
+
+class ExportWatcher:
+    """
+    Regenerates the outputs of changed DSL files
+
+    Args:
+        inputs: Files, directories (searched recursively) or glob patterns;
+            files matching them are picked up as they appear
+        formats: Output formats (see export.cli.FORMATS)
+        output_dir: Directory the outputs are written to
+        backend: Parser backend ('regex', 'tokenizer' or 'textx')
+        validate: Validate each parsed configuration and, when it has errors,
+            report the file as failed instead of writing its outputs
+
+    Files under output_dir are never treated as inputs, so the output
+    directory may sit inside a watched directory.
+    """
+
+    def __init__(self, inputs: Iterable[Union[str, Path]], formats: List[str], output_dir: str,
+                 backend: str = 'regex', pattern: str = '*.dsl', validate: bool = False):
+        self.inputs = [str(item) for item in inputs]
+        unknown = [fmt for fmt in formats if fmt not in FORMAT_EXTENSIONS]
+        if unknown:
+            raise ValueError(f"Unsupported format: {', '.join(unknown)}")
+        self.formats = list(formats)
+        self.output_dir = os.path.abspath(output_dir)
+        self.pattern = pattern
+        self.validate = validate
+        self.parser = create_parser(backend)
+        self.base_dir = _base_dir(self.inputs)
+        self.manifest_path = os.path.join(self.output_dir, MANIFEST_NAME)
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self._sources = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return manifest.get('sources', {}) if manifest.get('version') == MANIFEST_VERSION else {}
+
+    def _save_manifest(self) -> None:
+        data = json.dumps({'version': MANIFEST_VERSION, 'sources': self._sources}, indent=1, sort_keys=True)
+        _write_atomically(self.manifest_path, data.encode('utf-8'))
+
+    def output_path(self, source: str, format: str) -> str:
+        """Where the output of a source in a format is written"""
+        stem = os.path.splitext(os.path.relpath(source, self.base_dir))[0]
+        return os.path.join(self.output_dir, stem + FORMAT_EXTENSIONS[format])
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        for path in expand_paths(self.inputs, self.pattern):
+            path = os.path.abspath(path)
+            if os.path.commonpath([path, self.output_dir]) == self.output_dir:
+                continue  # Our own outputs
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def poll(self) -> WatchReport:
+        """Check the inputs once and bring the outputs of changed files up to date"""
+        report = WatchReport()
+        stats = self._scan()
+        changed = [path for path, stat in stats.items() if self._stats.get(path) != stat]
+        deleted = [path for path in self._sources if path not in stats]
+        self._stats = stats
+
+        dirty = False
+        for path in changed:
+            try:
+                dirty |= self._update(path, report)
+            except Exception as e:
+                report.failed.append((path, e))
+        for path in deleted:
+            self._remove(path, report)
+            dirty = True
+        if dirty:
+            self._save_manifest()
+        return report
+
+    def _update(self, path: str, report: WatchReport) -> bool:
+        """Regenerate the outputs of one source; True when the manifest changed"""
+        with open(path, 'rb') as f:
+            source_hash = _sha256(f.read())
+        entry = self._sources.get(path)
+        outputs = entry['outputs'] if entry else {}
+
+        def up_to_date(fmt: str) -> bool:
+            recorded = outputs.get(fmt)
+            return recorded is not None and _file_sha256(self.output_path(path, fmt)) == recorded
+
+        if entry and entry['source'] == source_hash and all(up_to_date(fmt) for fmt in self.formats):
+            report.unchanged += len(self.formats)  # Touched, not edited
+            return False
+
+        config = self.parser.parse_file(path)
+        report.parsed.append(path)
+        if self.validate:
+            errors = FundingModelValidator.validate_configuration(config)
+            if errors:
+                raise ValueError(f"Validation failed: {'; '.join(errors)}")
+        config_hash = _sha256(json.dumps(configuration_to_dict(config), sort_keys=True, default=str).encode('utf-8'))
+        same_config = entry is not None and entry['config'] == config_hash
+
+        new_outputs = dict(outputs)
+        for fmt in self.formats:
+            if same_config and up_to_date(fmt):
+                report.unchanged += 1
+                continue
+            target = self.output_path(path, fmt)
+            content = io.BytesIO()
+            write_funding_config(config, fmt, content)
+            data = content.getvalue()
+            content_hash = _sha256(data)
+            if _file_sha256(target) == content_hash:
+                report.unchanged += 1
+            else:
+                _write_atomically(target, data)
+                report.written.append(target)
+            new_outputs[fmt] = content_hash
+
+        self._sources[path] = {'source': source_hash, 'config': config_hash, 'outputs': new_outputs}
+        return True
+
+    def _remove(self, path: str, report: WatchReport) -> None:
+        for fmt, content_hash in self._sources.pop(path)['outputs'].items():
+            target = self.output_path(path, fmt)
+            if _file_sha256(target) == content_hash:  # Leave outputs edited by hand
+                os.unlink(target)
+                report.removed.append(target)
+
+    def watch(self, interval: float = 1.0, on_report: Optional[Callable[[WatchReport], None]] = None,
+              polls: Optional[int] = None) -> None:
+        """Poll every `interval` seconds (forever, or `polls` times), passing each report to on_report"""
+        count = 0
+        while polls is None or count < polls:
+            if count:
+                time.sleep(interval)
+            report = self.poll()
+            if on_report is not None:
+                on_report(report)
+            count += 1
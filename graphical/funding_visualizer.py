@@ -9,6 +9,11 @@ from metamodel.funding_metamodel import (
     FundingConfiguration, FundingSource, FundingPlatform, 
     Beneficiary, FundingTier, FundingGoal
 )
+from metamodel.instrumentation import configuration_entities, spanned
+
+
+def _visualized_entities(visualizer: "FundingVisualizer") -> int:
+    return configuration_entities(visualizer.config)
 
 
 class FundingVisualizer:
@@ -17,6 +22,7 @@ class FundingVisualizer:
     def __init__(self, config: FundingConfiguration):
         self.config = config
     
+    @spanned('visualize.mermaid_flowchart', entities=_visualized_entities)
     def generate_mermaid_flowchart(self) -> str:
         """
         Generate a Mermaid flowchart showing the funding flow structure
@@ -41,12 +47,9 @@ class FundingVisualizer:
         lines.append("")
         
         # Funding sources grouped by platform
-        platform_groups = {}
-        for source in self.config.get_active_sources():
-            platform = source.platform.value
-            if platform not in platform_groups:
-                platform_groups[platform] = []
-            platform_groups[platform].append(source)
+        platform_groups = {
+            platform.value: sources for platform, sources in self.config.sources_by_platform().items()
+        }
         
         # Platform nodes
         platform_nodes = []
@@ -105,6 +108,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @spanned('visualize.mermaid_pie_chart', entities=_visualized_entities)
     def generate_mermaid_pie_chart(self) -> str:
         """
         Generate a Mermaid pie chart showing funding source distribution
@@ -126,6 +130,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @spanned('visualize.mermaid_timeline', entities=_visualized_entities)
     def generate_mermaid_timeline(self) -> str:
         """
         Generate a Mermaid timeline showing funding goals progression
@@ -162,6 +167,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @spanned('visualize.mermaid_class_diagram', entities=_visualized_entities)
     def generate_mermaid_class_diagram(self) -> str:
         """
         Generate a Mermaid class diagram showing the funding structure
@@ -231,6 +237,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @spanned('visualize.ascii_overview', entities=_visualized_entities)
     def generate_ascii_overview(self) -> str:
         """
         Generate an ASCII art overview of the funding configuration
@@ -262,10 +269,10 @@ class FundingVisualizer:
         active_sources = self.config.get_active_sources()
         lines.append(f"║ 💰 Active Funding Sources: {len(active_sources):<35} ║")
         
-        platform_counts = {}
-        for source in active_sources:
-            platform = source.platform.value.replace('_', ' ').title()
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
+        platform_counts = {
+            platform.value.replace('_', ' ').title(): len(sources)
+            for platform, sources in self.config.sources_by_platform().items()
+        }
         
         for platform, count in list(platform_counts.items())[:5]:
             source_line = f"   • {platform}: {count} source{'s' if count > 1 else ''}"
@@ -307,6 +314,7 @@ class FundingVisualizer:
         
         return "\n".join(lines)
     
+    @spanned('visualize.funding_matrix', entities=_visualized_entities)
     def generate_funding_matrix(self) -> str:
         """
         Generate a matrix showing the relationship between beneficiaries and funding sources
@@ -326,12 +334,10 @@ class FundingVisualizer:
         lines.append("-" * len(header))
         
         # Group sources by platform
-        platform_groups = {}
-        for source in self.config.get_active_sources():
-            platform = source.platform.value.replace('_', ' ').title()
-            if platform not in platform_groups:
-                platform_groups[platform] = []
-            platform_groups[platform].append(source)
+        platform_groups = {
+            platform.value.replace('_', ' ').title(): sources
+            for platform, sources in self.config.sources_by_platform().items()
+        }
         
         # Show relationship (simplified - all active sources benefit all beneficiaries)
         for platform, sources in platform_groups.items():
@@ -16,6 +16,7 @@ from metamodel.funding_metamodel import (
     FundingGoal, FundingAmount, FundingPlatform, FundingType, 
     CurrencyType, FundingModelValidator
 )
+from textual.dsl_serializer import serialize_dsl
 
 
 class ImprovedVisualElement:
@@ -1159,107 +1160,7 @@ class ImprovedGraphicalFundingEditor:
     
     def configuration_to_textual_dsl(self, config: FundingConfiguration) -> str:
         """Convert FundingConfiguration to textual DSL format"""
-        lines = []
-        
-        # Header comment
-        lines.append("// Funding configuration exported from enhanced graphical editor")
-        lines.append("")
-        
-        # Main funding block
-        lines.append(f'funding "{config.project_name}" {{')
-        
-        # Description
-        if config.description:
-            lines.append(f'    description "{config.description}"')
-        
-        # Currency
-        lines.append(f'    currency {config.preferred_currency.value}')
-        
-        # Amount limits (if set)
-        if hasattr(config, 'min_amount') and config.min_amount:
-            lines.append(f'    min_amount {config.min_amount.amount}')
-        if hasattr(config, 'max_amount') and config.max_amount:
-            lines.append(f'    max_amount {config.max_amount.amount}')
-        
-        lines.append("")
-        
-        # Beneficiaries
-        if config.beneficiaries:
-            lines.append("    beneficiaries {")
-            for ben in config.beneficiaries:
-                lines.append(f'        beneficiary "{ben.name}" {{')
-                if ben.email:
-                    lines.append(f'            email "{ben.email}"')
-                if ben.github_username:
-                    lines.append(f'            github "{ben.github_username}"')
-                if ben.website:
-                    lines.append(f'            website "{ben.website}"')
-                if ben.description:
-                    lines.append(f'            description "{ben.description}"')
-                lines.append("        }")
-                lines.append("")
-            lines.append("    }")
-            lines.append("")
-        
-        # Funding sources
-        if config.funding_sources:
-            lines.append("    sources {")
-            for source in config.funding_sources:
-                platform_name = source.platform.value.lower()
-                lines.append(f'        {platform_name} "{source.username}" {{')
-                lines.append(f'            type {source.funding_type.value}')
-                lines.append(f'            active {str(source.is_active).lower()}')
-                if source.custom_url:
-                    lines.append(f'            url "{source.custom_url}"')
-                if source.platform_specific_config:
-                    lines.append("            config {")
-                    for key, value in source.platform_specific_config.items():
-                        lines.append(f'                "{key}" "{value}"')
-                    lines.append("            }")
-                lines.append("        }")
-                lines.append("")
-            lines.append("    }")
-            lines.append("")
-        
-        # Tiers
-        if config.tiers:
-            lines.append("    tiers {")
-            for tier in config.tiers:
-                lines.append(f'        tier "{tier.name}" {{')
-                lines.append(f'            amount {tier.amount.amount} {tier.amount.currency.value}')
-                if tier.description:
-                    lines.append(f'            description "{tier.description}"')
-                if tier.max_sponsors:
-                    lines.append(f'            max_sponsors {tier.max_sponsors}')
-                if tier.benefits:
-                    lines.append("            benefits [")
-                    for benefit in tier.benefits:
-                        lines.append(f'                "{benefit}",')
-                    lines.append("            ]")
-                lines.append("        }")
-                lines.append("")
-            lines.append("    }")
-            lines.append("")
-        
-        # Goals
-        if config.goals:
-            lines.append("    goals {")
-            for goal in config.goals:
-                lines.append(f'        goal "{goal.name}" {{')
-                lines.append(f'            target {goal.target_amount.amount} {goal.target_amount.currency.value}')
-                lines.append(f'            current {goal.current_amount.amount} {goal.current_amount.currency.value}')
-                if goal.description:
-                    lines.append(f'            description "{goal.description}"')
-                if goal.deadline:
-                    lines.append(f'            deadline "{goal.deadline.strftime("%Y-%m-%d")}"')
-                lines.append("        }")
-                lines.append("")
-            lines.append("    }")
-            lines.append("")
-        
-        lines.append("}")
-        
-        return "\n".join(lines)
+        return serialize_dsl(config, header="Funding configuration exported from enhanced graphical editor")
     
     def configuration_to_yaml(self, config: FundingConfiguration) -> str:
         """Convert FundingConfiguration to YAML format"""
@@ -45,24 +45,34 @@ class InteractiveDiagramGenerator:
         """
         return self.visualizer.generate_ascii_overview()
     
-    def analyze_configuration(self) -> Dict[str, Any]:
+    def analyze_configuration(self, converter=None) -> Dict[str, Any]:
         """
         Analyze the configuration and return key metrics for visualization
+        
+        Args:
+            converter: Optional CurrencyConverter; when given, goal totals and
+                tier prices are normalized to the preferred currency instead of
+                summing raw values across currencies
         """
         active_sources = self.config.get_active_sources()
         active_tiers = self.config.get_active_tiers()
+        currency = self.config.preferred_currency
         
         # Platform analysis
-        platform_counts = {}
-        for source in active_sources:
-            platform = source.platform.value.replace('_', ' ').title()
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
+        platform_counts = {
+            platform.value.replace('_', ' ').title(): len(sources)
+            for platform, sources in self.config.sources_by_platform().items()
+        }
         
         # Goal analysis
         goal_analysis = {}
         if self.config.goals:
-            total_target = sum(goal.target_amount.value for goal in self.config.goals)
-            total_current = sum(goal.current_amount.value for goal in self.config.goals)
+            if converter:
+                total_target = converter.total([g.target_amount for g in self.config.goals], currency).value
+                total_current = converter.total([g.current_amount for g in self.config.goals], currency).value
+            else:
+                total_target = sum(goal.target_amount.value for goal in self.config.goals)
+                total_current = sum(goal.current_amount.value for goal in self.config.goals)
             overall_progress = (total_current / total_target * 100) if total_target > 0 else 0
             
             goal_analysis = {
@@ -76,7 +86,10 @@ class InteractiveDiagramGenerator:
         # Tier analysis
         tier_analysis = {}
         if active_tiers:
-            tier_prices = [tier.amount.value for tier in active_tiers]
+            if converter:
+                tier_prices = converter.convert_amounts([tier.amount for tier in active_tiers], currency)
+            else:
+                tier_prices = [tier.amount.value for tier in active_tiers]
             tier_analysis = {
                 "total_tiers": len(active_tiers),
                 "min_tier_price": min(tier_prices),
@@ -92,6 +105,7 @@ class InteractiveDiagramGenerator:
             "platform_distribution": platform_counts,
             "goal_analysis": goal_analysis,
             "tier_analysis": tier_analysis,
+            "currency": currency.value if converter else None,
             "has_github_sponsors": any(s.platform.value == 'github_sponsors' for s in active_sources),
             "has_recurring_funding": any(s.funding_type.value == 'recurring' for s in active_sources),
             "has_one_time_funding": any(s.funding_type.value == 'one_time' for s in active_sources)
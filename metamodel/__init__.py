@@ -16,7 +16,31 @@ from .funding_metamodel import (
     FundingType,
     CurrencyType,
     FundingModelVisitor,
-    FundingModelValidator
+    FundingModelValidator,
+    IncrementalValidator,
+    ValidationRule
+)
+from .serialization import (
+    configuration_to_dict,
+    configuration_from_dict
+)
+from .compact import (
+    CompactBuilder,
+    compact_configuration
+)
+from .funding_catalog import FundingCatalog
+from .currency import RateTable, CurrencyConverter
+from .money import CentsAmount, sum_amounts
+from .batch_validation import validate_many, ValidationErrorTable
+from .instrumentation import (
+    Instrumentation,
+    SpanRecord,
+    StatsSink,
+    JSONLinesSink,
+    PrometheusTextSink,
+    instrumented,
+    set_instrumentation,
+    span
 )
 
 __all__ = [
@@ -30,5 +54,26 @@ __all__ = [
     'FundingType',
     'CurrencyType',
     'FundingModelVisitor',
-    'FundingModelValidator'
+    'FundingModelValidator',
+    'IncrementalValidator',
+    'ValidationRule',
+    'configuration_to_dict',
+    'configuration_from_dict',
+    'CompactBuilder',
+    'compact_configuration',
+    'FundingCatalog',
+    'RateTable',
+    'CurrencyConverter',
+    'CentsAmount',
+    'sum_amounts',
+    'validate_many',
+    'ValidationErrorTable',
+    'Instrumentation',
+    'SpanRecord',
+    'StatsSink',
+    'JSONLinesSink',
+    'PrometheusTextSink',
+    'instrumented',
+    'set_instrumentation',
+    'span'
 ] 
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Batch Validation - Run FundingModelValidator rules over many configurations.
+
+validate_many() runs the compiled validation rules over a whole list of
+configurations and collects the errors in a ValidationErrorTable: one row
+per error with integer config / entity / position / rule columns, rather
+than a list of strings per configuration.
+
+With workers > 1 the configurations are split into index ranges over a
+process pool. Under the fork start method the workers read the parent's
+list directly, so only the ranges and the (few) error rows cross process
+boundaries; otherwise each chunk of configurations is pickled to its worker.
+"""
+
+import multiprocessing
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .funding_metamodel import FundingConfiguration, FundingPlatform, FundingModelValidator, VALIDATION_ENTITIES
+from .instrumentation import span
+
+
+# (config, entity code, position, rule, message); entity codes index
+# VALIDATION_ENTITIES and position is -1 except for source rules
+ErrorRow = Tuple[int, int, int, int, str]
+
+# Configurations shared with forked workers by validate_many
+_forked_configs: Optional[Sequence[FundingConfiguration]] = None
+
+
+class ValidationError(NamedTuple):
+    """One row of a ValidationErrorTable"""
+    config: int
+    entity: str
+    position: int
+    rule: str
+    message: str
+
+
+class ValidationErrorTable:
+    """Validation errors of many configurations, stored as columns ordered by config"""
+
+    def __init__(self, rule_names: Sequence[str]):
+        self.rule_names = list(rule_names)
+        self.columns: Dict[str, array] = {
+            'config': array('l'), 'entity': array('B'), 'position': array('l'), 'rule': array('H')
+        }
+        self.messages: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def __iter__(self) -> Iterator[ValidationError]:
+        c = self.columns
+        for row in range(len(self.messages)):
+            yield ValidationError(c['config'][row], VALIDATION_ENTITIES[c['entity'][row]], c['position'][row],
+                                  self.rule_names[c['rule'][row]], self.messages[row])
+
+    def extend(self, rows: Iterable[ErrorRow]) -> None:
+        """Append error rows (configs must not go backwards)"""
+        c = self.columns
+        for config, entity, position, rule, message in rows:
+            c['config'].append(config)
+            c['entity'].append(entity)
+            c['position'].append(position)
+            c['rule'].append(rule)
+            self.messages.append(message)
+
+    def messages_for(self, config: int) -> List[str]:
+        """Error messages of one configuration, as validate_configuration returns them"""
+        configs = self.columns['config']
+        return self.messages[bisect_left(configs, config):bisect_right(configs, config)]
+
+    def invalid_configs(self) -> List[int]:
+        """Indexes of the configurations with at least one error"""
+        return sorted(set(self.columns['config']))
+
+    def counts_by_rule(self) -> Dict[str, int]:
+        """Number of errors per rule name"""
+        counts: Dict[str, int] = {}
+        for rule in self.columns['rule']:
+            name = self.rule_names[rule]
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
+
+def _plan(validator: type) -> Dict[Any, Any]:
+    """Rules as (rule index, check) pairs per entity type, sources per platform"""
+    rules = list(enumerate(validator.rules))
+    plan = {entity: tuple((index, r.check) for index, r in rules if r.entity == entity)
+            for entity in VALIDATION_ENTITIES if entity != 'source'}
+    plan['source'] = {
+        platform: tuple((index, r.check) for index, r in rules
+                        if r.entity == 'source' and (r.platforms is None or platform in r.platforms))
+        for platform in FundingPlatform
+    }
+    return plan
+
+
+def _error_rows(validator: type, start: int, configs: Sequence[FundingConfiguration]) -> List[ErrorRow]:
+    """Validate configurations numbered from `start`, in validate_configuration's order"""
+    plan = _plan(validator)
+    config_checks, source_checks = plan['configuration'], plan['source']
+    tier_checks, goal_checks = plan['tiers'], plan['goals']
+    rows = []
+    for index, config in enumerate(configs, start):
+        for rule, check in config_checks:
+            error = check(config)
+            if error:
+                rows.append((index, 0, -1, rule, error))
+        for position, source in enumerate(config.funding_sources):
+            for rule, check in source_checks[source.platform]:
+                error = check(source)
+                if error:
+                    rows.append((index, 1, position, rule, error))
+        for rule, check in tier_checks:
+            error = check(config.tiers)
+            if error:
+                rows.append((index, 2, -1, rule, error))
+        for rule, check in goal_checks:
+            error = check(config.goals)
+            if error:
+                rows.append((index, 3, -1, rule, error))
+    return rows
+
+
+def _forked_range_rows(validator: type, bounds: Tuple[int, int]) -> List[ErrorRow]:
+    start, stop = bounds
+    return _error_rows(validator, start, _forked_configs[start:stop])
+
+
+def _chunk_rows(validator: type, chunk: Tuple[int, List[FundingConfiguration]]) -> List[ErrorRow]:
+    start, configs = chunk
+    return _error_rows(validator, start, configs)
+
+
+def validate_many(configs: Iterable[FundingConfiguration], workers: Optional[int] = 1,
+                  validator: type = FundingModelValidator) -> ValidationErrorTable:
+    """
+    Validate many configurations into one error table
+
+    Args:
+        configs: Configurations; their position is the table's config id
+        workers: Worker processes (None: CPU count); 1 validates in-process.
+            Rules registered at runtime reach the workers only under the
+            fork start method.
+        validator: Validator class whose rules are run
+
+    Returns:
+        ValidationErrorTable where messages_for(i) equals
+        validator.validate_configuration(configs[i])
+    """
+    configs = configs if isinstance(configs, list) else list(configs)
+    workers = min(workers or os.cpu_count() or 1, max(len(configs), 1))
+    with span('validate.batch', len(configs), workers=workers):
+        return _validate_many(configs, workers, validator)
+
+
+def _validate_many(configs: List[FundingConfiguration], workers: int, validator: type) -> ValidationErrorTable:
+    global _forked_configs
+    table = ValidationErrorTable([rule.name for rule in validator.rules])
+    if workers == 1:
+        table.extend(_error_rows(validator, 0, configs))
+        return table
+
+    size = -(-len(configs) // (workers * 4))
+    bounds = [(start, min(start + size, len(configs))) for start in range(0, len(configs), size)]
+    if multiprocessing.get_start_method() == 'fork':
+        _forked_configs = configs
+        task, chunks = partial(_forked_range_rows, validator), bounds
+    else:
+        task, chunks = partial(_chunk_rows, validator), [(start, configs[start:stop]) for start, stop in bounds]
+    try:
+        with multiprocessing.Pool(workers) as pool:
+            for rows in pool.imap(task, chunks):
+                table.extend(rows)
+    finally:
+        _forked_configs = None
+    return table
@@ -0,0 +1,169 @@
+"""
+Compact Funding Model - Slotted variants of the metamodel entity classes.
+
+The regular metamodel dataclasses carry a per-instance __dict__, and every
+goal allocates its own FundingAmount(0). When whole-organisation catalogs are
+held in memory that overhead dominates, so this module derives __slots__
+variants of FundingAmount, Beneficiary, FundingSource, FundingTier and
+FundingGoal - optionally frozen - with the same fields, defaults and methods.
+
+compact_configuration() converts a configuration to these classes, interning
+repeated strings and, for frozen variants, sharing equal FundingAmount
+instances. Exporters, validators and serialization accept the result as-is.
+"""
+
+import sys
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Dict, Optional, Tuple
+
+from .funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, CurrencyType
+)
+from .money import CentsAmount
+
+
+# Methods and properties carried over from the regular classes
+_COPIED_ATTRIBUTES = ('__str__', 'progress_percentage')
+
+
+def _compact_class(cls: type, frozen: bool, overrides: Optional[Dict[str, object]] = None) -> type:
+    """Derive a slotted dataclass with the fields, defaults and methods of cls"""
+    overrides = overrides or {}
+    specs = []
+    for f in fields(cls):
+        if f.name in overrides:
+            specs.append((f.name, f.type, overrides[f.name]))
+        elif f.default is not MISSING:
+            specs.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            specs.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            specs.append((f.name, f.type))
+    namespace = {name: value for name, value in vars(cls).items() if name in _COPIED_ATTRIBUTES}
+    prefix = 'Frozen' if frozen else 'Slotted'
+    compact = make_dataclass(f"{prefix}{cls.__name__}", specs, namespace=namespace, slots=True, frozen=frozen)
+    compact.__module__ = __name__
+    compact.__doc__ = f"Slotted{' frozen' if frozen else ''} variant of {cls.__name__}"
+    return compact
+
+
+SlottedFundingAmount = _compact_class(FundingAmount, frozen=False)
+SlottedBeneficiary = _compact_class(Beneficiary, frozen=False)
+SlottedFundingSource = _compact_class(FundingSource, frozen=False)
+SlottedFundingTier = _compact_class(FundingTier, frozen=False)
+SlottedFundingGoal = _compact_class(FundingGoal, frozen=False, overrides={
+    'current_amount': field(default_factory=lambda: SlottedFundingAmount(0))
+})
+
+FrozenFundingAmount = _compact_class(FundingAmount, frozen=True)
+ZERO_AMOUNT = FrozenFundingAmount(0)
+FrozenBeneficiary = _compact_class(Beneficiary, frozen=True)
+FrozenFundingSource = _compact_class(FundingSource, frozen=True)
+FrozenFundingTier = _compact_class(FundingTier, frozen=True)
+# Frozen amounts are immutable, so every goal can share one zero
+FrozenFundingGoal = _compact_class(FundingGoal, frozen=True, overrides={
+    'current_amount': field(default=ZERO_AMOUNT)
+})
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+class CompactBuilder:
+    """
+    Converts configurations to slotted entities, sharing values across them
+
+    Reuse one builder for a whole catalog so that repeated strings and
+    (frozen) amounts are stored once for all configurations.
+    """
+
+    def __init__(self, frozen: bool = False):
+        self.frozen = frozen
+        if frozen:
+            self.amount_class, self.beneficiary_class = FrozenFundingAmount, FrozenBeneficiary
+            self.source_class, self.tier_class, self.goal_class = FrozenFundingSource, FrozenFundingTier, FrozenFundingGoal
+        else:
+            self.amount_class, self.beneficiary_class = SlottedFundingAmount, SlottedBeneficiary
+            self.source_class, self.tier_class, self.goal_class = SlottedFundingSource, SlottedFundingTier, SlottedFundingGoal
+        self._amounts: Dict[Tuple[float, CurrencyType], object] = {}
+        self._cents: Dict[Tuple[int, CurrencyType], CentsAmount] = {}
+
+    def amount(self, amount: Optional[FundingAmount]):
+        """
+        Convert an amount; frozen amounts with equal value and currency are shared
+
+        CentsAmount values (money='cents') are immutable and exact, so they are
+        kept as they are rather than turned into float amounts - shared when
+        frozen, like the other amounts.
+        """
+        if amount is None:
+            return None
+        if isinstance(amount, CentsAmount):
+            if not self.frozen:
+                return amount
+            return self._cents.setdefault((amount.cents, amount.currency), amount)
+        if not self.frozen:
+            return self.amount_class(amount.value, amount.currency)
+        key = (amount.value, amount.currency)
+        shared = self._amounts.get(key)
+        if shared is None:
+            shared = self._amounts[key] = self.amount_class(amount.value, amount.currency)
+        return shared
+
+    def configuration(self, config: FundingConfiguration) -> FundingConfiguration:
+        """Return a copy of config whose entities are slotted variants"""
+        compact = FundingConfiguration(
+            project_name=_intern(config.project_name),
+            description=config.description,
+            preferred_currency=config.preferred_currency,
+            min_amount=self.amount(config.min_amount),
+            max_amount=self.amount(config.max_amount)
+        )
+
+        for b in config.beneficiaries:
+            compact.add_beneficiary(self.beneficiary_class(
+                name=_intern(b.name),
+                email=b.email,
+                github_username=_intern(b.github_username),
+                website=b.website,
+                description=b.description
+            ))
+
+        for s in config.funding_sources:
+            compact.add_funding_source(self.source_class(
+                platform=s.platform,
+                username=_intern(s.username),
+                funding_type=s.funding_type,
+                is_active=s.is_active,
+                custom_url=s.custom_url,
+                platform_specific_config=dict(s.platform_specific_config)
+            ))
+
+        for t in config.tiers:
+            compact.add_tier(self.tier_class(
+                name=_intern(t.name),
+                amount=self.amount(t.amount),
+                description=t.description,
+                benefits=[_intern(benefit) for benefit in t.benefits],
+                max_sponsors=t.max_sponsors,
+                is_active=t.is_active
+            ))
+
+        for g in config.goals:
+            compact.add_goal(self.goal_class(
+                name=_intern(g.name),
+                target_amount=self.amount(g.target_amount),
+                description=g.description,
+                deadline=g.deadline,
+                current_amount=self.amount(g.current_amount),
+                is_reached=g.is_reached
+            ))
+
+        return compact
+
+
+def compact_configuration(config: FundingConfiguration, frozen: bool = False) -> FundingConfiguration:
+    """Convert one configuration to slotted (optionally frozen) entities"""
+    return CompactBuilder(frozen).configuration(config)
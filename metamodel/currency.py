@@ -0,0 +1,150 @@
+"""
+Currency Normalization - Convert amounts between currencies from a local rate table.
+
+Rates are read from a JSON file (no network access):
+
+    {"base": "USD", "as_of": "2026-01-01", "rates": {"USD": 1.0, "EUR": 0.92, ...}}
+
+where each rate is the number of currency units per one unit of the base.
+Conversion factors are derived once per (rate table content, target
+currency) and cached for the process, so converting a whole column of
+amounts is a single multiply by a per-currency factor lookup - vectorized
+with NumPy when the input is a NumPy array.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from .funding_metamodel import FundingAmount, FundingGoal, CurrencyType
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+DEFAULT_RATES_FILE = Path(os.environ.get(
+    'FUNDING_DSL_RATES_FILE', Path(__file__).parent / 'default_rates.json'
+))
+
+# Currency codes in the same order as FundingCatalog's currency columns
+CURRENCY_CODES: List[CurrencyType] = list(CurrencyType)
+
+# (rate table digest, target currency) -> factor per currency code
+_factor_cache: Dict[tuple, List[float]] = {}
+_factor_cache_lock = threading.Lock()
+
+
+class RateTable:
+    """Exchange rates relative to a base currency"""
+
+    def __init__(self, rates: Dict[CurrencyType, float], base: CurrencyType = CurrencyType.USD,
+                 as_of: Optional[str] = None):
+        if rates.get(base) != 1.0:
+            raise ValueError(f"Rate of the base currency {base.value} must be 1.0")
+        for currency, rate in rates.items():
+            if not rate > 0:
+                raise ValueError(f"Rate for {currency.value} must be positive")
+        self.rates = dict(rates)
+        self.base = base
+        self.as_of = as_of
+        canonical = json.dumps(sorted((c.value, r) for c, r in self.rates.items()))
+        self.digest = hashlib.sha256(f"{base.value}:{canonical}".encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path, None] = None) -> "RateTable":
+        """Load a rate table from a JSON file (default: the bundled table)"""
+        with open(path or DEFAULT_RATES_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        try:
+            rates = {CurrencyType(code): float(rate) for code, rate in data['rates'].items()}
+            base = CurrencyType(data.get('base', 'USD'))
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Invalid rate table {path or DEFAULT_RATES_FILE}: {e}") from e
+        return cls(rates, base, data.get('as_of'))
+
+    def rate(self, currency: CurrencyType) -> float:
+        """Units of currency per one unit of the base currency"""
+        try:
+            return self.rates[currency]
+        except KeyError:
+            raise ValueError(f"No rate for {currency.value} in rate table") from None
+
+
+class CurrencyConverter:
+    """Converts single amounts and whole columns of amounts to a target currency"""
+
+    def __init__(self, rate_table: Optional[RateTable] = None):
+        self.rate_table = rate_table or RateTable.from_file()
+
+    def factors(self, to: CurrencyType) -> List[float]:
+        """Multiplier from each currency (indexed by CURRENCY_CODES position) to `to`"""
+        key = (self.rate_table.digest, to)
+        factors = _factor_cache.get(key)
+        if factors is None:
+            target_rate = self.rate_table.rate(to)
+            factors = [
+                target_rate / self.rate_table.rates[currency] if currency in self.rate_table.rates else float('nan')
+                for currency in CURRENCY_CODES
+            ]
+            with _factor_cache_lock:
+                _factor_cache[key] = factors
+        return factors
+
+    def factor(self, source: CurrencyType, to: CurrencyType) -> float:
+        """Multiplier converting one unit of source into `to`"""
+        if source == to:
+            return 1.0
+        self.rate_table.rate(source)  # Raise for currencies missing from the table
+        return self.factors(to)[CURRENCY_CODES.index(source)]
+
+    def convert(self, amount: FundingAmount, to: CurrencyType) -> FundingAmount:
+        """Convert one amount"""
+        if amount.currency == to:
+            return amount
+        return FundingAmount(amount.value * self.factor(amount.currency, to), to)
+
+    def convert_values(self, values: Sequence[float], currency_codes: Sequence[int], to: CurrencyType):
+        """
+        Convert a column of values whose currencies are given as CURRENCY_CODES positions
+
+        NumPy inputs are converted in one vectorized operation and return a NumPy
+        array; other sequences return a list.
+        """
+        factors = self.factors(to)
+        if NUMPY_AVAILABLE and isinstance(values, np.ndarray):
+            converted = np.asarray(values, dtype=float) * np.asarray(factors)[np.asarray(currency_codes, dtype=np.intp)]
+            if np.isnan(converted).any():
+                raise ValueError("Rate table has no rate for some of the currencies")
+            return converted
+        converted = [value * factors[code] for value, code in zip(values, currency_codes)]
+        if any(value != value for value in converted):
+            raise ValueError("Rate table has no rate for some of the currencies")
+        return converted
+
+    def convert_amounts(self, amounts: Sequence[FundingAmount], to: CurrencyType) -> List[float]:
+        """Convert many FundingAmount objects to plain values in `to`"""
+        index = {currency: code for code, currency in enumerate(CURRENCY_CODES)}
+        return self.convert_values([a.value for a in amounts], [index[a.currency] for a in amounts], to)
+
+    def total(self, amounts: Sequence[FundingAmount], to: CurrencyType) -> FundingAmount:
+        """Sum amounts in mixed currencies as one amount in `to`"""
+        return FundingAmount(sum(self.convert_amounts(amounts, to)), to)
+
+    def goal_progress(self, goal: FundingGoal) -> float:
+        """Progress percentage with the current amount converted to the target's currency"""
+        if goal.target_amount.value == 0:
+            return 0.0
+        current = self.convert(goal.current_amount, goal.target_amount.currency).value
+        return min(current / goal.target_amount.value * 100, 100.0)
+
+
+def clear_factor_cache() -> None:
+    """Forget every cached conversion factor"""
+    with _factor_cache_lock:
+        _factor_cache.clear()
@@ -0,0 +1,228 @@
+"""
+Funding Catalog - Columnar storage and aggregations over many configurations.
+
+A FundingCatalog ingests FundingConfiguration objects into flat typed
+columns (one array per attribute, with enums stored as small integer codes)
+so that fleet-wide questions - totals per currency, tier price percentiles,
+platform distribution, goals at risk - are answered by a single pass over
+packed arrays instead of walking object graphs.
+
+Columns are stdlib array.array buffers. When NumPy is installed they are
+viewed without copying as NumPy arrays and every aggregation is vectorized;
+without NumPy the same results are computed in pure Python.
+"""
+
+import math
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .funding_metamodel import FundingConfiguration, FundingPlatform, FundingType, CurrencyType
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Enum members by integer code, in declaration order
+PLATFORM_CODES: List[FundingPlatform] = list(FundingPlatform)
+FUNDING_TYPE_CODES: List[FundingType] = list(FundingType)
+CURRENCY_CODES: List[CurrencyType] = list(CurrencyType)
+
+_PLATFORM_INDEX = {platform: code for code, platform in enumerate(PLATFORM_CODES)}
+_FUNDING_TYPE_INDEX = {funding_type: code for code, funding_type in enumerate(FUNDING_TYPE_CODES)}
+_CURRENCY_INDEX = {currency: code for code, currency in enumerate(CURRENCY_CODES)}
+
+# Typecode of every column; *_config columns hold the owning configuration's row.
+# goal_current is assumed to be in goal_currency, the target's currency, as
+# FundingGoal.progress_percentage also assumes.
+COLUMN_TYPES = {
+    'source_config': 'l', 'source_platform': 'B', 'source_type': 'B', 'source_active': 'B',
+    'tier_config': 'l', 'tier_amount': 'd', 'tier_currency': 'B', 'tier_active': 'B',
+    'goal_config': 'l', 'goal_target': 'd', 'goal_current': 'd', 'goal_currency': 'B',
+    'goal_deadline': 'd', 'goal_reached': 'B'
+}
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linear-interpolation percentile, matching numpy.percentile's default"""
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+class FundingCatalog:
+    """Columnar store of many funding configurations"""
+
+    def __init__(self, configs: Iterable[FundingConfiguration] = ()):
+        self.project_names: List[str] = []
+        self.goal_names: List[str] = []
+        self.columns: Dict[str, array] = {name: array(typecode) for name, typecode in COLUMN_TYPES.items()}
+        self.extend(configs)
+
+    def __len__(self) -> int:
+        return len(self.project_names)
+
+    def add(self, config: FundingConfiguration) -> None:
+        """Append one configuration's entities to the columns"""
+        row = len(self.project_names)
+        self.project_names.append(config.project_name)
+        c = self.columns
+
+        for source in config.funding_sources:
+            c['source_config'].append(row)
+            c['source_platform'].append(_PLATFORM_INDEX[source.platform])
+            c['source_type'].append(_FUNDING_TYPE_INDEX[source.funding_type])
+            c['source_active'].append(bool(source.is_active))
+
+        for tier in config.tiers:
+            c['tier_config'].append(row)
+            c['tier_amount'].append(tier.amount.value)
+            c['tier_currency'].append(_CURRENCY_INDEX[tier.amount.currency])
+            c['tier_active'].append(bool(tier.is_active))
+
+        for goal in config.goals:
+            self.goal_names.append(goal.name)
+            c['goal_config'].append(row)
+            c['goal_target'].append(goal.target_amount.value)
+            c['goal_current'].append(goal.current_amount.value)
+            c['goal_currency'].append(_CURRENCY_INDEX[goal.target_amount.currency])
+            c['goal_deadline'].append(goal.deadline.timestamp() if goal.deadline else math.nan)
+            c['goal_reached'].append(bool(goal.is_reached))
+
+    def extend(self, configs: Iterable[FundingConfiguration]) -> None:
+        """Append many configurations"""
+        for config in configs:
+            self.add(config)
+
+    def column(self, name: str):
+        """Return a column as a NumPy array (zero-copy) when available, else the array.array"""
+        data = self.columns[name]
+        if NUMPY_AVAILABLE:
+            return np.frombuffer(data, dtype=data.typecode) if len(data) else np.array([], dtype=data.typecode)
+        return data
+
+    def platform_distribution(self, active_only: bool = True) -> Dict[FundingPlatform, int]:
+        """Count funding sources per platform across the catalog"""
+        platforms = self.column('source_platform')
+        active = self.column('source_active')
+        if NUMPY_AVAILABLE:
+            if active_only:
+                platforms = platforms[active.astype(bool)]
+            counts = np.bincount(platforms, minlength=len(PLATFORM_CODES)).tolist()
+        else:
+            counts = [0] * len(PLATFORM_CODES)
+            for code, is_active in zip(platforms, active):
+                if is_active or not active_only:
+                    counts[code] += 1
+        return {PLATFORM_CODES[code]: count for code, count in enumerate(counts) if count}
+
+    def total_targets_by_currency(self, include_reached: bool = True) -> Dict[CurrencyType, float]:
+        """Sum goal target amounts per currency"""
+        targets = self.column('goal_target')
+        currencies = self.column('goal_currency')
+        reached = self.column('goal_reached')
+        if NUMPY_AVAILABLE:
+            if not include_reached:
+                keep = ~reached.astype(bool)
+                targets, currencies = targets[keep], currencies[keep]
+            totals = np.bincount(currencies, weights=targets, minlength=len(CURRENCY_CODES)).tolist()
+            present = np.bincount(currencies, minlength=len(CURRENCY_CODES)).tolist()
+        else:
+            totals = [0.0] * len(CURRENCY_CODES)
+            present = [0] * len(CURRENCY_CODES)
+            for target, code, is_reached in zip(targets, currencies, reached):
+                if include_reached or not is_reached:
+                    totals[code] += target
+                    present[code] += 1
+        return {CURRENCY_CODES[code]: total for code, total in enumerate(totals) if present[code]}
+
+    def total_targets(self, to: CurrencyType, converter, include_reached: bool = True) -> float:
+        """Sum every goal target converted to one currency with a CurrencyConverter"""
+        targets = converter.convert_values(self.column('goal_target'), self.column('goal_currency'), to)
+        reached = self.column('goal_reached')
+        if NUMPY_AVAILABLE:
+            return float(targets.sum() if include_reached else targets[~reached.astype(bool)].sum())
+        return sum(target for target, is_reached in zip(targets, reached) if include_reached or not is_reached)
+
+    def tier_price_percentiles(self, percentiles: Sequence[float] = (25, 50, 75, 90),
+                               currency: Optional[CurrencyType] = None,
+                               active_only: bool = True,
+                               normalize_to: Optional[CurrencyType] = None,
+                               converter=None) -> Dict[float, float]:
+        """
+        Tier price percentiles (linear interpolation)
+
+        Prices are either filtered to one `currency`, or - with `normalize_to`
+        and a CurrencyConverter - all converted to that currency first.
+        """
+        amounts = self.column('tier_amount')
+        currencies = self.column('tier_currency')
+        active = self.column('tier_active')
+        if normalize_to is not None:
+            if converter is None:
+                raise ValueError("normalize_to requires a converter")
+            amounts = converter.convert_values(amounts, currencies, normalize_to)
+        currency_code = _CURRENCY_INDEX[currency] if currency else None
+        if NUMPY_AVAILABLE:
+            keep = np.ones(len(amounts), dtype=bool)
+            if active_only:
+                keep &= active.astype(bool)
+            if currency_code is not None:
+                keep &= currencies == currency_code
+            selected = amounts[keep]
+            if not len(selected):
+                return {}
+            return dict(zip(percentiles, np.percentile(selected, list(percentiles)).tolist()))
+
+        selected = sorted(
+            amount for amount, code, is_active in zip(amounts, currencies, active)
+            if (is_active or not active_only) and (currency_code is None or code == currency_code)
+        )
+        if not selected:
+            return {}
+        return {q: _percentile(selected, q) for q in percentiles}
+
+    def goals_at_risk(self, within: timedelta = timedelta(days=30), min_progress: float = 100.0,
+                      now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Unreached goals due within `within` from now (or overdue) and below min_progress percent
+
+        Returns:
+            One dict per goal (project_name, goal_name, deadline, progress_percentage), soonest first
+        """
+        limit = ((now or datetime.now()) + within).timestamp()
+        targets = self.column('goal_target')
+        currents = self.column('goal_current')
+        deadlines = self.column('goal_deadline')
+        reached = self.column('goal_reached')
+        configs = self.column('goal_config')
+
+        if NUMPY_AVAILABLE:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                progress = np.where(targets > 0, np.minimum(currents / targets * 100, 100.0), 0.0)
+            mask = ~reached.astype(bool) & (deadlines <= limit) & (progress < min_progress)
+            rows = np.nonzero(mask)[0]
+            rows = rows[np.argsort(deadlines[rows], kind='stable')].tolist()
+            progress = progress.tolist()
+        else:
+            progress = [min(current / target * 100, 100.0) if target > 0 else 0.0
+                        for current, target in zip(currents, targets)]
+            rows = sorted(
+                (row for row in range(len(deadlines))
+                 if not reached[row] and deadlines[row] <= limit and progress[row] < min_progress),
+                key=lambda row: deadlines[row]
+            )
+
+        return [
+            {
+                'project_name': self.project_names[configs[row]],
+                'goal_name': self.goal_names[row],
+                'deadline': datetime.fromtimestamp(deadlines[row]),
+                'progress_percentage': progress[row]
+            }
+            for row in rows
+        ]
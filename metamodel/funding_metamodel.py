@@ -3,12 +3,15 @@ Funding DSL Metamodel - Abstract Syntax Tree Classes
 Represents the core concepts and relationships in a funding/sponsorship management system.
 """
 
+import operator
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Union
+from typing import Any, Callable, List, Dict, Optional, Union
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .instrumentation import configuration_entities, spanned
+
 
 class FundingPlatform(Enum):
     """Enumeration of supported funding platforms"""
@@ -128,6 +131,25 @@ class FundingConfiguration:
     min_amount: Optional[FundingAmount] = None
     max_amount: Optional[FundingAmount] = None
     
+    def __post_init__(self):
+        # Lazily built lookup indexes, dropped by the add_* mutators
+        self._indexes: Dict[str, Any] = {}
+        self._indexed_sizes = None
+    
+    def _index(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return a cached index, rebuilding all of them if the lists changed size"""
+        sizes = (len(self.beneficiaries), len(self.funding_sources), len(self.tiers), len(self.goals))
+        if sizes != self._indexed_sizes:
+            self._indexes = {}
+            self._indexed_sizes = sizes
+        if name not in self._indexes:
+            self._indexes[name] = build()
+        return self._indexes[name]
+    
+    def invalidate_indexes(self) -> None:
+        """Drop cached indexes after editing sources, tiers, goals or beneficiaries in place"""
+        self._indexes = {}
+    
     def get_active_sources(self) -> List[FundingSource]:
         """Get all active funding sources"""
         return [source for source in self.funding_sources if source.is_active]
@@ -140,21 +162,77 @@ class FundingConfiguration:
         """Get all goals that haven't been reached yet"""
         return [goal for goal in self.goals if not goal.is_reached]
     
+    def sources_by_platform(self, active_only: bool = True) -> Dict[FundingPlatform, List[FundingSource]]:
+        """
+        Get funding sources grouped by platform, in order of first appearance
+        
+        The active grouping is rebuilt on every call, as is_active may be edited
+        in place; only the grouping of all sources is cached. Either way the
+        dict and lists returned are the caller's own.
+        """
+        if not active_only:
+            return {platform: list(sources)
+                    for platform, sources in self._index('by_platform', self._group_by_platform).items()}
+        groups: Dict[FundingPlatform, List[FundingSource]] = {}
+        for source in self.funding_sources:
+            if source.is_active:
+                groups.setdefault(source.platform, []).append(source)
+        return groups
+    
+    def _group_by_platform(self) -> Dict[FundingPlatform, List[FundingSource]]:
+        groups: Dict[FundingPlatform, List[FundingSource]] = {}
+        for source in self.funding_sources:
+            groups.setdefault(source.platform, []).append(source)
+        return groups
+    
+    def sources_for_platform(self, platform: FundingPlatform, active_only: bool = True) -> List[FundingSource]:
+        """Get the funding sources of one platform"""
+        if active_only:
+            return [source for source in self.funding_sources if source.platform == platform and source.is_active]
+        return list(self._index('by_platform', self._group_by_platform).get(platform, []))
+    
+    def tier(self, name: str) -> Optional[FundingTier]:
+        """Look up a funding tier by name"""
+        return self._index('tiers_by_name', lambda: self._first_by(self.tiers, lambda t: t.name)).get(name)
+    
+    def goal(self, name: str) -> Optional[FundingGoal]:
+        """Look up a funding goal by name"""
+        return self._index('goals_by_name', lambda: self._first_by(self.goals, lambda g: g.name)).get(name)
+    
+    def beneficiary_by_github(self, username: str) -> Optional[Beneficiary]:
+        """Look up a beneficiary by GitHub username (case-insensitive, like GitHub)"""
+        index = self._index('beneficiaries_by_github', lambda: self._first_by(
+            [b for b in self.beneficiaries if b.github_username], lambda b: b.github_username.lower()
+        ))
+        return index.get(username.lower())
+    
+    @staticmethod
+    def _first_by(items: list, key: Callable[[Any], str]) -> Dict[str, Any]:
+        """Map each key to the first item that has it"""
+        index: Dict[str, Any] = {}
+        for item in items:
+            index.setdefault(key(item), item)
+        return index
+    
     def add_beneficiary(self, beneficiary: Beneficiary) -> None:
         """Add a beneficiary to the configuration"""
         self.beneficiaries.append(beneficiary)
+        self._indexes = {}
     
     def add_funding_source(self, source: FundingSource) -> None:
         """Add a funding source to the configuration"""
         self.funding_sources.append(source)
+        self._indexes = {}
     
     def add_tier(self, tier: FundingTier) -> None:
         """Add a funding tier to the configuration"""
         self.tiers.append(tier)
+        self._indexes = {}
     
     def add_goal(self, goal: FundingGoal) -> None:
         """Add a funding goal to the configuration"""
         self.goals.append(goal)
+        self._indexes = {}
     
     def __str__(self) -> str:
         return f"Funding Configuration for {self.project_name}"
@@ -184,59 +262,230 @@ class FundingModelVisitor(ABC):
         pass
 
 
+@dataclass(frozen=True)
+class ValidationRule:
+    """
+    One validation check
+
+    `entity` selects what the check receives: 'configuration' (the whole
+    configuration), 'source' (one FundingSource), 'tiers' or 'goals' (the
+    full list). A source rule can be limited to some `platforms`. The check
+    returns an error message, or None when the entity is valid.
+    """
+    name: str
+    entity: str
+    check: Callable[[Any], Optional[str]]
+    platforms: Optional[frozenset] = None
+
+
+VALIDATION_ENTITIES = ('configuration', 'source', 'tiers', 'goals')
+
+TIDELIFT_PLATFORMS = frozenset(['npm', 'pypi', 'rubygems', 'maven', 'packagist', 'nuget'])
+_TIDELIFT_PLATFORM_ERROR = ("Tidelift platform name must be one of: "
+                            + ', '.join(['npm', 'pypi', 'rubygems', 'maven', 'packagist', 'nuget']))
+
+
+def _tidelift_username(source: FundingSource) -> Optional[str]:
+    # Tidelift format: platform-name/package-name
+    if '/' not in source.username:
+        return "Tidelift username must be in format 'platform-name/package-name' (e.g., 'npm/package-name')"
+    if source.username.split('/')[0] not in TIDELIFT_PLATFORMS:
+        return _TIDELIFT_PLATFORM_ERROR
+    return None
+
+
+def _unique_names(message: str) -> Callable[[list], Optional[str]]:
+    def check(items: list) -> Optional[str]:
+        names = [item.name for item in items]
+        return message if len(names) != len(set(names)) else None
+    return check
+
+
+DEFAULT_VALIDATION_RULES = [
+    ValidationRule('project-name', 'configuration',
+                   lambda c: None if c.project_name else "Project name is required"),
+    ValidationRule('beneficiaries', 'configuration',
+                   lambda c: None if c.beneficiaries else "At least one beneficiary is required"),
+    ValidationRule('funding-sources', 'configuration',
+                   lambda c: None if c.funding_sources else "At least one funding source is required"),
+    ValidationRule('source-username', 'source',
+                   lambda s: None if s.username else f"Username is required for {s.platform.value}"),
+    ValidationRule('custom-url', 'source',
+                   lambda s: None if s.custom_url else "Custom URL is required for custom platforms",
+                   frozenset([FundingPlatform.CUSTOM])),
+    ValidationRule('tidelift-username', 'source', _tidelift_username,
+                   frozenset([FundingPlatform.TIDELIFT])),
+    ValidationRule('thanks-dev-username', 'source',
+                   lambda s: None if s.username.startswith('u/gh/') else "Thanks.dev username must be in format 'u/gh/username'",
+                   frozenset([FundingPlatform.THANKS_DEV])),
+    ValidationRule('unique-tier-names', 'tiers', _unique_names("Funding tier names must be unique")),
+    ValidationRule('unique-goal-names', 'goals', _unique_names("Funding goal names must be unique")),
+]
+
+
 class FundingModelValidator:
     """Validates funding model instances for consistency and completeness"""
     
+    # Registered rules, and their per-entity compilation (built on first use).
+    # register_rule replaces the list rather than appending to it, so a subclass
+    # registering rules never changes the list its base class and siblings see.
+    rules: List[ValidationRule] = list(DEFAULT_VALIDATION_RULES)
+    _compiled: Optional[Dict[Any, tuple]] = None
+    _compiled_from: Optional[List[ValidationRule]] = None  # The rules list _compiled was built from
+    
+    @classmethod
+    def register_rule(cls, rule: ValidationRule) -> None:
+        """Add a rule; it runs after the rules already registered for its entity"""
+        if rule.entity not in VALIDATION_ENTITIES:
+            raise ValueError(f"Unknown validation entity: {rule.entity}")
+        cls.rules = cls.rules + [rule]
+        cls._compiled = None
+    
+    @classmethod
+    def compiled_rules(cls) -> Dict[Any, tuple]:
+        """
+        Checks per entity type, in registration order
+        
+        Source checks are compiled per platform (compiled['source'][platform]),
+        so a source only runs the rules that apply to its platform.
+        """
+        if cls._compiled is None or cls._compiled_from is not cls.rules:  # Also when a base class registered
+            compiled = {entity: tuple(r.check for r in cls.rules if r.entity == entity)
+                        for entity in VALIDATION_ENTITIES if entity != 'source'}
+            compiled['source'] = {
+                platform: tuple(r.check for r in cls.rules
+                                if r.entity == 'source' and (r.platforms is None or platform in r.platforms))
+                for platform in FundingPlatform
+            }
+            cls._compiled, cls._compiled_from = compiled, cls.rules
+        return cls._compiled
+    
     @staticmethod
-    def validate_configuration(config: FundingConfiguration) -> List[str]:
+    def _run(checks: tuple, entity: Any) -> List[str]:
+        errors = []
+        for check in checks:
+            error = check(entity)
+            if error:
+                errors.append(error)
+        return errors
+    
+    @classmethod
+    @spanned('validate', entities=lambda cls, config: configuration_entities(config))
+    def validate_configuration(cls, config: FundingConfiguration) -> List[str]:
         """Validate a funding configuration and return list of validation errors"""
+        compiled = cls.compiled_rules()
+        source_checks = compiled['source']
+        # Loops are inlined: this runs once per configuration in batch jobs
         errors = []
-        
-        if not config.project_name:
-            errors.append("Project name is required")
-        
-        if not config.beneficiaries:
-            errors.append("At least one beneficiary is required")
-        
-        if not config.funding_sources:
-            errors.append("At least one funding source is required")
-        
-        # Validate funding sources
+        for check in compiled['configuration']:
+            error = check(config)
+            if error:
+                errors.append(error)
         for source in config.funding_sources:
-            if not source.username:
-                errors.append(f"Username is required for {source.platform.value}")
-            
-            if source.platform == FundingPlatform.CUSTOM and not source.custom_url:
-                errors.append("Custom URL is required for custom platforms")
-            
-            # Validate Tidelift format: platform-name/package-name
-            if source.platform == FundingPlatform.TIDELIFT:
-                if '/' not in source.username:
-                    errors.append("Tidelift username must be in format 'platform-name/package-name' (e.g., 'npm/package-name')")
-                else:
-                    platform_name = source.username.split('/')[0]
-                    valid_platforms = ['npm', 'pypi', 'rubygems', 'maven', 'packagist', 'nuget']
-                    if platform_name not in valid_platforms:
-                        errors.append(f"Tidelift platform name must be one of: {', '.join(valid_platforms)}")
-            
-            # Validate thanks.dev format: u/gh/username
-            if source.platform == FundingPlatform.THANKS_DEV:
-                if not source.username.startswith('u/gh/'):
-                    errors.append("Thanks.dev username must be in format 'u/gh/username'")
-        
-        # Validate tiers have unique names
-        tier_names = [tier.name for tier in config.tiers]
-        if len(tier_names) != len(set(tier_names)):
-            errors.append("Funding tier names must be unique")
-        
-        # Validate goals have unique names
-        goal_names = [goal.name for goal in config.goals]
-        if len(goal_names) != len(set(goal_names)):
-            errors.append("Funding goal names must be unique")
-        
+            for check in source_checks[source.platform]:
+                error = check(source)
+                if error:
+                    errors.append(error)
+        for check in compiled['tiers']:
+            error = check(config.tiers)
+            if error:
+                errors.append(error)
+        for check in compiled['goals']:
+            error = check(config.goals)
+            if error:
+                errors.append(error)
         return errors
     
-    @staticmethod
-    def is_valid_configuration(config: FundingConfiguration) -> bool:
+    @classmethod
+    def is_valid_configuration(cls, config: FundingConfiguration) -> bool:
         """Check if a configuration is valid"""
-        return len(FundingModelValidator.validate_configuration(config)) == 0 
\ No newline at end of file
+        return len(cls.validate_configuration(config)) == 0
+
+
+def _same_items(old: list, new: list) -> bool:
+    """True when two lists hold the same objects in the same order"""
+    return len(old) == len(new) and all(map(operator.is_, old, new))
+
+
+class IncrementalValidator:
+    """
+    Revalidates only what changed in one configuration since the last run
+    
+    Entities added to or removed from the configuration are picked up
+    automatically. Field edits on an existing entity (e.g. changing a
+    source's username) must be reported with touch(); every other entity
+    keeps its cached result. Configuration rules are cheap and always
+    rerun. The errors returned are identical to
+    FundingModelValidator.validate_configuration.
+    """
+    
+    def __init__(self, config: FundingConfiguration, validator: type = FundingModelValidator):
+        self.config = config
+        self.validator = validator
+        self.revalidated = 0  # Entities rechecked by the last validate()
+        self._touched: set = set()
+        self.reset()
+    
+    def touch(self, *entities: Any) -> None:
+        """Mark entities as edited so the next run revalidates them"""
+        self._touched.update(id(entity) for entity in entities)
+    
+    def reset(self) -> None:
+        """Drop every cached result"""
+        self._compiled = None
+        self._sources: List[FundingSource] = []
+        self._source_errors: List[List[str]] = []
+        self._source_positions: Dict[int, int] = {}
+        self._flat_source_errors: List[str] = []
+        self._lists: Dict[str, tuple] = {}
+    
+    @spanned('validate.incremental', entities=lambda self: configuration_entities(self.config))
+    def validate(self) -> List[str]:
+        """Validate the configuration, reusing cached results of unchanged entities"""
+        compiled = self.validator.compiled_rules()
+        if compiled is not self._compiled:  # First run, or rules registered since the last one
+            self.reset()
+            self._compiled = compiled
+        touched, self._touched = self._touched, set()
+        self.revalidated = 0
+        
+        errors = self.validator._run(compiled['configuration'], self.config)
+        errors.extend(self._validate_sources(compiled, touched))
+        for name in ('tiers', 'goals'):
+            errors.extend(self._validate_list(name, compiled, touched))
+        return errors
+    
+    def _validate_sources(self, compiled: Dict[Any, tuple], touched: set) -> List[str]:
+        run = self.validator._run
+        sources = self.config.funding_sources
+        if _same_items(self._sources, sources):
+            dirty = [self._source_positions[key] for key in touched if key in self._source_positions]
+            if not dirty:
+                return self._flat_source_errors
+            for position in dirty:
+                self._source_errors[position] = run(compiled['source'][sources[position].platform], sources[position])
+            self.revalidated += len(dirty)
+        else:
+            previous = {id(source): (source, errors) for source, errors in zip(self._sources, self._source_errors)}
+            results = []
+            for source in sources:
+                cached = previous.get(id(source))
+                if cached is None or cached[0] is not source or id(source) in touched:
+                    results.append(run(compiled['source'][source.platform], source))
+                    self.revalidated += 1
+                else:
+                    results.append(cached[1])
+            self._sources = list(sources)
+            self._source_errors = results
+            self._source_positions = {id(source): position for position, source in enumerate(sources)}
+        self._flat_source_errors = [error for source_errors in self._source_errors for error in source_errors]
+        return self._flat_source_errors
+    
+    def _validate_list(self, name: str, compiled: Dict[Any, tuple], touched: set) -> List[str]:
+        items = getattr(self.config, name)
+        cached = self._lists.get(name)
+        if cached is None or not _same_items(cached[0], items) or not touched.isdisjoint(cached[1]):
+            cached = (list(items), {id(item) for item in items}, self.validator._run(compiled[name], items))
+            self._lists[name] = cached
+            self.revalidated += len(items)
+        return cached[2]
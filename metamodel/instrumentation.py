@@ -0,0 +1,361 @@
+"""
+Phase-level instrumentation for the parse -> build -> validate -> export pipeline.
+
+The parsers, the validator, the exporter and the visualizers open a span
+around each phase:
+
+    parse.regex, parse.tokenizer, parse.textx    text -> parser data
+    build, transform.textx                       parser data -> FundingConfiguration
+    validate, validate.incremental               one configuration
+    validate.batch                               validate_many (entities = configurations)
+    export.<format>                              FundingExporter methods
+    visualize.<diagram>                          FundingVisualizer methods
+
+Nothing is measured until an Instrumentation is installed with
+set_instrumentation() (or the instrumented() context manager); until then
+span() hands back one shared no-op object and costs a global lookup and
+a function call. An installed Instrumentation measures wall and CPU time
+and the entities handled by each span, and, with trace_memory=True, the
+net bytes and blocks allocated and the peak traced memory (tracemalloc
+slows Python down several times, so it is off by default). Every finished
+span is passed to the sinks: StatsSink aggregates in memory,
+JSONLinesSink logs one JSON object per span and PrometheusTextSink
+writes a node_exporter textfile-collector file.
+"""
+
+import functools
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Sequence, Union
+
+
+@dataclass
+class SpanRecord:
+    """One finished (or, inside the with block, running) span"""
+    name: str
+    parent: Optional[str] = None
+    depth: int = 0
+    start: float = 0.0            # Unix time the span was entered
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0      # CPU time of the thread that ran the span
+    entities: Optional[int] = None
+    allocated_bytes: Optional[int] = None   # Net traced bytes, with trace_memory only
+    allocated_blocks: Optional[int] = None  # Net allocated blocks, with trace_memory only
+    peak_bytes: Optional[int] = None        # Peak traced bytes above the start, with trace_memory only
+    error: Optional[str] = None   # Exception type name when the span raised
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+class _NullSpan:
+    """The span handed out when no Instrumentation is installed"""
+    entities = None
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return {}  # A fresh dict, so writes to it are dropped
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Context manager measuring one span of an Instrumentation"""
+
+    __slots__ = ('_instrumentation', 'record', '_wall', '_cpu', '_memory', '_blocks', '_peak')
+
+    def __init__(self, instrumentation: "Instrumentation", record: SpanRecord):
+        self._instrumentation = instrumentation
+        self.record = record
+
+    @property
+    def entities(self) -> Optional[int]:
+        return self.record.entities
+
+    @entities.setter
+    def entities(self, count: Optional[int]) -> None:
+        self.record.entities = count
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self.record.attributes
+
+    def __enter__(self) -> "_Span":
+        stack = self._instrumentation._stack()
+        if stack:
+            self.record.parent = stack[-1].record.name
+            self.record.depth = len(stack)
+        stack.append(self)
+        if self._instrumentation.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if len(stack) > 1:  # Keep the parent's peak before resetting it for this span
+                stack[-2]._peak = max(stack[-2]._peak, peak)
+            tracemalloc.reset_peak()
+            self._memory = self._peak = current
+            self._blocks = sys.getallocatedblocks()
+        else:
+            self._memory = None
+        self.record.start = time.time()
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        record = self.record
+        record.wall_seconds = wall
+        record.cpu_seconds = cpu
+        stack = self._instrumentation._stack()
+        stack.pop()
+        if self._memory is not None and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(self._peak, peak)
+            record.allocated_bytes = current - self._memory
+            record.allocated_blocks = sys.getallocatedblocks() - self._blocks
+            record.peak_bytes = peak - self._memory
+            if stack:  # The parent's peak includes this span's
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+        if exc_type is not None:
+            record.error = exc_type.__name__
+        self._instrumentation._emit(record)
+        return False
+
+
+class Instrumentation:
+    """
+    Measures spans and passes each finished one to the sinks
+
+    Args:
+        sinks: Objects with a record(SpanRecord) method (and optionally close())
+        trace_memory: Also measure allocations with tracemalloc, which is
+            started if it is not already tracing
+    """
+
+    def __init__(self, sinks: Sequence[Any] = (), trace_memory: bool = False):
+        self.sinks = list(sinks)
+        self.trace_memory = trace_memory
+        self._local = threading.local()
+        self._started_tracing = False
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, entities: Optional[int] = None, **attributes: Any) -> _Span:
+        """A context manager measuring the code in its with block"""
+        return _Span(self, SpanRecord(name, entities=entities, attributes=attributes))
+
+    def _emit(self, record: SpanRecord) -> None:
+        for sink in self.sinks:
+            sink.record(record)
+
+    def start(self) -> None:
+        """Prepare to measure (starts tracemalloc for trace_memory)"""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def close(self) -> None:
+        """Stop tracemalloc if start() started it, and close the sinks"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        for sink in self.sinks:
+            close = getattr(sink, 'close', None)
+            if close is not None:
+                close()
+
+
+_active: Optional[Instrumentation] = None
+
+
+def span(name: str, entities: Optional[int] = None, **attributes: Any):
+    """
+    A span of the installed Instrumentation, or a shared no-op one
+
+    Use as `with span('parse.regex') as s: ...; s.entities = n`; setting
+    entities or attributes on the no-op span is harmless.
+    """
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, entities, **attributes)
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """The installed Instrumentation, or None"""
+    return _active
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> Optional[Instrumentation]:
+    """Install an Instrumentation for the whole process (None uninstalls) and return the previous one"""
+    global _active
+    previous = _active
+    if instrumentation is not None:
+        instrumentation.start()
+    _active = instrumentation
+    return previous
+
+
+@contextmanager
+def instrumented(*sinks: Any, trace_memory: bool = False) -> Iterator[Instrumentation]:
+    """Install an Instrumentation with the given sinks for the with block, then close it"""
+    instrumentation = Instrumentation(sinks, trace_memory)
+    previous = set_instrumentation(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        set_instrumentation(previous)
+        instrumentation.close()
+
+
+def configuration_entities(config: Any) -> int:
+    """Beneficiaries, sources, tiers and goals of a configuration"""
+    return len(config.beneficiaries) + len(config.funding_sources) + len(config.tiers) + len(config.goals)
+
+
+def spanned(name: str, entities: Optional[Callable[..., int]] = None) -> Callable:
+    """
+    Decorate a function to run in a span
+
+    entities, if given, is called with the function's arguments to count
+    the entities it handles - only when instrumentation is installed.
+    """
+    def decorate(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return function(*args, **kwargs)
+            with _active.span(name, entities(*args, **kwargs) if entities else None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class StatsSink:
+    """Aggregates spans in memory: count, totals and extremes per span name"""
+
+    FIELDS = ('count', 'errors', 'wall_seconds', 'cpu_seconds', 'min_wall_seconds', 'max_wall_seconds',
+              'entities', 'allocated_bytes', 'allocated_blocks', 'max_peak_bytes')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, record: SpanRecord) -> None:
+        with self._lock:
+            stats = self.stats.get(record.name)
+            if stats is None:
+                stats = self.stats[record.name] = dict.fromkeys(self.FIELDS, 0)
+                stats['min_wall_seconds'] = record.wall_seconds
+            stats['count'] += 1
+            stats['errors'] += record.error is not None
+            stats['wall_seconds'] += record.wall_seconds
+            stats['cpu_seconds'] += record.cpu_seconds
+            stats['min_wall_seconds'] = min(stats['min_wall_seconds'], record.wall_seconds)
+            stats['max_wall_seconds'] = max(stats['max_wall_seconds'], record.wall_seconds)
+            stats['entities'] += record.entities or 0
+            stats['allocated_bytes'] += record.allocated_bytes or 0
+            stats['allocated_blocks'] += record.allocated_blocks or 0
+            stats['max_peak_bytes'] = max(stats['max_peak_bytes'], record.peak_bytes or 0)
+
+    def report(self) -> str:
+        """The aggregates as a text table, slowest span name first"""
+        lines = [f"{'span':<28} {'count':>8} {'wall s':>10} {'cpu s':>10} {'us/call':>10} "
+                 f"{'entities':>10} {'alloc KiB':>10}"]
+        with self._lock:
+            items = sorted(self.stats.items(), key=lambda item: -item[1]['wall_seconds'])
+            for name, stats in items:
+                lines.append(f"{name:<28} {stats['count']:>8} {stats['wall_seconds']:>10.4f} "
+                             f"{stats['cpu_seconds']:>10.4f} {stats['wall_seconds'] / stats['count'] * 1e6:>10.1f} "
+                             f"{stats['entities']:>10} {stats['allocated_bytes'] / 1024:>10.1f}")
+        return '\n'.join(lines)
+
+
+class JSONLinesSink:
+    """Writes each span as one JSON object per line to a path or a text file object"""
+
+    def __init__(self, target: Union[str, IO[str]]):
+        self._lock = threading.Lock()
+        self._owned = isinstance(target, (str, os.PathLike))
+        self._fp = open(target, 'a', encoding='utf-8') if self._owned else target
+
+    def record(self, record: SpanRecord) -> None:
+        line = json.dumps(asdict(record), ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            self._fp.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._owned:
+                self._fp.close()
+            else:
+                self._fp.flush()
+
+
+# Metric name suffix -> (StatsSink field, Prometheus type, help text)
+PROMETHEUS_METRICS = {
+    'spans_total': ('count', 'counter', 'Spans finished'),
+    'span_errors_total': ('errors', 'counter', 'Spans that raised'),
+    'span_wall_seconds_total': ('wall_seconds', 'counter', 'Wall-clock time in spans'),
+    'span_cpu_seconds_total': ('cpu_seconds', 'counter', 'CPU time in spans'),
+    'span_entities_total': ('entities', 'counter', 'Entities handled in spans'),
+    'span_allocated_bytes_total': ('allocated_bytes', 'counter', 'Net bytes allocated in spans (tracemalloc)'),
+    'span_peak_bytes': ('max_peak_bytes', 'gauge', 'Largest traced memory peak of a span (tracemalloc)'),
+}
+
+
+class PrometheusTextSink(StatsSink):
+    """
+    Aggregates spans like StatsSink and writes them in the Prometheus text format
+
+    The file is replaced atomically by write() and close(), as the
+    node_exporter textfile collector requires.
+    """
+
+    def __init__(self, path: str, prefix: str = 'funding_dsl'):
+        super().__init__()
+        self.path = path
+        self.prefix = prefix
+
+    def render(self) -> str:
+        """The aggregates in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            names = sorted(self.stats)
+            for suffix, (stat, metric_type, help_text) in PROMETHEUS_METRICS.items():
+                metric = f"{self.prefix}_{suffix}"
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} {metric_type}")
+                for name in names:
+                    lines.append(f'{metric}{{span="{name}"}} {self.stats[name][stat]}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self) -> None:
+        """Replace the file with the current aggregates"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def close(self) -> None:
+        self.write()
@@ -0,0 +1,141 @@
+"""
+Fixed-point Money - Exact integer minor-unit amounts.
+
+FundingAmount stores a float. CentsAmount is a drop-in FundingAmount that
+stores an exact integer number of minor units (cents) instead, so sums over
+large catalogs never drift and comparisons are exact. Its ``value`` is still
+available as a float for code that reads it, and ``str()`` is unchanged.
+
+Parsers produce CentsAmount directly from DSL literals like ``5.00 USD`` when
+created with ``money='cents'``.
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+from typing import Iterable, Optional
+
+from .funding_metamodel import FundingAmount, CurrencyType
+
+
+# Every supported currency has two decimal places
+MINOR_UNITS = 100
+
+MONEY_MODES = ('float', 'cents')
+
+
+def parse_minor_units(literal: str) -> int:
+    """Convert a decimal literal such as '5.00' or '12.5' to exact minor units"""
+    literal = literal.strip()
+    whole, _, fraction = literal.partition('.')
+    if whole.lstrip('-').isdigit() and (fraction.isdigit() or not fraction) and len(fraction) <= 2:
+        cents = int(whole.lstrip('-')) * MINOR_UNITS + int(fraction.ljust(2, '0'))
+        return -cents if whole.startswith('-') else cents
+    try:
+        # More than two decimals or exponent notation: round half to even
+        return int((Decimal(literal) * MINOR_UNITS).quantize(Decimal(1), rounding=ROUND_HALF_EVEN))
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {literal!r}") from None
+
+
+class CentsAmount(FundingAmount):
+    """FundingAmount stored as an immutable integer number of minor units"""
+
+    def __init__(self, cents: int, currency: CurrencyType = CurrencyType.USD):
+        if not isinstance(cents, int) or isinstance(cents, bool):
+            raise TypeError(f"cents must be an int, not {type(cents).__name__}")
+        object.__setattr__(self, 'cents', cents)
+        object.__setattr__(self, 'currency', currency)
+
+    @classmethod
+    def from_literal(cls, literal: str, currency: CurrencyType = CurrencyType.USD) -> "CentsAmount":
+        """Build from a DSL literal such as '5.00'"""
+        return cls(parse_minor_units(literal), currency)
+
+    @classmethod
+    def from_amount(cls, amount: FundingAmount) -> "CentsAmount":
+        """Convert any FundingAmount (the shortest float repr is parsed exactly)"""
+        if isinstance(amount, CentsAmount):
+            return amount
+        return cls(parse_minor_units(repr(float(amount.value))), amount.currency)
+
+    @property
+    def value(self) -> float:
+        return self.cents / MINOR_UNITS
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"CentsAmount(cents={self.cents}, currency={self.currency!r})"
+
+    def __hash__(self) -> int:
+        return hash((self.cents, self.currency))
+
+    def _cents_of(self, other) -> int:
+        """Minor units of another amount in the same currency"""
+        if not isinstance(other, FundingAmount):
+            raise TypeError(f"Cannot combine CentsAmount with {type(other).__name__}")
+        if other.currency != self.currency:
+            raise ValueError(f"Currency mismatch: {self.currency.value} vs {other.currency.value}")
+        return other.cents if isinstance(other, CentsAmount) else CentsAmount.from_amount(other).cents
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FundingAmount):
+            return NotImplemented
+        if other.currency != self.currency:
+            return False
+        return self.cents == self._cents_of(other)
+
+    def __lt__(self, other) -> bool:
+        return self.cents < self._cents_of(other)
+
+    def __le__(self, other) -> bool:
+        return self.cents <= self._cents_of(other)
+
+    def __gt__(self, other) -> bool:
+        return self.cents > self._cents_of(other)
+
+    def __ge__(self, other) -> bool:
+        return self.cents >= self._cents_of(other)
+
+    def __add__(self, other) -> "CentsAmount":
+        return CentsAmount(self.cents + self._cents_of(other), self.currency)
+
+    def __radd__(self, other) -> "CentsAmount":
+        if other == 0:  # Lets sum() start from its default 0
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other) -> "CentsAmount":
+        return CentsAmount(self.cents - self._cents_of(other), self.currency)
+
+    def __mul__(self, factor: int) -> "CentsAmount":
+        if not isinstance(factor, int):
+            return NotImplemented
+        return CentsAmount(self.cents * factor, self.currency)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "CentsAmount":
+        return CentsAmount(-self.cents, self.currency)
+
+
+def amount_from_literal(literal: str, currency: CurrencyType, money: str = 'float') -> FundingAmount:
+    """Build the amount type of a money mode from a DSL number literal"""
+    if money == 'cents':
+        return CentsAmount.from_literal(literal, currency)
+    return FundingAmount(float(literal), currency)
+
+
+def sum_amounts(amounts: Iterable[FundingAmount], currency: Optional[CurrencyType] = None) -> CentsAmount:
+    """Exactly sum amounts of one currency in integer space"""
+    amounts = amounts if isinstance(amounts, (list, tuple)) else list(amounts)
+    if currency is None:
+        currency = amounts[0].currency if amounts else CurrencyType.USD
+    for amount in amounts:
+        if amount.currency is not currency:
+            raise ValueError(f"Currency mismatch: {currency.value} vs {amount.currency.value}")
+    try:
+        total = sum([amount.cents for amount in amounts])
+    except AttributeError:  # Plain FundingAmount objects among them
+        total = sum(CentsAmount.from_amount(amount).cents for amount in amounts)
+    return CentsAmount(total, currency)
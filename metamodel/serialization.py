@@ -0,0 +1,140 @@
+"""
+Funding Model Serialization - Lossless conversion between metamodel objects and plain data.
+
+The dict form uses only JSON types, keeps a stable key order and round-trips
+every field of the metamodel, so it can be stored on disk and rebuilt later.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, FundingPlatform, FundingType, CurrencyType
+)
+from .money import CentsAmount
+
+
+def amount_to_dict(amount: Optional[FundingAmount]) -> Optional[Dict[str, Any]]:
+    """Convert a FundingAmount to {'value', 'currency'}, plus 'cents' for CentsAmount"""
+    if amount is None:
+        return None
+    if isinstance(amount, CentsAmount):
+        return {'value': amount.value, 'currency': amount.currency.value, 'cents': amount.cents}
+    return {'value': amount.value, 'currency': amount.currency.value}
+
+
+def amount_from_dict(data: Optional[Dict[str, Any]]) -> Optional[FundingAmount]:
+    """Rebuild a FundingAmount (or CentsAmount) from amount_to_dict output"""
+    if data is None:
+        return None
+    if 'cents' in data:
+        return CentsAmount(data['cents'], CurrencyType(data['currency']))
+    return FundingAmount(data['value'], CurrencyType(data['currency']))
+
+
+def configuration_to_dict(config: FundingConfiguration) -> Dict[str, Any]:
+    """Convert a FundingConfiguration to a JSON-compatible dict"""
+    return {
+        'project_name': config.project_name,
+        'description': config.description,
+        'preferred_currency': config.preferred_currency.value,
+        'min_amount': amount_to_dict(config.min_amount),
+        'max_amount': amount_to_dict(config.max_amount),
+        'beneficiaries': [
+            {
+                'name': b.name,
+                'email': b.email,
+                'github_username': b.github_username,
+                'website': b.website,
+                'description': b.description
+            }
+            for b in config.beneficiaries
+        ],
+        'funding_sources': [
+            {
+                'platform': s.platform.value,
+                'username': s.username,
+                'funding_type': s.funding_type.value,
+                'is_active': s.is_active,
+                'custom_url': s.custom_url,
+                'platform_specific_config': s.platform_specific_config
+            }
+            for s in config.funding_sources
+        ],
+        'tiers': [
+            {
+                'name': t.name,
+                'amount': amount_to_dict(t.amount),
+                'description': t.description,
+                'benefits': t.benefits,
+                'max_sponsors': t.max_sponsors,
+                'is_active': t.is_active
+            }
+            for t in config.tiers
+        ],
+        'goals': [
+            {
+                'name': g.name,
+                'target_amount': amount_to_dict(g.target_amount),
+                'description': g.description,
+                'deadline': g.deadline.isoformat() if g.deadline else None,
+                'current_amount': amount_to_dict(g.current_amount),
+                'is_reached': g.is_reached
+            }
+            for g in config.goals
+        ]
+    }
+
+
+def configuration_from_dict(data: Dict[str, Any]) -> FundingConfiguration:
+    """Rebuild a FundingConfiguration from configuration_to_dict output"""
+    config = FundingConfiguration(
+        project_name=data['project_name'],
+        description=data.get('description'),
+        preferred_currency=CurrencyType(data.get('preferred_currency', 'USD')),
+        min_amount=amount_from_dict(data.get('min_amount')),
+        max_amount=amount_from_dict(data.get('max_amount'))
+    )
+
+    for b in data.get('beneficiaries', []):
+        config.add_beneficiary(Beneficiary(
+            name=b['name'],
+            email=b.get('email'),
+            github_username=b.get('github_username'),
+            website=b.get('website'),
+            description=b.get('description')
+        ))
+
+    for s in data.get('funding_sources', []):
+        config.add_funding_source(FundingSource(
+            platform=FundingPlatform(s['platform']),
+            username=s['username'],
+            funding_type=FundingType(s.get('funding_type', 'both')),
+            is_active=s.get('is_active', True),
+            custom_url=s.get('custom_url'),
+            platform_specific_config=dict(s.get('platform_specific_config') or {})
+        ))
+
+    for t in data.get('tiers', []):
+        config.add_tier(FundingTier(
+            name=t['name'],
+            amount=amount_from_dict(t['amount']),
+            description=t.get('description'),
+            benefits=list(t.get('benefits') or []),
+            max_sponsors=t.get('max_sponsors'),
+            is_active=t.get('is_active', True)
+        ))
+
+    for g in data.get('goals', []):
+        deadline = g.get('deadline')
+        config.add_goal(FundingGoal(
+            name=g['name'],
+            target_amount=amount_from_dict(g['target_amount']),
+            description=g.get('description'),
+            deadline=datetime.fromisoformat(deadline) if deadline else None,
+            current_amount=amount_from_dict(g['current_amount']) if g.get('current_amount') else FundingAmount(0),
+            is_reached=g.get('is_reached', False)
+        ))
+
+    return config
@@ -0,0 +1,59 @@
+"""
+Tests for the benchmark suite's statistics and baseline comparison
+"""
+
+import pytest
+
+from benchmarks.bench_suite import NOISE_FLOOR_BYTES, RESULTS_VERSION, compare, percentile
+
+
+def results(p50=0.010, peak=10 * 1024 * 1024, **overrides):
+    result = {'parser': 'regex', 'size': 'small', 'stage': 'parse', 'min': p50 * 0.9, 'p50': p50,
+              'peak_memory_bytes': peak}
+    result.update(overrides)
+    return {'version': RESULTS_VERSION, 'results': [result]}
+
+
+def test_percentile_interpolates_between_sorted_values():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 100) == 5.0
+    assert percentile(values, 90) == pytest.approx(4.6)
+    assert percentile([1.0, 2.0], 50) == 1.5
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_time_regressions_respect_the_tolerance():
+    baseline = results(p50=0.010)
+    assert compare(results(p50=0.012), baseline, tolerance=0.25) == []
+    regressions = compare(results(p50=0.013), baseline, tolerance=0.25)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("regex small parse: p50 10.000 ms -> 13.000 ms")
+    assert compare(results(p50=0.013), baseline, tolerance=0.5) == []
+    assert len(compare(results(p50=0.010, min=0.020), baseline, tolerance=0.25, metric='min')) == 1
+
+
+def test_tiny_time_differences_are_noise():
+    assert compare(results(p50=30e-6), results(p50=15e-6), tolerance=0.25) == []
+
+
+def test_peak_memory_regressions_need_more_than_the_noise_floor():
+    baseline = results(peak=10 * 1024 * 1024)
+    regressions = compare(results(peak=13 * 1024 * 1024), baseline, tolerance=0.25)
+    assert len(regressions) == 1 and "peak memory" in regressions[0]
+    assert compare(results(peak=12 * 1024 * 1024), baseline, tolerance=0.25) == []
+
+    small = results(peak=8 * 1024)
+    assert compare(results(peak=8 * 1024 + NOISE_FLOOR_BYTES), small, tolerance=0.25) == []
+    assert len(compare(results(peak=8 * 1024 + NOISE_FLOOR_BYTES + 1), small, tolerance=0.25)) == 1
+
+
+def test_measurements_missing_from_the_baseline_are_skipped():
+    assert compare(results(p50=1.0, stage='export'), results(p50=0.010), tolerance=0.25) == []
+
+
+def test_baselines_of_another_version_are_rejected():
+    baseline = dict(results(), version=RESULTS_VERSION + 1)
+    with pytest.raises(ValueError, match="Unsupported baseline version"):
+        compare(results(), baseline, tolerance=0.25)
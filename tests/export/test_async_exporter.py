@@ -0,0 +1,58 @@
+"""
+Tests for the asyncio export API
+"""
+
+import asyncio
+import shutil
+
+from export.async_exporter import export_funding_config_async, export_many_async
+from export.funding_exporter import export_funding_config
+from textual.async_parser import AsyncFundingParser
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+def test_export_matches_the_sync_exporter(tmp_path):
+    config = FundingDSLParser().parse_file('examples/example_funding.dsl')
+    target = tmp_path / "nested" / "FUNDING.yml"
+
+    content = asyncio.run(export_funding_config_async(config, 'github_yml', str(target)))
+
+    assert content == export_funding_config(config, 'github_yml')
+    assert target.read_text() == content
+
+
+def test_export_many_writes_every_format(tmp_path):
+    source = tmp_path / "in"
+    (source / "nested").mkdir(parents=True)
+    shutil.copy('examples/example_funding.dsl', source / "a.dsl")
+    shutil.copy('examples/minimal_funding.dsl', source / "nested" / "b.dsl")
+    (source / "broken.dsl").write_text('funding {')
+    out = tmp_path / "out"
+
+    async def main():
+        parser = AsyncFundingParser(workers=2, executor='thread')
+        results = {path: result async for path, result in
+                   export_many_async([str(source)], ['github_yml', 'markdown'], str(out), parser)}
+        await parser.aclose()
+        return results
+
+    results = asyncio.run(main())
+    assert isinstance(results[str(source / "broken.dsl")], Exception)
+    assert results[str(source / "nested" / "b.dsl")] == {
+        'github_yml': str(out / "nested" / "b.yml"), 'markdown': str(out / "nested" / "b.md")
+    }
+    assert (out / "a.yml").read_text() == export_funding_config(
+        FundingDSLParser().parse_file(str(source / "a.dsl")), 'github_yml')
+
+
+def test_export_many_never_overwrites_its_sources(tmp_path):
+    shutil.copy('examples/example_funding.dsl', tmp_path / "a.dsl")
+    original = (tmp_path / "a.dsl").read_text()
+
+    async def main():
+        return [result async for _, result in export_many_async([str(tmp_path)], ['json', 'dsl'], str(tmp_path))]
+
+    [result] = asyncio.run(main())
+    assert isinstance(result, ValueError)
+    assert (tmp_path / "a.dsl").read_text() == original
+    assert not (tmp_path / "a.json").exists()
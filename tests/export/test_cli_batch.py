@@ -0,0 +1,82 @@
+"""
+Tests for multi-file, multi-format export from the CLI
+"""
+
+import io
+import json
+import shutil
+
+import pytest
+
+from export.cli import main
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Two valid files in nested folders"""
+    source = tmp_path / "in"
+    (source / "nested").mkdir(parents=True)
+    shutil.copy('examples/example_funding.dsl', source / "a.dsl")
+    shutil.copy('examples/minimal_funding.dsl', source / "nested" / "b.dsl")
+    return source
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_exports_every_format_for_every_file(corpus, tmp_path, capsys, workers):
+    """Outputs mirror the input tree with one file per format"""
+    out = tmp_path / "out"
+    code = main([str(corpus), '-f', 'github_yml', '-f', 'json', '-o', str(out), '-j', workers])
+    summary = capsys.readouterr().out
+    print(summary)
+
+    assert code == 0
+    for stem in ("a", "nested/b"):
+        assert (out / f"{stem}.yml").exists()
+        assert json.loads((out / f"{stem}.json").read_text())['project']['name']
+    assert "Exported 2 file(s) to 4 output(s), 0 failed" in summary
+    assert "github_yml" in summary and "parse" in summary
+
+
+def test_reads_paths_from_stdin(corpus, tmp_path, monkeypatch):
+    """'-' takes a newline-separated list of paths from stdin"""
+    out = tmp_path / "out"
+    monkeypatch.setattr('sys.stdin', io.StringIO(f"{corpus / 'a.dsl'}\n\n{corpus / 'nested' / 'b.dsl'}\n"))
+
+    assert main(['-', '-f', 'markdown', '-o', str(out), '-j', '1']) == 0
+    assert sorted(p.name for p in out.rglob('*.md')) == ["a.md", "b.md"]
+
+
+def test_batch_reports_failures(corpus, tmp_path, capsys):
+    """A broken file fails on its own and sets the exit code"""
+    (corpus / "broken.dsl").write_text("not a funding file")
+
+    assert main([str(corpus), '-o', str(tmp_path / "out"), '-j', '1']) == 1
+    captured = capsys.readouterr()
+    assert "broken.dsl" in captured.err
+    assert "Exported 2 file(s) to 2 output(s), 1 failed" in captured.out
+
+
+def test_batch_requires_output_directory(corpus, capsys):
+    """Several inputs cannot share stdout"""
+    assert main([str(corpus)]) == 1
+    assert "--output DIR is required" in capsys.readouterr().err
+
+
+def test_single_file_still_prints_to_stdout(capsys):
+    """One file and one format keeps the original behaviour"""
+    assert main(['examples/minimal_funding.dsl', '-f', 'json']) == 0
+    assert json.loads(capsys.readouterr().out)['project']['name']
+
+
+def test_outputs_never_overwrite_their_sources(corpus, capsys):
+    """DSL outputs written into the input directory would replace the inputs"""
+    original = (corpus / "a.dsl").read_text()
+
+    assert main([str(corpus), '-f', 'dsl', '-f', 'json', '-o', str(corpus), '-j', '1']) == 1
+    assert "Refusing to overwrite the source" in capsys.readouterr().err
+    assert (corpus / "a.dsl").read_text() == original
+    assert not (corpus / "a.json").exists()
+
+    assert main([str(corpus / "a.dsl"), '-f', 'dsl', '-o', str(corpus / "a.dsl")]) == 1
+    assert "Refusing to overwrite the input file" in capsys.readouterr().err
+    assert (corpus / "a.dsl").read_text() == original
@@ -0,0 +1,183 @@
+"""
+Tests for the funding-export daemon and its thin client
+"""
+
+import io
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from export import client as client_module
+from export.cli import main
+from export.client import DaemonClient, DaemonError
+from export.daemon import FundingExportDaemon
+from export.funding_exporter import export_funding_config
+from metamodel.serialization import configuration_to_dict
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+EXAMPLE = os.path.abspath('examples/example_funding.dsl')
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    directory = tempfile.mkdtemp()  # Short, as Unix socket paths are limited to ~100 bytes
+    path = os.path.join(directory, 'daemon.sock')
+    monkeypatch.setenv('FUNDING_EXPORT_SOCKET', path)
+    yield path
+    shutil.rmtree(directory)
+
+
+@pytest.fixture
+def daemon(socket_path):
+    server = FundingExportDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_parse_validate_and_export_requests(daemon):
+    config = FundingDSLParser().parse_file(EXAMPLE)
+    with DaemonClient() as client:
+        assert client.request('ping')['pid'] == os.getpid()
+        assert client.request('parse', path=EXAMPLE) == configuration_to_dict(config)
+        assert client.request('parse', path='example_funding.dsl', cwd=os.path.dirname(EXAMPLE),
+                              backend='tokenizer') == \
+            configuration_to_dict(FundingDSLParser('tokenizer').parse_file(EXAMPLE))
+        assert client.request('validate', text=open(EXAMPLE).read()) == {'errors': []}
+        assert client.request('export', path=EXAMPLE, format='csv')['content'] == \
+            export_funding_config(config, 'csv')
+
+
+def test_export_writes_outputs(daemon, tmp_path):
+    with DaemonClient() as client:
+        result = client.request('export', path=EXAMPLE, format='markdown', output='out.md', cwd=str(tmp_path))
+    assert result == {'output': str(tmp_path / 'out.md')}
+    assert (tmp_path / 'out.md').read_text().startswith('# ')
+
+
+def test_failed_requests_keep_the_connection_usable(daemon):
+    with DaemonClient() as client:
+        with pytest.raises(DaemonError, match="Unknown op"):
+            client.request('compile')
+        with pytest.raises(DaemonError, match="'path' or a 'text'"):
+            client.request('parse')
+        with pytest.raises(DaemonError, match="ParseError"):
+            client.request('parse', path='missing.dsl')
+        with pytest.raises(DaemonError, match="Unsupported backend"):
+            client.request('parse', path=EXAMPLE, backend='antlr')
+        for flag in ('--watch', '--wat'):
+            with pytest.raises(DaemonError, match="--watch"):
+                client.request('run', argv=[EXAMPLE, flag, '-o', 'out'])
+        client._socket.sendall(b'not json\n')
+        assert b'Malformed request' in client._reader.readline()
+        assert client.request('ping')
+
+
+def test_concurrent_clients(daemon):
+    expected = configuration_to_dict(FundingDSLParser().parse_file(EXAMPLE))
+    results = []
+
+    def work():
+        with DaemonClient() as client:
+            results.extend(client.request('parse', path=EXAMPLE) for _ in range(10))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [expected] * 80
+
+
+def test_requests_wait_while_a_run_request_holds_the_process(daemon):
+    done = threading.Event()
+
+    def parse():
+        with DaemonClient() as client:
+            client.request('parse', path=EXAMPLE)
+        done.set()
+
+    with daemon._gate.exclusive():  # As a run request does
+        thread = threading.Thread(target=parse)
+        thread.start()
+        assert not done.wait(0.2)
+        with DaemonClient() as client:
+            assert client.request('ping')  # Not gated
+    thread.join(5)
+    assert done.is_set()
+
+
+def test_client_matches_the_cli_with_and_without_a_daemon(socket_path, capsys, monkeypatch):
+    argv = ['example_funding.dsl', '-f', 'github_yml', '--validate']
+    monkeypatch.chdir(os.path.dirname(EXAMPLE))
+    assert main(argv) == 0
+    expected = capsys.readouterr().out
+
+    assert client_module.main(argv) == 0  # No daemon: runs in-process
+    assert capsys.readouterr().out == expected
+
+    server = FundingExportDaemon(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert client_module.main(argv) == 0
+        assert capsys.readouterr().out == expected
+        monkeypatch.setattr('sys.stdin', io.StringIO('example_funding.dsl\n'))
+        assert client_module.main(['-', '-f', 'github_yml']) == 0
+        assert capsys.readouterr().out == expected
+        assert client_module.main(['missing.dsl']) == 1
+        assert "not found" in capsys.readouterr().err
+        assert server.requests_served == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_refuses_a_live_socket_and_replaces_a_stale_one(daemon, socket_path):
+    with pytest.raises(RuntimeError, match="already listening"):
+        FundingExportDaemon(socket_path)
+
+    stale_path = socket_path + '.stale'
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(stale_path)
+    stale.close()
+    replacement = FundingExportDaemon(stale_path)
+    replacement.server_close()
+    assert not os.path.exists(stale_path)
+
+
+def test_default_socket_is_in_a_private_directory(monkeypatch):
+    temp = tempfile.mkdtemp()  # Short, as Unix socket paths are limited to ~100 bytes
+    monkeypatch.delenv('FUNDING_EXPORT_SOCKET', raising=False)
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    monkeypatch.setattr(tempfile, 'tempdir', temp)
+    path = client_module.default_socket_path()
+    assert os.path.dirname(path) == os.path.join(temp, f"funding-export-{os.getuid()}")
+
+    server = FundingExportDaemon()
+    try:
+        assert server.socket_path == path
+        assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+    finally:
+        server.server_close()
+        shutil.rmtree(temp)
+
+
+def test_sockets_of_other_users_are_never_used_or_removed(daemon, socket_path, monkeypatch):
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+    with pytest.raises(PermissionError):
+        DaemonClient()
+    assert client_module.connect() is None
+    with pytest.raises(RuntimeError, match="another user"):
+        FundingExportDaemon(socket_path)
+    assert os.path.exists(socket_path)
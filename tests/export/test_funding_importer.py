@@ -0,0 +1,119 @@
+"""
+Tests for the FUNDING.yml importer
+"""
+
+import pytest
+
+from export.cli import main
+from export.funding_exporter import FundingExporter
+from export.funding_importer import (
+    UnsupportedYAML, import_funding_yml, import_funding_yml_text, import_many, load_funding_yml
+)
+from metamodel.funding_metamodel import FundingPlatform
+import textual.batch_parser as batch_parser
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+SAMPLES = [
+    "github: [octocat, surftocat]\npatreon: octocat\ncustom: ['https://paypal.me/o', \"https://o.com\"]\n",
+    "# comment\n---\ngithub:\n  - a # first\n  - 'b''s'\npatreon: # Replace\nko_fi: ~\n",
+    "tidelift: npm/octo-package\nliberapay: \"\\u00e9\"\ncustom: []\nissuehunt: null\n",
+    "github:\n- 123\n- yes\npolar: [x, ]\n",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+@pytest.mark.parametrize("loader", ["libyaml", "pyyaml"])
+def test_subset_loader_matches_pyyaml(text, loader):
+    assert load_funding_yml(text, 'subset') == load_funding_yml(text, loader)
+
+
+@pytest.mark.parametrize("text", [
+    "github: {a: b}\n", "github: &x a\n", "github: [a,\n  b]\n", "github: a\n  more\n",
+    "github: |\n  a\n", "github:\n  - [a]\n", "github: a: b\n",
+])
+def test_subset_loader_rejects_the_rest_and_auto_falls_back(text):
+    with pytest.raises(UnsupportedYAML):
+        load_funding_yml(text, 'subset')
+
+    try:
+        expected = load_funding_yml(text, 'pyyaml')
+    except ValueError:
+        with pytest.raises(ValueError):
+            load_funding_yml(text, 'auto')
+    else:
+        assert load_funding_yml(text, 'auto') == expected
+
+
+def test_round_trips_the_exporter():
+    config = FundingDSLParser().parse_file('tests/textual_textx/test_equivalent.dsl')
+    yml = FundingExporter(config).to_github_funding_yml()
+
+    imported = import_funding_yml_text(yml, config.project_name)
+
+    assert FundingExporter(imported).to_github_funding_yml() == yml
+    custom = imported.sources_by_platform()[FundingPlatform.CUSTOM]
+    assert all(source.custom_url == source.username for source in custom)
+
+
+def test_names_are_kept_as_written():
+    config = import_funding_yml_text("github: [123, yes, null]\nko_fi: 1e3\nlfx_crowdfunding: octo\n", "p")
+
+    assert [(s.platform, s.username) for s in config.funding_sources] == [
+        (FundingPlatform.GITHUB_SPONSORS, "123"), (FundingPlatform.GITHUB_SPONSORS, "yes"),
+        (FundingPlatform.KO_FI, "1e3"), (FundingPlatform.COMMUNITY_BRIDGE, "octo"),
+    ]
+
+
+def test_unknown_keys_and_values_are_rejected():
+    with pytest.raises(ValueError, match="Unknown FUNDING.yml key: paypal"):
+        import_funding_yml_text("paypal: me\n", "p")
+    with pytest.raises(ValueError, match="must be a name or a list"):
+        import_funding_yml_text("github: {a: b}\n", "p")
+
+
+@pytest.fixture
+def repos(tmp_path):
+    """Two repositories with FUNDING.yml in .github/ and at the root, one broken"""
+    (tmp_path / "alpha" / ".github").mkdir(parents=True)
+    (tmp_path / "alpha" / ".github" / "FUNDING.yml").write_text("github: alpha\npatreon: a\n")
+    (tmp_path / "beta").mkdir()
+    (tmp_path / "beta" / "FUNDING.yml").write_text("ko_fi: beta\n")
+    (tmp_path / "gamma").mkdir()
+    (tmp_path / "gamma" / "FUNDING.yml").write_text("unknown: x\n")
+    (tmp_path / "beta" / "other.yml").write_text("github: ignored\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_import_many_names_projects_after_repositories(repos, workers):
+    results = dict(import_many([repos], workers=workers))
+
+    assert len(results) == 3
+    ok = {r.config.project_name: r for r in results.values() if not isinstance(r, Exception)}
+    assert sorted(ok) == ["alpha", "beta"]
+    assert len(ok["alpha"].config.funding_sources) == 2
+    assert ok["beta"].size == len("ko_fi: beta\n")
+    assert set(ok["beta"].timings) == {'read', 'load', 'build'}
+    assert import_funding_yml(repos / "alpha" / ".github" / "FUNDING.yml").project_name == "alpha"
+
+
+def test_import_many_builds_no_parser(repos, monkeypatch):
+    def no_parser(*args):
+        raise AssertionError("import_many does not parse DSL")
+
+    monkeypatch.setattr(batch_parser, 'create_parser', no_parser)
+    results = dict(import_many([repos], workers=1))
+
+    assert sum(not isinstance(r, Exception) for r in results.values()) == 2
+
+def test_import_command_reports_throughput(repos, capsys):
+    assert main(['import', str(repos), '-j', '1', '--quiet']) == 1
+    captured = capsys.readouterr()
+
+    assert "Unknown FUNDING.yml key: unknown" in captured.err
+    assert "Imported 2 file(s), 1 failed" in captured.out
+    assert "files/s" in captured.out and "MB/s" in captured.out
+    assert main(['import', str(repos), '-j', '1', '--pattern', '*.yml', '--quiet']) == 1
+    assert "Imported 3 file(s), 1 failed" in capsys.readouterr().out
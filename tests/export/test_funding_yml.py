@@ -0,0 +1,68 @@
+"""
+Tests for the table-driven FUNDING.yml emitter
+"""
+
+import pytest
+import yaml
+
+from export.funding_exporter import FundingExporter
+from metamodel.funding_metamodel import FundingConfiguration, FundingSource, FundingPlatform
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+def export(*sources):
+    config = FundingConfiguration(project_name="any")
+    for source in sources:
+        config.add_funding_source(source)
+    return FundingExporter(config).to_github_funding_yml()
+
+
+def test_matches_githubs_example():
+    config = FundingDSLParser().parse_file('tests/textual_textx/test_equivalent.dsl')
+
+    with open('TEST-FUNDING.yml') as f:
+        assert FundingExporter(config).to_github_funding_yml() == f.read().strip() + "\n"
+
+
+def test_output_follows_the_sources_for_any_project_name():
+    yml = export(FundingSource(FundingPlatform.KO_FI, "octo"))
+    config = FundingDSLParser().parse_file('examples/minimal_funding.dsl')
+
+    assert yml == "ko_fi: octo\n"
+    assert FundingExporter(config).to_github_funding_yml() == (
+        "github: [octocat, surftocat]\n"
+        "patreon: octocat\n"
+        'custom: ["https://tidelift.com/funding/github/npm/octo-package", '
+        '"https://www.paypal.me/octocat", "https://octocat.com"]\n'
+    )
+
+
+def test_keys_follow_githubs_order_and_skip_unsupported_sources():
+    yml = export(
+        FundingSource(FundingPlatform.CUSTOM, "site", custom_url="example.com"),
+        FundingSource(FundingPlatform.PAYPAL, "me"),
+        FundingSource(FundingPlatform.LIBERAPAY, "lp"),
+        FundingSource(FundingPlatform.PATREON, "old", is_active=False),
+        FundingSource(FundingPlatform.GITHUB_SPONSORS, "gh"),
+    )
+
+    assert yml == "github: gh\nliberapay: lp\ncustom: example.com\n"
+
+
+@pytest.mark.parametrize("value", [
+    "null", "Yes", "off", "123", "1.5", "1e3", "0x1f", "1:20", "2024-01-01", ".inf",
+    "-dash", "a: b", "a #b", "#x", "a,b", "[x]", "q?", " pad", 'say "hi"', "tab\there", "", "é-user"
+])
+def test_any_username_reads_back_unchanged(value):
+    yml = export(FundingSource(FundingPlatform.GITHUB_SPONSORS, value),
+                 FundingSource(FundingPlatform.PATREON, value),
+                 FundingSource(FundingPlatform.PATREON, value))
+
+    assert yaml.safe_load(yml) == {'github': value, 'patreon': [value, value]}
+
+
+def test_plain_names_stay_unquoted():
+    yml = export(FundingSource(FundingPlatform.TIDELIFT, "npm/octo-package"),
+                 FundingSource(FundingPlatform.THANKS_DEV, "u/gh/octo.cat_1"))
+
+    assert yml == "tidelift: npm/octo-package\nthanks_dev: u/gh/octo.cat_1\n"
@@ -0,0 +1,93 @@
+"""
+Tests for JSON Lines bulk export and lazy import
+"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from export import write_jsonl, iter_jsonl
+from export.cli import main
+from metamodel.serialization import configuration_to_dict
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+@pytest.fixture
+def configs():
+    parser = FundingDSLParser()
+    return [parser.parse_file('examples/example_funding.dsl'), parser.parse_file('examples/minimal_funding.dsl')]
+
+
+def test_round_trip_is_lossless(configs, tmp_path):
+    """Every configuration comes back field for field"""
+    path = tmp_path / "fleet.jsonl"
+    with open(path, 'w', encoding='utf-8') as f:
+        assert write_jsonl(configs, f) == 2
+
+    loaded = list(iter_jsonl(path))
+    assert [configuration_to_dict(c) for c in loaded] == [configuration_to_dict(c) for c in configs]
+
+
+def test_records_are_compact_and_stable(configs):
+    """One line per record, fixed key order and no timestamps"""
+    first, second = io.StringIO(), io.StringIO()
+    write_jsonl(configs, first)
+    write_jsonl(configs, second)
+
+    lines = first.getvalue().splitlines()
+    assert first.getvalue() == second.getvalue()
+    assert len(lines) == 2
+    assert list(json.loads(lines[0]))[:3] == ['project_name', 'description', 'preferred_currency']
+    assert ', ' not in lines[1] and 'generated_at' not in lines[0]
+
+
+def test_binary_streams_and_blank_lines(configs):
+    """Binary streams work both ways and blank lines are ignored"""
+    stream = io.BytesIO()
+    write_jsonl(configs, stream)
+    stream = io.BytesIO(stream.getvalue() + b"\n\n")
+
+    assert [c.project_name for c in iter_jsonl(stream)] == [c.project_name for c in configs]
+
+
+def test_bad_record_reports_line_number(configs):
+    """Records before a malformed line are yielded, then the error names the line"""
+    stream = io.StringIO()
+    write_jsonl(configs[:1], stream)
+    stream = io.StringIO(stream.getvalue() + '{"broken": true}\n')
+
+    loader = iter_jsonl(stream)
+    assert next(loader).project_name == configs[0].project_name
+    with pytest.raises(ValueError, match="Line 2"):
+        next(loader)
+
+
+def test_loader_memory_is_constant(configs, tmp_path):
+    """Reading ten times as many records does not raise peak memory"""
+    def peak(count):
+        path = tmp_path / f"{count}.jsonl"
+        with open(path, 'w', encoding='utf-8') as f:
+            write_jsonl((configs[0] for _ in range(count)), f)
+        tracemalloc.start()
+        for _ in iter_jsonl(path):
+            pass
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak_bytes
+
+    small, large = peak(200), peak(2000)
+    print(f"Peak while loading: 200 records {small / 1024:.0f} KiB, 2000 records {large / 1024:.0f} KiB")
+    assert large < small * 2
+
+
+def test_parse_command_appends_jsonl(tmp_path):
+    """'parse --jsonl' collects every parsed file into one dump"""
+    dump = tmp_path / "fleet.jsonl"
+    assert main(['parse', 'examples', '-j', '1', '--quiet', '--jsonl', str(dump)]) == 0
+
+    assert sorted(c.project_name for c in iter_jsonl(dump)) == sorted(
+        FundingDSLParser().parse_file(p).project_name
+        for p in ('examples/example_funding.dsl', 'examples/minimal_funding.dsl')
+    )
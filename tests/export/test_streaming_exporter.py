@@ -0,0 +1,87 @@
+"""
+Tests for the streaming write_<format> exporter API
+"""
+
+import io
+import re
+import tracemalloc
+
+import pytest
+
+from export import FundingExporter, write_funding_config
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform
+)
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+def _without_timestamp(text):
+    return re.sub(r'"generated_at": "[^"]*"', '', text)
+
+
+@pytest.fixture
+def config():
+    return FundingDSLParser().parse_file('examples/example_funding.dsl')
+
+
+@pytest.mark.parametrize("method", ['github_funding_yml', 'json', 'markdown', 'csv'])
+def test_write_matches_to_string(config, method):
+    """write_<format> produces exactly what to_<format> returns"""
+    exporter = FundingExporter(config)
+    text, binary = io.StringIO(), io.BytesIO()
+    getattr(exporter, f'write_{method}')(text)
+    getattr(exporter, f'write_{method}')(binary)
+
+    expected = _without_timestamp(getattr(exporter, f'to_{method}')())
+    assert _without_timestamp(text.getvalue()) == expected
+    assert _without_timestamp(binary.getvalue().decode('utf-8')) == expected
+    assert not binary.closed
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_json_stream_is_valid_json(config, pretty):
+    """Streamed JSON equals json.dumps of the same data"""
+    import json
+    stream = io.StringIO()
+    FundingExporter(config).write_json(stream, pretty=pretty)
+
+    data = json.loads(stream.getvalue())
+    assert data['project']['name'] == config.project_name
+    assert len(data['tiers']) == len(config.tiers)
+
+
+def test_many_configs_share_one_stream(config):
+    """Several configurations can be concatenated into one output stream"""
+    stream = io.StringIO()
+    for _ in range(3):
+        write_funding_config(config, 'csv', stream)
+
+    assert stream.getvalue().count('Platform,Username') == 3
+
+
+def test_streaming_memory_stays_flat():
+    """Writing a large config does not build the whole output in memory"""
+    config = FundingConfiguration(project_name="Large")
+    config.add_funding_source(FundingSource(FundingPlatform.GITHUB_SPONSORS, "octocat"))
+    for i in range(5000):
+        config.add_tier(FundingTier(f"Tier {i}", FundingAmount(5.0 + i), benefits=[f"Benefit {j}" for j in range(5)]))
+        config.add_goal(FundingGoal(f"Goal {i}", FundingAmount(100.0 + i)))
+    exporter = FundingExporter(config)
+
+    def peak(export):
+        tracemalloc.start()
+        export()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak_bytes
+
+    class NullSink(io.TextIOBase):
+        def write(self, chunk):
+            return len(chunk)
+
+    for method in ('json', 'markdown'):
+        buffered = peak(getattr(exporter, f'to_{method}'))
+        streamed = peak(lambda: getattr(exporter, f'write_{method}')(NullSink()))
+        print(f"{method}: to_* peak {buffered / 1024:.0f} KiB, write_* peak {streamed / 1024:.0f} KiB")
+        assert streamed * 10 < buffered
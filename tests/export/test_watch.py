@@ -0,0 +1,111 @@
+"""
+Tests for watch mode's incremental rebuild of exported artifacts
+"""
+
+import os
+import shutil
+
+import pytest
+
+from export.cli import main
+from export.watch import ExportWatcher
+
+
+FORMATS = ['github_yml', 'json', 'mermaid']
+
+
+@pytest.fixture
+def tree(tmp_path):
+    source = tmp_path / "in"
+    (source / "nested").mkdir(parents=True)
+    shutil.copy('examples/example_funding.dsl', source / "a.dsl")
+    shutil.copy('examples/minimal_funding.dsl', source / "nested" / "b.dsl")
+    return source
+
+
+def edit(path, text):
+    """Write a file with a new mtime, whatever the filesystem's timestamp resolution"""
+    mtime = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+
+def test_first_poll_writes_every_output_and_restarts_write_nothing(tree, tmp_path):
+    out = tmp_path / "out"
+    report = ExportWatcher([str(tree)], FORMATS, str(out)).poll()
+
+    assert sorted(os.path.relpath(p, out) for p in report.written) == \
+        ['a.json', 'a.mmd', 'a.yml', 'nested/b.json', 'nested/b.mmd', 'nested/b.yml']
+    restarted = ExportWatcher([str(tree)], FORMATS, str(out)).poll()
+    assert (restarted.parsed, restarted.written, restarted.unchanged) == ([], [], 6)
+
+
+def test_only_changed_files_and_outputs_are_rebuilt(tree, tmp_path):
+    out = tmp_path / "out"
+    watcher = ExportWatcher([str(tree)], FORMATS, str(out))
+    watcher.poll()
+    json_mtime = os.stat(out / "nested" / "b.json").st_mtime_ns
+
+    os.utime(tree / "a.dsl", ns=(1, 1))  # Touched only
+    assert not watcher.poll()
+
+    b = tree / "nested" / "b.dsl"
+    edit(b, b.read_text() + "\n// A comment\n")  # Same configuration
+    report = watcher.poll()
+    assert (report.parsed, report.written) == ([str(b)], [])
+    assert os.stat(out / "nested" / "b.json").st_mtime_ns == json_mtime
+
+    edit(b, b.read_text().replace('"octo-package"', '"renamed"'))
+    report = watcher.poll()
+    assert report.parsed == [str(b)]
+    # FUNDING.yml holds no project name, so its rendering is unchanged and not rewritten
+    assert sorted(os.path.basename(p) for p in report.written) == ['b.json', 'b.mmd']
+    assert report.unchanged == 1
+    assert '"renamed"' in (out / "nested" / "b.json").read_text()
+
+
+def test_new_broken_and_deleted_sources(tree, tmp_path):
+    out = tmp_path / "out"
+    watcher = ExportWatcher([str(tree)], ['github_yml'], str(out))
+    watcher.poll()
+
+    edit(tree / "c.dsl", (tree / "a.dsl").read_text())
+    edit(tree / "broken.dsl", "funding {")
+    report = watcher.poll()
+    assert report.written == [str(out / "c.yml")]
+    assert [path for path, _ in report.failed] == [str(tree / "broken.dsl")]
+    assert not watcher.poll().failed  # Retried only once edited again
+
+    (out / "a.yml").write_text("edited by hand\n")
+    os.unlink(tree / "a.dsl")
+    os.unlink(tree / "c.dsl")
+    report = watcher.poll()
+    assert report.removed == [str(out / "c.yml")]
+    assert (out / "a.yml").exists()
+
+
+def test_cli_requires_an_output_directory(tree, capsys):
+    assert main(['--watch', str(tree)]) == 1
+    assert "--watch requires --output DIR" in capsys.readouterr().err
+
+
+def test_output_directory_inside_the_watched_tree_is_not_an_input(tree):
+    out = tree / "out"
+    watcher = ExportWatcher([str(tree)], ['dsl'], str(out))
+    assert sorted(os.path.relpath(p, out) for p in watcher.poll().written) == ['a.dsl', 'nested/b.dsl']
+
+    edit(tree / "a.dsl", (tree / "a.dsl").read_text() + "\n// Edited\n")
+    report = watcher.poll()
+    assert report.parsed == [str(tree / "a.dsl")]
+    assert not (out / "out").exists()
+
+
+def test_invalid_configurations_fail_without_outputs_when_validating(tree, tmp_path):
+    out = tmp_path / "out"
+    edit(tree / "empty.dsl", 'funding "Empty" { }')
+    report = ExportWatcher([str(tree)], ['github_yml'], str(out), validate=True).poll()
+
+    assert [path for path, _ in report.failed] == [str(tree / "empty.dsl")]
+    assert "Validation failed" in str(report.failed[0][1])
+    assert not (out / "empty.yml").exists()
+    assert (out / "a.yml").exists()
@@ -0,0 +1,66 @@
+"""
+Tests for validate_many and the ValidationErrorTable
+"""
+
+import multiprocessing
+
+import pytest
+
+from metamodel.batch_validation import validate_many, ValidationError
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier, FundingAmount,
+    FundingPlatform, FundingModelValidator
+)
+
+
+def build_configurations():
+    configs = []
+    for i in range(40):
+        config = FundingConfiguration(project_name="" if i % 7 == 0 else f"project-{i}")
+        if i % 5:
+            config.add_beneficiary(Beneficiary(f"maintainer-{i}"))
+        config.add_funding_source(FundingSource(FundingPlatform.GITHUB_SPONSORS, f"user{i}"))
+        config.add_funding_source(FundingSource(FundingPlatform.TIDELIFT, "cargo/x" if i % 3 == 0 else "npm/x"))
+        config.add_funding_source(FundingSource(FundingPlatform.THANKS_DEV, "" if i % 4 == 0 else "u/gh/x"))
+        config.add_tier(FundingTier("Gold", FundingAmount(5.0)))
+        config.add_tier(FundingTier("Gold" if i % 6 == 0 else "Silver", FundingAmount(10.0)))
+        configs.append(config)
+    return configs
+
+
+def test_table_matches_validate_configuration():
+    configs = build_configurations()
+    table = validate_many(configs)
+
+    for index, config in enumerate(configs):
+        assert table.messages_for(index) == FundingModelValidator.validate_configuration(config)
+    assert table.invalid_configs() == [
+        index for index, config in enumerate(configs) if FundingModelValidator.validate_configuration(config)
+    ]
+
+
+def test_rows_name_entity_position_and_rule():
+    table = validate_many(build_configurations())
+    rows = [row for row in table if row.config == 0]
+
+    assert ValidationError(0, 'source', 1, 'tidelift-username',
+                           "Tidelift platform name must be one of: npm, pypi, rubygems, maven, packagist, nuget") in rows
+    assert ValidationError(0, 'tiers', -1, 'unique-tier-names', "Funding tier names must be unique") in rows
+    assert table.counts_by_rule()['project-name'] == 6
+    assert len(table) == sum(table.counts_by_rule().values())
+
+
+@pytest.mark.parametrize("start_method", ['fork', 'spawn'])
+def test_worker_pool_gives_the_same_table(monkeypatch, start_method):
+    # 'spawn' only changes how configurations reach the workers (pickled chunks)
+    monkeypatch.setattr(multiprocessing, 'get_start_method', lambda: start_method)
+    configs = build_configurations()
+
+    parallel = validate_many(configs, workers=2)
+    serial = validate_many(configs)
+
+    assert list(parallel) == list(serial)
+
+
+def test_empty_input():
+    assert len(validate_many([], workers=4)) == 0
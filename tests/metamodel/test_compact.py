@@ -0,0 +1,87 @@
+"""
+Tests for the slotted and frozen metamodel variants
+"""
+
+import dataclasses
+
+import pytest
+
+from export.funding_exporter import FundingExporter
+from metamodel import CompactBuilder, compact_configuration, configuration_to_dict
+from metamodel.compact import (
+    SlottedFundingAmount, SlottedFundingGoal, FrozenFundingAmount, FrozenFundingGoal,
+    FrozenFundingTier, ZERO_AMOUNT
+)
+from metamodel.funding_metamodel import FundingModelValidator
+from metamodel.money import CentsAmount
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+@pytest.fixture
+def config():
+    return FundingDSLParser().parse_file('examples/example_funding.dsl')
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_compact_configuration_is_equivalent(config, frozen):
+    """Serialization, export and validation see the same data"""
+    compact = compact_configuration(config, frozen=frozen)
+
+    assert configuration_to_dict(compact) == configuration_to_dict(config)
+    assert FundingExporter(compact).to_markdown() == FundingExporter(config).to_markdown()
+    assert FundingModelValidator.validate_configuration(compact) == FundingModelValidator.validate_configuration(config)
+    for entity in compact.funding_sources + compact.tiers + compact.goals + compact.beneficiaries:
+        assert not hasattr(entity, '__dict__')
+
+
+def test_variants_keep_fields_and_methods():
+    """Fields, defaults, __str__ and properties match the regular classes"""
+    goal = SlottedFundingGoal("Servers", SlottedFundingAmount(200.0), current_amount=SlottedFundingAmount(50.0))
+
+    assert [f.name for f in dataclasses.fields(goal)] == [
+        'name', 'target_amount', 'description', 'deadline', 'current_amount', 'is_reached'
+    ]
+    assert goal.progress_percentage == 25.0
+    assert str(goal) == "Servers: 50.0 USD/200.0 USD"
+    assert isinstance(SlottedFundingGoal("x", SlottedFundingAmount(1.0)).current_amount, SlottedFundingAmount)
+
+
+def test_frozen_variants_share_values():
+    """Frozen goals share one zero amount, and equal amounts are shared across configs"""
+    assert FrozenFundingGoal("x", FrozenFundingAmount(1.0)).current_amount is ZERO_AMOUNT
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ZERO_AMOUNT.value = 5
+
+    builder = CompactBuilder(frozen=True)
+    parser = FundingDSLParser()
+    first = builder.configuration(parser.parse_file('examples/example_funding.dsl'))
+    second = builder.configuration(parser.parse_file('examples/example_funding.dsl'))
+    assert isinstance(first.tiers[0], FrozenFundingTier)
+    assert first.tiers[0].amount is second.tiers[0].amount
+    assert first.tiers[0].name is second.tiers[0].name
+
+
+def test_slotted_amounts_are_not_shared(config):
+    """Mutable variants get their own amount objects"""
+    compact = compact_configuration(config)
+    compact.goals[0].current_amount.value += 1
+
+    assert compact.goals[0].current_amount.value == config.goals[0].current_amount.value + 1
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_cents_amounts_stay_exact(frozen):
+    """Amounts parsed with money='cents' are not turned into float amounts"""
+    parser = FundingDSLParser(money='cents')
+    builder = CompactBuilder(frozen=frozen)
+    config = parser.parse_file('examples/example_funding.dsl')
+    compact = builder.configuration(config)
+
+    for original, converted in zip(config.tiers + config.goals, compact.tiers + compact.goals):
+        amount = getattr(converted, 'amount', None) or converted.target_amount
+        assert isinstance(amount, CentsAmount)
+        assert amount == (getattr(original, 'amount', None) or original.target_amount)
+    assert compact.tiers[0].amount.cents == config.tiers[0].amount.cents
+    if frozen:
+        again = builder.configuration(parser.parse_file('examples/example_funding.dsl'))
+        assert again.tiers[0].amount is compact.tiers[0].amount
@@ -0,0 +1,94 @@
+"""
+Tests for currency normalization with a local rate table
+"""
+
+import json
+
+import pytest
+
+import metamodel.funding_catalog as catalog_module
+from graphical.interactive_diagrams import InteractiveDiagramGenerator
+from metamodel.currency import RateTable, CurrencyConverter, clear_factor_cache
+from metamodel.funding_catalog import FundingCatalog
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingTier, FundingGoal, FundingAmount, CurrencyType
+)
+
+
+@pytest.fixture
+def converter(tmp_path):
+    path = tmp_path / "rates.json"
+    path.write_text(json.dumps({"base": "USD", "rates": {"USD": 1.0, "EUR": 0.5, "GBP": 0.25}}))
+    clear_factor_cache()
+    return CurrencyConverter(RateTable.from_file(path))
+
+
+def test_convert_single_amounts(converter):
+    assert converter.convert(FundingAmount(10.0, CurrencyType.EUR), CurrencyType.USD) == FundingAmount(20.0)
+    assert converter.convert(FundingAmount(8.0, CurrencyType.USD), CurrencyType.GBP) == FundingAmount(2.0, CurrencyType.GBP)
+    assert converter.total([FundingAmount(1.0), FundingAmount(1.0, CurrencyType.EUR)], CurrencyType.USD).value == 3.0
+    with pytest.raises(ValueError, match="CAD"):
+        converter.convert(FundingAmount(1.0, CurrencyType.CAD), CurrencyType.USD)
+
+
+def test_factors_are_cached_per_table(converter, tmp_path):
+    """Converters over identical tables share one factor list"""
+    other = CurrencyConverter(RateTable(dict(converter.rate_table.rates)))
+
+    assert other.factors(CurrencyType.USD) is converter.factors(CurrencyType.USD)
+
+
+def test_goal_progress_uses_target_currency(converter):
+    goal = FundingGoal("Servers", FundingAmount(100.0, CurrencyType.USD),
+                       current_amount=FundingAmount(25.0, CurrencyType.EUR))
+
+    assert converter.goal_progress(goal) == 50.0
+
+
+def test_invalid_tables_are_rejected(tmp_path):
+    path = tmp_path / "rates.json"
+    path.write_text(json.dumps({"base": "USD", "rates": {"USD": 1.0, "XYZ": 2.0}}))
+    with pytest.raises(ValueError, match="Invalid rate table"):
+        RateTable.from_file(path)
+    with pytest.raises(ValueError, match="base currency"):
+        RateTable({CurrencyType.USD: 2.0})
+
+
+def test_bundled_table_covers_every_currency():
+    table = RateTable.from_file()
+
+    assert set(table.rates) == set(CurrencyType)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "stdlib"])
+def test_catalog_rollups(converter, monkeypatch, use_numpy):
+    if use_numpy and not catalog_module.NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(catalog_module, 'NUMPY_AVAILABLE', use_numpy)
+    config = FundingConfiguration(project_name="Mixed")
+    config.add_tier(FundingTier("A", FundingAmount(10.0)))
+    config.add_tier(FundingTier("B", FundingAmount(10.0, CurrencyType.EUR)))
+    config.add_goal(FundingGoal("G1", FundingAmount(100.0)))
+    config.add_goal(FundingGoal("G2", FundingAmount(100.0, CurrencyType.GBP), is_reached=True))
+    catalog = FundingCatalog([config])
+
+    assert catalog.total_targets(CurrencyType.USD, converter) == 500.0
+    assert catalog.total_targets(CurrencyType.USD, converter, include_reached=False) == 100.0
+    assert catalog.tier_price_percentiles((0, 100), normalize_to=CurrencyType.USD, converter=converter) == {
+        0: 10.0, 100: 20.0
+    }
+
+
+def test_analyze_configuration_normalizes(converter):
+    config = FundingConfiguration(project_name="Mixed", preferred_currency=CurrencyType.EUR)
+    config.add_tier(FundingTier("A", FundingAmount(10.0)))
+    config.add_goal(FundingGoal("G1", FundingAmount(100.0), current_amount=FundingAmount(10.0, CurrencyType.EUR)))
+
+    raw = InteractiveDiagramGenerator(config).analyze_configuration()
+    normalized = InteractiveDiagramGenerator(config).analyze_configuration(converter)
+
+    assert raw['currency'] is None and raw['tier_analysis']['max_tier_price'] == 10.0
+    assert normalized['currency'] == "EUR"
+    assert normalized['tier_analysis']['max_tier_price'] == 5.0
+    assert normalized['goal_analysis']['total_target_amount'] == 50.0
+    assert normalized['goal_analysis']['overall_progress'] == 20.0
@@ -0,0 +1,104 @@
+"""
+Tests for the columnar FundingCatalog
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import metamodel.funding_catalog as catalog_module
+from metamodel.funding_catalog import FundingCatalog
+from metamodel.funding_metamodel import (
+    FundingConfiguration, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform, CurrencyType
+)
+from textual.funding_dsl_parser import FundingDSLParser
+
+
+NOW = datetime(2030, 1, 1)
+EXAMPLES = Path(__file__).parent.parent.parent / "examples"
+
+
+def build_configuration(name, prices, currency=CurrencyType.USD):
+    config = FundingConfiguration(project_name=name)
+    config.add_funding_source(FundingSource(FundingPlatform.GITHUB_SPONSORS, name))
+    config.add_funding_source(FundingSource(FundingPlatform.PATREON, name, is_active=False))
+    for price in prices:
+        config.add_tier(FundingTier(f"{name} {price}", FundingAmount(price, currency)))
+    config.add_goal(FundingGoal("Soon", FundingAmount(100.0, currency), deadline=NOW + timedelta(days=10),
+                                current_amount=FundingAmount(20.0, currency)))
+    config.add_goal(FundingGoal("Later", FundingAmount(50.0, currency), deadline=NOW + timedelta(days=90)))
+    config.add_goal(FundingGoal("Done", FundingAmount(10.0, currency), deadline=NOW - timedelta(days=1),
+                                is_reached=True))
+    return config
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "stdlib"])
+def catalog(request, monkeypatch):
+    """The same catalog, aggregated with and without NumPy"""
+    if request.param and not catalog_module.NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(catalog_module, 'NUMPY_AVAILABLE', request.param)
+    return FundingCatalog([
+        build_configuration("alpha", [5.0, 10.0, 20.0]),
+        build_configuration("beta", [15.0, 25.0], CurrencyType.EUR),
+    ])
+
+
+def test_platform_distribution(catalog):
+    assert len(catalog) == 2
+    assert catalog.platform_distribution() == {FundingPlatform.GITHUB_SPONSORS: 2}
+    assert catalog.platform_distribution(active_only=False) == {
+        FundingPlatform.GITHUB_SPONSORS: 2, FundingPlatform.PATREON: 2
+    }
+
+
+def test_total_targets_by_currency(catalog):
+    assert catalog.total_targets_by_currency() == {CurrencyType.USD: 160.0, CurrencyType.EUR: 160.0}
+    assert catalog.total_targets_by_currency(include_reached=False) == {
+        CurrencyType.USD: 150.0, CurrencyType.EUR: 150.0
+    }
+
+
+def test_tier_price_percentiles(catalog):
+    assert catalog.tier_price_percentiles((0, 50, 100)) == {0: 5.0, 50: 15.0, 100: 25.0}
+    assert catalog.tier_price_percentiles((50,), currency=CurrencyType.USD) == {50: 10.0}
+    assert catalog.tier_price_percentiles((25,), currency=CurrencyType.EUR) == {25: 17.5}
+    assert catalog.tier_price_percentiles(currency=CurrencyType.GBP) == {}
+
+
+def test_goals_at_risk(catalog):
+    at_risk = catalog.goals_at_risk(within=timedelta(days=30), now=NOW)
+
+    assert [(g['project_name'], g['goal_name']) for g in at_risk] == [("alpha", "Soon"), ("beta", "Soon")]
+    assert at_risk[0]['progress_percentage'] == 20.0
+    assert at_risk[0]['deadline'] == NOW + timedelta(days=10)
+    assert catalog.goals_at_risk(within=timedelta(days=30), min_progress=10.0, now=NOW) == []
+    assert len(catalog.goals_at_risk(within=timedelta(days=365), now=NOW)) == 4
+
+
+def test_empty_catalog(catalog):
+    empty = FundingCatalog()
+
+    assert empty.platform_distribution() == {}
+    assert empty.total_targets_by_currency() == {}
+    assert empty.tier_price_percentiles() == {}
+    assert empty.goals_at_risk(now=NOW) == []
+
+
+@pytest.mark.parametrize('engine', ['regex', 'tokenizer'])
+def test_catalog_of_parsed_examples(engine, monkeypatch):
+    """Flags the parser leaves unset count the way get_active_sources counts them"""
+    monkeypatch.setattr(catalog_module, 'NUMPY_AVAILABLE', False)
+    parser = FundingDSLParser(engine=engine)
+    configs = [parser.parse_file(str(path)) for path in sorted(EXAMPLES.glob('*.dsl'))]
+    catalog = FundingCatalog(configs)
+
+    expected = Counter(source.platform for config in configs for source in config.get_active_sources())
+    assert catalog.platform_distribution() == dict(expected)
+    assert sum(catalog.platform_distribution(active_only=False).values()) == sum(
+        len(config.funding_sources) for config in configs
+    )
+    assert len(catalog.goal_names) == sum(len(config.goals) for config in configs)
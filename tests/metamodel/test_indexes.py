@@ -0,0 +1,115 @@
+"""
+Tests for the lazily built lookup indexes on FundingConfiguration
+"""
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, FundingPlatform
+)
+
+
+def build_configuration():
+    config = FundingConfiguration(project_name="Indexed")
+    config.add_beneficiary(Beneficiary("Ada", github_username="AdaL"))
+    config.add_beneficiary(Beneficiary("Grace"))
+    config.add_funding_source(FundingSource(FundingPlatform.PATREON, "ada"))
+    config.add_funding_source(FundingSource(FundingPlatform.GITHUB_SPONSORS, "ada"))
+    config.add_funding_source(FundingSource(FundingPlatform.PATREON, "grace", is_active=False))
+    config.add_funding_source(FundingSource(FundingPlatform.PATREON, "team"))
+    config.add_tier(FundingTier("Gold", FundingAmount(50.0)))
+    config.add_tier(FundingTier("Old", FundingAmount(5.0), is_active=False))
+    config.add_goal(FundingGoal("Servers", FundingAmount(200.0)))
+    config.add_goal(FundingGoal("Docs", FundingAmount(100.0), is_reached=True))
+    return config
+
+
+def test_lookups():
+    """Indexes group and look up entities like a linear scan would"""
+    config = build_configuration()
+
+    groups = config.sources_by_platform()
+    assert list(groups) == [FundingPlatform.PATREON, FundingPlatform.GITHUB_SPONSORS]
+    assert [s.username for s in groups[FundingPlatform.PATREON]] == ["ada", "team"]
+    assert [s.username for s in config.sources_for_platform(FundingPlatform.PATREON, active_only=False)] == [
+        "ada", "grace", "team"
+    ]
+    assert config.sources_for_platform(FundingPlatform.KO_FI) == []
+    assert config.tier("Gold").amount.value == 50.0
+    assert config.tier("Missing") is None
+    assert config.goal("Docs").is_reached
+    assert config.beneficiary_by_github("adal").name == "Ada"
+    assert [t.name for t in config.get_active_tiers()] == ["Gold"]
+    assert [g.name for g in config.get_unreached_goals()] == ["Servers"]
+
+
+def test_indexes_are_cached():
+    """Repeated calls reuse the same index"""
+    config = build_configuration()
+
+    assert config.tier("Gold") is config.tier("Gold")
+    assert config.sources_by_platform(active_only=False) == config.sources_by_platform(active_only=False)
+
+
+def test_platform_groups_see_in_place_edits_and_are_copies():
+    """Deactivating a source shows in the active grouping; mutating a result changes nothing"""
+    config = build_configuration()
+    config.sources_by_platform()
+
+    config.funding_sources[0].is_active = False
+    groups = config.sources_by_platform()
+    assert sum(map(len, groups.values())) == len(config.get_active_sources()) == 2
+    assert config.funding_sources[0] not in config.sources_for_platform(config.funding_sources[0].platform)
+
+    groups.clear()
+    config.sources_by_platform(active_only=False)[FundingPlatform.PATREON].clear()
+    assert len(config.sources_for_platform(FundingPlatform.PATREON, active_only=False)) == 3
+    assert config.sources_by_platform() != {}
+
+
+def test_active_and_unreached_getters_are_not_cached():
+    """get_active_* and get_unreached_goals return fresh lists that see in-place edits"""
+    config = build_configuration()
+
+    config.get_active_sources().clear()
+    assert len(config.get_active_sources()) == 3
+    config.funding_sources[0].is_active = False
+    config.goals[0].is_reached = True
+    assert len(config.get_active_sources()) == 2
+    assert config.get_unreached_goals() == []
+
+
+def test_add_methods_invalidate():
+    """add_* mutators make the next lookup see the new entity"""
+    config = build_configuration()
+    assert config.tier("Silver") is None
+    assert len(config.get_active_sources()) == 3
+
+    config.add_tier(FundingTier("Silver", FundingAmount(20.0)))
+    config.add_funding_source(FundingSource(FundingPlatform.KO_FI, "ada"))
+
+    assert config.tier("Silver").amount.value == 20.0
+    assert len(config.get_active_sources()) == 4
+    assert [s.username for s in config.sources_for_platform(FundingPlatform.KO_FI)] == ["ada"]
+
+
+def test_direct_list_changes_and_in_place_edits():
+    """Appending to a list directly is detected; in-place edits need invalidate_indexes()"""
+    config = build_configuration()
+    config.tier("Gold")
+
+    config.tiers.append(FundingTier("Bronze", FundingAmount(1.0)))
+    assert config.tier("Bronze").amount.value == 1.0
+
+    config.tiers[0].name = "Platinum"
+    config.invalidate_indexes()
+    assert config.tier("Gold") is None
+    assert config.tier("Platinum") is config.tiers[0]
+
+
+def test_indexes_do_not_affect_equality():
+    """Cached indexes are not part of the dataclass fields"""
+    indexed, fresh = build_configuration(), build_configuration()
+    indexed.sources_by_platform()
+
+    assert indexed == fresh
+    assert "_indexes" not in repr(indexed)
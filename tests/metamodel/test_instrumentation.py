@@ -0,0 +1,92 @@
+"""
+Tests for phase-level instrumentation spans and sinks
+"""
+
+import io
+import json
+
+import pytest
+
+from export.funding_exporter import FundingExporter
+from graphical.funding_visualizer import FundingVisualizer
+from metamodel.batch_validation import validate_many
+from metamodel.funding_metamodel import FundingModelValidator
+from metamodel.instrumentation import (
+    JSONLinesSink, PrometheusTextSink, StatsSink, get_instrumentation, instrumented, span
+)
+from textual.funding_dsl_parser import FundingDSLParser
+from textual_textx.funding_dsl_textx_parser import FundingDSLTextXParser
+
+
+EXAMPLE = 'examples/example_funding.dsl'
+
+
+def test_spans_are_no_ops_without_instrumentation():
+    assert get_instrumentation() is None
+    with span('anything', chars=3) as s:
+        s.entities = 5
+        s.attributes['key'] = 'dropped'
+    assert span('other') is s
+    assert s.attributes == {}
+
+
+@pytest.mark.parametrize("engine", ["regex", "tokenizer"])
+def test_pipeline_phases_are_recorded(engine):
+    stats = StatsSink()
+    with instrumented(stats):
+        config = FundingDSLParser(engine).parse_file(EXAMPLE)
+        FundingModelValidator.validate_configuration(config)
+        validate_many([config, config])
+        exporter = FundingExporter(config)
+        exporter.to_json()
+        exporter.to_github_funding_yml()
+        exporter.to_dsl()
+        FundingVisualizer(config).generate_mermaid_flowchart()
+    assert get_instrumentation() is None
+
+    entities = len(config.beneficiaries) + len(config.funding_sources) + len(config.tiers) + len(config.goals)
+    assert set(stats.stats) == {f'parse.{engine}', 'build', 'validate', 'validate.batch', 'export.json',
+                                'export.github_yml', 'export.dsl', 'visualize.mermaid_flowchart'}
+    assert stats.stats['build']['entities'] == entities
+    assert stats.stats['validate.batch']['entities'] == 2
+    assert all(s['count'] == 1 and s['cpu_seconds'] >= 0 for s in stats.stats.values())
+    assert 'export.json' in stats.report()
+
+
+def test_textx_phases_are_recorded():
+    stats = StatsSink()
+    with instrumented(stats):
+        FundingDSLTextXParser().parse_file('tests/textual_textx/test_equivalent.dsl')
+    assert set(stats.stats) == {'parse.textx', 'transform.textx'}
+
+
+def test_nested_spans_errors_and_memory():
+    output = io.StringIO()
+    with instrumented(JSONLinesSink(output), trace_memory=True):
+        with span('outer'):
+            with span('inner', entities=3):
+                data = [object() for _ in range(1000)]
+            del data
+        with pytest.raises(KeyError):
+            with span('failing'):
+                raise KeyError('x')
+
+    inner, outer, failing = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert (inner['name'], inner['parent'], inner['depth'], inner['entities']) == ('inner', 'outer', 1, 3)
+    assert inner['allocated_bytes'] > 0 and inner['allocated_blocks'] > 0
+    assert outer['peak_bytes'] >= inner['peak_bytes'] > 0
+    assert failing['error'] == 'KeyError'
+
+
+def test_prometheus_text_file(tmp_path):
+    target = tmp_path / 'funding.prom'
+    with instrumented(PrometheusTextSink(str(target))):
+        for _ in range(3):
+            with span('parse.regex', entities=2):
+                pass
+
+    text = target.read_text()
+    assert '# TYPE funding_dsl_spans_total counter' in text
+    assert 'funding_dsl_spans_total{span="parse.regex"} 3' in text
+    assert 'funding_dsl_span_entities_total{span="parse.regex"} 6' in text
+    assert list(tmp_path.iterdir()) == [target]
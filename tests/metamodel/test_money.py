@@ -0,0 +1,81 @@
+"""
+Tests for the integer-cents money mode
+"""
+
+import pickle
+
+import pytest
+
+from export.funding_exporter import FundingExporter
+from metamodel.funding_metamodel import FundingAmount, CurrencyType
+from metamodel.money import CentsAmount, parse_minor_units, sum_amounts
+from metamodel.serialization import configuration_to_dict, configuration_from_dict
+from textual.funding_dsl_parser import FundingDSLParser
+from textual_textx import FundingDSLTextXParser
+
+
+@pytest.mark.parametrize("literal, cents", [
+    ("5.00", 500), ("5", 500), ("12.5", 1250), ("0.10", 10), ("-3.5", -350), ("1.005", 100), ("1.015", 102), ("1e3", 100000)
+])
+def test_parse_minor_units(literal, cents):
+    assert parse_minor_units(literal) == cents
+
+
+def test_arithmetic_and_comparison_stay_exact():
+    dime = CentsAmount.from_literal("0.10")
+
+    assert sum([dime] * 3) == CentsAmount(30)
+    assert sum([0.1] * 3) != 0.3  # The drift CentsAmount avoids
+    assert dime * 3 - CentsAmount(5) == CentsAmount(25)
+    assert CentsAmount(500) == FundingAmount(5.0) and FundingAmount(5.0) == CentsAmount(500)
+    assert CentsAmount(500) != CentsAmount(500, CurrencyType.EUR)
+    assert max([CentsAmount(5), CentsAmount(700), CentsAmount(30)]).cents == 700
+    assert str(CentsAmount(500)) == str(FundingAmount(5.0))
+    assert pickle.loads(pickle.dumps(dime)) == dime
+
+
+def test_mismatched_currencies_and_mutation_are_rejected():
+    with pytest.raises(ValueError, match="Currency mismatch"):
+        CentsAmount(1) + CentsAmount(1, CurrencyType.EUR)
+    with pytest.raises(ValueError, match="Currency mismatch"):
+        sum_amounts([CentsAmount(1), CentsAmount(1, CurrencyType.EUR)])
+    with pytest.raises(AttributeError):
+        CentsAmount(1).cents = 2
+
+
+def test_sum_amounts_accepts_float_amounts():
+    total = sum_amounts([FundingAmount(0.1), FundingAmount(0.2), CentsAmount(70)])
+
+    assert total == CentsAmount(100)
+
+
+@pytest.mark.parametrize("engine", ['regex', 'tokenizer'])
+def test_dsl_parsers_build_cents_amounts(engine):
+    config = FundingDSLParser(engine, money='cents').parse_file('examples/example_funding.dsl')
+    float_config = FundingDSLParser(engine).parse_file('examples/example_funding.dsl')
+
+    amounts = [t.amount for t in config.tiers] + [g.target_amount for g in config.goals]
+    assert amounts and all(isinstance(a, CentsAmount) for a in amounts)
+    assert [t.amount.value for t in config.tiers] == [t.amount.value for t in float_config.tiers]
+    assert FundingExporter(config).to_markdown() == FundingExporter(float_config).to_markdown()
+
+
+def test_textx_parser_builds_cents_amounts():
+    config = FundingDSLTextXParser(money='cents').parse_file('textual_textx/example_funding_clean.dsl')
+    float_config = FundingDSLTextXParser().parse_file('textual_textx/example_funding_clean.dsl')
+
+    assert all(isinstance(t.amount, CentsAmount) for t in config.tiers)
+    assert [t.amount.value for t in config.tiers] == [t.amount.value for t in float_config.tiers]
+
+
+def test_serialization_keeps_cents():
+    config = FundingDSLParser(money='cents').parse_file('examples/example_funding.dsl')
+    restored = configuration_from_dict(configuration_to_dict(config))
+
+    assert all(isinstance(t.amount, CentsAmount) for t in restored.tiers)
+    assert configuration_to_dict(restored) == configuration_to_dict(config)
+
+
+def test_unknown_money_mode():
+    with pytest.raises(ValueError, match="money mode"):
+        FundingDSLParser(money='decimal')
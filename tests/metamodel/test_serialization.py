@@ -0,0 +1,53 @@
+"""
+Tests for lossless dict serialization of funding configurations
+"""
+
+import json
+from datetime import datetime
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier,
+    FundingGoal, FundingAmount, FundingPlatform, FundingType, CurrencyType
+)
+from metamodel.serialization import configuration_to_dict, configuration_from_dict
+
+
+def build_configuration():
+    config = FundingConfiguration(
+        project_name="RoundTrip",
+        description="Every field set",
+        preferred_currency=CurrencyType.EUR,
+        min_amount=FundingAmount(1.5, CurrencyType.EUR),
+        max_amount=FundingAmount(900.0, CurrencyType.EUR)
+    )
+    config.add_beneficiary(Beneficiary("Ada", email="ada@example.com", github_username="ada",
+                                       website="https://ada.dev", description="Maintainer"))
+    config.add_funding_source(FundingSource(FundingPlatform.CUSTOM, "donate", FundingType.ONE_TIME,
+                                            is_active=False, custom_url="https://x.example",
+                                            platform_specific_config={"k": "v"}))
+    config.add_tier(FundingTier("Gold", FundingAmount(50.0, CurrencyType.GBP), "Top tier",
+                                ["Logo"], max_sponsors=3, is_active=False))
+    config.add_goal(FundingGoal("Servers", FundingAmount(200.0), "Hosting",
+                                deadline=datetime(2030, 1, 31), current_amount=FundingAmount(20.0),
+                                is_reached=True))
+    return config
+
+
+def test_configuration_round_trips_through_json():
+    """Every field survives configuration -> dict -> JSON -> dict -> configuration"""
+    config = build_configuration()
+
+    data = json.loads(json.dumps(configuration_to_dict(config)))
+
+    assert configuration_from_dict(data) == config
+
+
+def test_dict_has_stable_key_order():
+    """Keys come out in the same order on every call"""
+    config = build_configuration()
+
+    assert list(configuration_to_dict(config)) == [
+        'project_name', 'description', 'preferred_currency', 'min_amount', 'max_amount',
+        'beneficiaries', 'funding_sources', 'tiers', 'goals'
+    ]
+    assert json.dumps(configuration_to_dict(config)) == json.dumps(configuration_to_dict(build_configuration()))
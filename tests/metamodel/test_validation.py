@@ -0,0 +1,142 @@
+"""
+Tests for the rule-based FundingModelValidator and IncrementalValidator
+"""
+
+import pytest
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform, FundingModelValidator, IncrementalValidator, ValidationRule
+)
+
+
+def build_configuration():
+    config = FundingConfiguration(project_name="Rules")
+    config.add_beneficiary(Beneficiary("Ada"))
+    config.add_funding_source(FundingSource(FundingPlatform.GITHUB_SPONSORS, "ada"))
+    config.add_funding_source(FundingSource(FundingPlatform.TIDELIFT, "npm/rules"))
+    config.add_funding_source(FundingSource(FundingPlatform.THANKS_DEV, "u/gh/ada"))
+    config.add_tier(FundingTier("Gold", FundingAmount(50.0)))
+    config.add_goal(FundingGoal("Servers", FundingAmount(200.0)))
+    return config
+
+
+@pytest.fixture
+def restore_rules():
+    rules = list(FundingModelValidator.rules)
+    yield
+    FundingModelValidator.rules = rules
+    FundingModelValidator._compiled = None
+
+
+def test_errors_keep_their_order():
+    config = FundingConfiguration(project_name="")
+    config.add_funding_source(FundingSource(FundingPlatform.THANKS_DEV, ""))
+    config.add_funding_source(FundingSource(FundingPlatform.TIDELIFT, "cargo/x"))
+    config.add_funding_source(FundingSource(FundingPlatform.CUSTOM, "me"))
+    config.add_tier(FundingTier("A", FundingAmount(1.0)))
+    config.add_tier(FundingTier("A", FundingAmount(2.0)))
+
+    assert FundingModelValidator.validate_configuration(config) == [
+        "Project name is required",
+        "At least one beneficiary is required",
+        "Username is required for thanks_dev",
+        "Thanks.dev username must be in format 'u/gh/username'",
+        "Tidelift platform name must be one of: npm, pypi, rubygems, maven, packagist, nuget",
+        "Custom URL is required for custom platforms",
+        "Funding tier names must be unique",
+    ]
+
+
+def test_source_rules_are_compiled_per_platform():
+    compiled = FundingModelValidator.compiled_rules()
+
+    assert len(compiled['source'][FundingPlatform.PATREON]) == 1
+    assert len(compiled['source'][FundingPlatform.TIDELIFT]) == 2
+
+
+def test_registered_rule_runs(restore_rules):
+    FundingModelValidator.register_rule(ValidationRule(
+        'patreon-lowercase', 'source', lambda s: "Patreon names are lowercase" if s.username != s.username.lower() else None,
+        frozenset([FundingPlatform.PATREON])
+    ))
+    config = build_configuration()
+    config.add_funding_source(FundingSource(FundingPlatform.PATREON, "Ada"))
+
+    assert FundingModelValidator.validate_configuration(config) == ["Patreon names are lowercase"]
+    with pytest.raises(ValueError, match="Unknown validation entity"):
+        FundingModelValidator.register_rule(ValidationRule('bad', 'tier', lambda t: None))
+
+
+def test_subclass_rules_do_not_leak_into_the_base_class(restore_rules):
+    class StrictValidator(FundingModelValidator):
+        pass
+
+    FundingModelValidator.compiled_rules()
+    StrictValidator.register_rule(ValidationRule('no-tiers', 'tiers', lambda tiers: "No tiers" if tiers else None))
+
+    assert FundingModelValidator.validate_configuration(build_configuration()) == []
+    assert len(StrictValidator.rules) == len(FundingModelValidator.rules) + 1
+    assert len(StrictValidator.compiled_rules()['tiers']) == len(FundingModelValidator.compiled_rules()['tiers']) + 1
+
+    class OtherValidator(FundingModelValidator):
+        pass
+
+    OtherValidator.compiled_rules()
+    FundingModelValidator.register_rule(ValidationRule('no-goals', 'goals', lambda goals: None))
+    assert len(OtherValidator.compiled_rules()['goals']) == len(FundingModelValidator.compiled_rules()['goals'])
+
+
+def test_subclass_rules_run_in_validate_configuration(restore_rules):
+    class StrictValidator(FundingModelValidator):
+        pass
+
+    FundingModelValidator.validate_configuration(build_configuration())
+    StrictValidator.register_rule(ValidationRule('no-tiers', 'tiers', lambda tiers: "No tiers" if tiers else None))
+    config = build_configuration()
+
+    assert StrictValidator.validate_configuration(config) == ["No tiers"]
+    assert StrictValidator.validate_configuration(config) == IncrementalValidator(config, StrictValidator).validate()
+    assert not StrictValidator.is_valid_configuration(config)
+    assert FundingModelValidator.is_valid_configuration(config)
+
+
+def test_reassigned_rules_replace_the_compiled_checks(restore_rules):
+    config = build_configuration()
+    FundingModelValidator.validate_configuration(config)
+
+    FundingModelValidator.rules = [ValidationRule('no-tiers', 'tiers', lambda tiers: "No tiers" if tiers else None)]
+
+    assert FundingModelValidator.validate_configuration(config) == ["No tiers"]
+
+def test_incremental_revalidates_only_touched_entities():
+    config = build_configuration()
+    validator = IncrementalValidator(config)
+
+    assert validator.validate() == []
+    assert validator.validate() == [] and validator.revalidated == 0
+
+    tidelift = config.funding_sources[1]
+    tidelift.username = "npm-rules"
+    validator.touch(tidelift)
+    errors = validator.validate()
+    assert errors == FundingModelValidator.validate_configuration(config) and len(errors) == 1
+    assert validator.revalidated == 1
+
+    config.add_funding_source(FundingSource(FundingPlatform.PATREON, ""))
+    assert validator.validate() == FundingModelValidator.validate_configuration(config)
+    assert validator.revalidated == 1
+
+    config.funding_sources.remove(tidelift)
+    config.add_goal(FundingGoal("Servers", FundingAmount(1.0)))
+    assert validator.validate() == ["Username is required for patreon", "Funding goal names must be unique"]
+
+
+def test_incremental_picks_up_new_rules(restore_rules):
+    config = build_configuration()
+    validator = IncrementalValidator(config)
+    validator.validate()
+
+    FundingModelValidator.register_rule(ValidationRule('no-gold', 'tiers', lambda tiers: "No gold" if tiers else None))
+
+    assert validator.validate() == ["No gold"]
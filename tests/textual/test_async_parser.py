@@ -0,0 +1,94 @@
+"""
+Tests for the asyncio parsing API
+"""
+
+import asyncio
+import shutil
+import threading
+import time
+
+import pytest
+
+import textual.async_parser as async_parser
+from textual.async_parser import AsyncFundingParser
+from textual.funding_dsl_parser import FundingDSLParser, ParseError
+
+
+EXAMPLE = 'examples/example_funding.dsl'
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_file_and_text_match_the_sync_parser(executor):
+    expected = FundingDSLParser().parse_file(EXAMPLE)
+
+    async def main():
+        async with AsyncFundingParser(workers=2, executor=executor) as parser:
+            return await asyncio.gather(parser.parse_file(EXAMPLE), parser.parse_text(open(EXAMPLE).read()))
+
+    assert asyncio.run(main()) == [expected, expected]
+
+
+def test_errors_propagate():
+    async def main():
+        async with AsyncFundingParser(executor='thread') as parser:
+            with pytest.raises(ParseError):
+                await parser.parse_text('funding {')
+            with pytest.raises(FileNotFoundError):
+                await parser.parse_file('missing.dsl')
+
+    asyncio.run(main())
+
+
+def test_parse_many_is_bounded_and_reports_failures(tmp_path, monkeypatch):
+    for i in range(20):
+        shutil.copy(EXAMPLE, tmp_path / f"p{i}.dsl")
+    (tmp_path / "broken.dsl").write_text('funding {')
+    expected = FundingDSLParser().parse_file(EXAMPLE)
+
+    lock = threading.Lock()
+    counts = {'running': 0, 'most': 0}
+    parse_text = async_parser._parse_text
+
+    def slow_parse(text):
+        with lock:
+            counts['running'] += 1
+            counts['most'] = max(counts['most'], counts['running'])
+        time.sleep(0.005)
+        try:
+            return parse_text(text)
+        finally:
+            with lock:
+                counts['running'] -= 1
+
+    monkeypatch.setattr(async_parser, '_parse_text', slow_parse)
+
+    async def main():
+        async with AsyncFundingParser(workers=8, max_pending=3, executor='thread') as parser:
+            return {path: result async for path, result in parser.parse_many([str(tmp_path)])}
+
+    results = asyncio.run(main())
+    assert len(results) == 21
+    assert counts['most'] == 3  # 8 threads, but only max_pending parses at once
+    assert isinstance(results[str(tmp_path / "broken.dsl")], ParseError)
+    assert all(result == expected for path, result in results.items() if not path.endswith("broken.dsl"))
+
+
+def test_event_loop_keeps_running_during_parses():
+    text = open(EXAMPLE).read()
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        tick_task = asyncio.ensure_future(ticker())
+        async with AsyncFundingParser(workers=1, executor='process') as parser:
+            await asyncio.gather(*(parser.parse_text(text) for _ in range(20)))
+        tick_task.cancel()
+        return ticks
+
+    assert asyncio.run(main()) > 20
@@ -0,0 +1,70 @@
+"""
+Tests for parallel batch parsing
+"""
+
+import shutil
+
+import pytest
+
+from export.cli import main
+from textual.batch_parser import expand_paths, parse_many, run_many
+from textual.funding_dsl_parser import ParseError
+from metamodel.funding_metamodel import FundingConfiguration
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A directory with valid files in nested folders and one broken file"""
+    (tmp_path / "nested").mkdir()
+    shutil.copy('examples/example_funding.dsl', tmp_path / "a.dsl")
+    shutil.copy('examples/minimal_funding.dsl', tmp_path / "nested" / "b.dsl")
+    (tmp_path / "broken.dsl").write_text("not a funding file")
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_expand_paths_handles_directories_globs_and_duplicates(corpus):
+    """Directories are searched recursively and every path appears once"""
+    paths = expand_paths([corpus, str(corpus / "*.dsl"), str(corpus / "a.dsl")])
+
+    assert sorted(paths) == sorted([
+        str(corpus / "a.dsl"), str(corpus / "broken.dsl"), str(corpus / "nested" / "b.dsl")
+    ])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_streams_configurations_and_errors(corpus, workers):
+    """Each file yields either a configuration or the error it raised"""
+    results = dict(parse_many([corpus], workers=workers))
+
+    assert isinstance(results[str(corpus / "a.dsl")], FundingConfiguration)
+    assert results[str(corpus / "nested" / "b.dsl")].project_name == "octo-package"
+    assert isinstance(results[str(corpus / "broken.dsl")], ParseError)
+
+
+def test_interleaved_in_process_runs_keep_their_own_parsers(corpus):
+    """A second in-process run does not swap the parser of one already under way"""
+    def parser_type(parser, path):
+        return type(parser).__name__
+
+    regex_run = run_many([corpus], parser_type, workers=1, backend='regex')
+    assert next(regex_run)[1] == 'FundingDSLParser'
+    textx_run = run_many([corpus], parser_type, workers=1, backend='textx')
+    assert next(textx_run)[1] == 'FundingDSLTextXParser'
+
+    assert {result for _, result in regex_run} == {'FundingDSLParser'}
+
+def test_parse_many_rejects_unknown_backend():
+    """Backends are validated before any work starts"""
+    with pytest.raises(ValueError):
+        parse_many(["examples"], backend="antlr")
+
+
+def test_parse_subcommand_reports_failures(corpus, capsys):
+    """The CLI subcommand exits non-zero when any file fails to parse"""
+    exit_code = main(["parse", str(corpus), "-j", "2", "--quiet"])
+
+    captured = capsys.readouterr()
+    assert exit_code == 1
+    assert "Parsed 2 file(s), 1 failed" in captured.out
+    assert "broken.dsl" in captured.err
@@ -0,0 +1,73 @@
+"""
+Tests for position-based block scanning in the regex engine
+"""
+
+import textual.funding_dsl_parser as regex_parser
+from textual.funding_dsl_parser import FundingDSLParser
+from benchmarks.synthetic import generate_funding_dsl
+
+
+def test_find_closing_brace_handles_nesting():
+    """The matching brace is found across nested blocks"""
+    parser = FundingDSLParser()
+    text = 'x { a { b { } } c { } } tail }'
+
+    assert parser._find_closing_brace(text, 2) == text.index(' tail') - 1
+    assert parser._find_closing_brace(text, 6) == 14
+    assert parser._find_closing_brace('{ { }', 0) == -1
+
+
+def test_balanced_content_of_unbalanced_entry_is_empty():
+    """Unbalanced braces still yield empty content, as before"""
+    parser = FundingDSLParser()
+
+    assert parser._extract_balanced_content('{ open', 0) == ""
+    assert parser._extract_balanced_content('{ a { b } }', 0) == " a { b } "
+
+
+def test_block_entries_are_all_found():
+    """Every entry of a large block is extracted in document order"""
+    parser = FundingDSLParser()
+    text = generate_funding_dsl(sources=130, tiers=500, goals=20, beneficiaries=3)
+    config_data = parser._simple_parse(text)
+
+    assert [t['name'] for t in config_data['tiers']] == [f"Tier {i}" for i in range(500)]
+    assert len(config_data['sources']) == 130
+    assert [g['name'] for g in config_data['goals']] == [f"Goal {i}" for i in range(20)]
+    assert [b['name'] for b in config_data['beneficiaries']] == [f"Maintainer {i}" for i in range(3)]
+
+
+class ScanCounter:
+    """Wraps an entry pattern and counts the characters its searches step over"""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.texts = set()
+        self.searches = 0
+        self.scanned = 0
+
+    def search(self, text, pos=0):
+        self.texts.add(id(text))
+        self.searches += 1
+        match = self.pattern.search(text, pos)
+        self.scanned += (match.end() if match else len(text)) - pos
+        return match
+
+
+def test_tier_extraction_scans_the_block_once(monkeypatch):
+    """Each tier is searched for from where the previous one ended, never from the start
+
+    Timing is left to benchmarks/bench_block_extraction.py; this counts scan steps.
+    """
+    parser = FundingDSLParser()
+    counter = ScanCounter(regex_parser._TIER_PATTERN)
+    monkeypatch.setattr(regex_parser, '_TIER_PATTERN', counter)
+    text = generate_funding_dsl(tiers=2000)
+    block = parser._extract_balanced_block(text, 'tiers')
+
+    tiers = parser._extract_tiers(text)
+
+    assert len(tiers) == 2000
+    assert counter.searches == len(tiers) + 1
+    assert len(counter.texts) == 1  # The block is never re-sliced
+    assert counter.scanned <= len(block)
@@ -0,0 +1,144 @@
+"""
+Tests for the streaming DSL serializer
+"""
+
+import io
+import random
+from datetime import datetime
+
+import pytest
+
+from export.funding_exporter import write_funding_config
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform, FundingType, CurrencyType
+)
+from metamodel.money import CentsAmount
+from textual.dsl_serializer import dsl_number, serialize_dsl, write_dsl
+from textual.funding_dsl_parser import FundingDSLParser
+from textual_textx.funding_dsl_textx_parser import FundingDSLTextXParser
+
+
+# Characters the regex engine would misread inside strings are fine for the other parsers
+NAME_CHARS = "abcXYZ019 -_./:#{}[],*é'"
+
+
+def random_configuration(rng: random.Random, cents: bool) -> FundingConfiguration:
+    """A configuration using every element the DSL can express"""
+    def text():
+        return ''.join(rng.choice(NAME_CHARS) for _ in range(rng.randint(0, 12)))
+
+    def optional():
+        return text() if rng.random() < 0.6 else None
+
+    def amount(currency):
+        if cents:
+            return CentsAmount(rng.randint(0, 10 ** 9), currency)
+        return FundingAmount(rng.choice([rng.randint(1, 10 ** 6) / 100, rng.random() * 1e-5, rng.random() * 1e20]),
+                             currency)
+
+    currency = rng.choice(list(CurrencyType))
+    config = FundingConfiguration(project_name=text(), description=optional(), preferred_currency=currency)
+    config.min_amount = amount(currency)
+    for _ in range(rng.randint(0, 3)):
+        config.add_beneficiary(Beneficiary(text(), optional(), optional(), optional(), optional()))
+    for _ in range(rng.randint(0, 4)):
+        platform = rng.choice(list(FundingPlatform))
+        config.add_funding_source(FundingSource(
+            platform, text(), rng.choice(list(FundingType)), rng.random() < 0.7,
+            text() if platform == FundingPlatform.CUSTOM else None, {text(): text() for _ in range(rng.randint(0, 2))}
+        ))
+    for _ in range(rng.randint(0, 3)):
+        config.add_tier(FundingTier(text(), amount(rng.choice(list(CurrencyType))), optional(),
+                                    [text() for _ in range(rng.randint(0, 3))], rng.choice([None, rng.randint(1, 500)])))
+    for _ in range(rng.randint(0, 3)):
+        goal_currency = rng.choice(list(CurrencyType))
+        config.add_goal(FundingGoal(text(), amount(goal_currency), optional(),
+                                    rng.choice([None, datetime(rng.randint(1, 9999), rng.randint(1, 12), 28)]),
+                                    amount(goal_currency)))
+    return config
+
+
+@pytest.mark.parametrize("money", ["float", "cents"])
+def test_round_trips_through_tokenizer_engine_and_textx(money):
+    rng = random.Random(7)
+    parsers = [FundingDSLParser(engine='tokenizer', money=money), FundingDSLTextXParser(money=money)]
+    for _ in range(150):
+        config = random_configuration(rng, cents=money == 'cents')
+        text = serialize_dsl(config)
+        for parser in parsers:
+            assert parser.parse_text(text) == config, text
+
+
+@pytest.mark.parametrize("path", ["examples/example_funding.dsl", "examples/minimal_funding.dsl",
+                                  "tests/textual_textx/test_equivalent.dsl"])
+@pytest.mark.parametrize("engine", ["regex", "tokenizer"])
+def test_parsed_files_survive_a_rewrite(path, engine):
+    parser = FundingDSLParser(engine=engine)
+    config = parser.parse_file(path)
+    text = serialize_dsl(config)
+
+    assert parser.parse_text(text) == config
+    assert FundingDSLParser(engine='regex' if engine == 'tokenizer' else 'tokenizer').parse_text(text)
+    assert FundingDSLTextXParser().parse_text(text)
+
+
+@pytest.mark.parametrize("value", ['say "hi"', "two\nlines", "carriage\rreturn", "trailing\\", "it\\'s"])
+def test_unrepresentable_strings_are_rejected(value):
+    with pytest.raises(ValueError, match="Cannot write"):
+        serialize_dsl(FundingConfiguration(project_name=value))
+
+
+def test_numbers_have_no_exponent_and_two_decimals():
+    assert [dsl_number(FundingAmount(v)) for v in (5, 25.5, 0.1, 1e-5, 1e16, 123.456)] == \
+        ["5.00", "25.50", "0.10", "0.00001", "10000000000000000.00", "123.456"]
+    assert dsl_number(CentsAmount(1999)) == "19.99"
+    with pytest.raises(ValueError):
+        dsl_number(FundingAmount(-1.0))
+
+
+def test_writes_entities_in_grammar_order():
+    config = FundingConfiguration(project_name="P", min_amount=FundingAmount(0.0))
+    config.add_funding_source(FundingSource(FundingPlatform.CUSTOM, "Site", is_active=False, custom_url="https://x.io"))
+    config.add_funding_source(FundingSource(FundingPlatform.GITHUB_SPONSORS, "octo", is_active=None))
+    config.add_goal(FundingGoal("G", FundingAmount(10.0), "d", datetime(2030, 1, 2)))
+
+    assert serialize_dsl(config) == (
+        'funding "P" {\n'
+        '    currency USD\n'
+        '\n'
+        '    sources {\n'
+        '        custom "Site" {\n'
+        '            url "https://x.io"\n'
+        '            type both\n'
+        '            active false\n'
+        '        }\n'
+        '        github_sponsors "octo" {\n'
+        '            type both\n'
+        '        }\n'
+        '    }\n'
+        '\n'
+        '    goals {\n'
+        '        goal "G" {\n'
+        '            target 10.00 USD\n'
+        '            current 0.00 USD\n'
+        '            deadline "2030-01-02"\n'
+        '            description "d"\n'
+        '        }\n'
+        '    }\n'
+        '}\n'
+    )
+
+
+def test_streams_to_text_and_binary_files(tmp_path):
+    config = FundingDSLParser().parse_file('examples/minimal_funding.dsl')
+    target = tmp_path / "out.dsl"
+    with open(target, 'w', encoding='utf-8') as f:
+        write_dsl(config, f, header="Generated\nfor tests")
+    binary = io.BytesIO()
+    write_funding_config(config, 'dsl', binary)
+
+    text = target.read_text(encoding='utf-8')
+    assert text.startswith("// Generated\n// for tests\n\nfunding ")
+    assert binary.getvalue().decode('utf-8') == serialize_dsl(config)
+    assert FundingDSLParser().parse_file(str(target)) == config
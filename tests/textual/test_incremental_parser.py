@@ -0,0 +1,141 @@
+"""
+Tests for incremental re-parsing of edited DSL text
+"""
+
+import random
+
+import pytest
+
+from benchmarks.synthetic import generate_synthetic_dsl
+from textual.funding_dsl_parser import FundingDSLParser, ParseError
+from textual.incremental_parser import IncrementalParser
+
+
+DSL = '''funding "Incremental" {
+    description "Edited in place"
+    currency EUR
+    beneficiaries {
+        beneficiary "Ada" { github "ada" }
+    }
+    sources {
+        github_sponsors "ada" { type recurring }
+        patreon "ada" { active false }
+    }
+    tiers {
+        tier "Bronze" { amount 5.00 EUR description "Thanks" }
+        tier "Silver" { amount 10.00 EUR benefits ["Sticker", "Badge"] }
+        tier "Gold" { amount 50.00 EUR max_sponsors 3 }
+    }
+    goals {
+        goal "Server" { target 1000 EUR current 250 EUR deadline "2030-01-01" }
+    }
+}
+'''
+
+
+def full_parse(text):
+    return FundingDSLParser(engine='tokenizer').parse_text(text)
+
+
+def replace(result, old, new):
+    """Edit the first occurrence of old in the result's text"""
+    return result.edit(result.text.index(old), len(old), new)
+
+
+def test_parse_matches_the_tokenizer_engine():
+    result = IncrementalParser().parse(DSL)
+    assert result.config == full_parse(DSL)
+    assert result.mode == 'full'
+
+
+def test_editing_one_tier_reuses_every_other_entity():
+    before = IncrementalParser().parse(DSL)
+    after = replace(before, '"Thanks"', '"Thank you!"')
+
+    assert after.mode == 'block'
+    assert after.config == full_parse(after.text)
+    assert after.config.tiers[0].description == "Thank you!"
+    assert after.config.tiers[0] is not before.config.tiers[0]
+    for old, new in zip(before.config.tiers[1:] + before.config.goals + before.config.funding_sources,
+                        after.config.tiers[1:] + after.config.goals + after.config.funding_sources):
+        assert new is old
+    assert after.config.tiers is not before.config.tiers
+
+
+def test_previous_result_is_left_as_it_was():
+    before = IncrementalParser().parse(DSL)
+    replace(before, 'tier "Gold"', 'tier "Platinum"')
+    assert before.text == DSL
+    assert before.config == full_parse(DSL)
+    assert replace(before, '"Ada" {', '"Bea" {').config.beneficiaries[0].name == "Bea"
+
+
+def test_adding_and_removing_entries():
+    result = IncrementalParser().parse(DSL)
+    added = result.edit(DSL.index('    }\n    goals'), 0, '        tier "Steel" { amount 1 EUR }\n')
+    assert added.mode == 'block'
+    assert [t.name for t in added.config.tiers] == ["Bronze", "Silver", "Gold", "Steel"]
+    assert added.config == full_parse(added.text)
+
+    removed = replace(added, 'patreon "ada" { active false }', '')
+    assert removed.mode == 'block'
+    assert len(removed.config.funding_sources) == 1
+    assert removed.config == full_parse(removed.text)
+
+
+def test_edits_outside_blocks_parse_in_full_and_still_share_entities():
+    before = IncrementalParser().parse(DSL)
+    after = replace(before, 'currency EUR', 'currency GBP')
+    assert after.mode == 'full'
+    assert after.config == full_parse(after.text)
+    assert all(new is old for new, old in zip(after.config.tiers, before.config.tiers))
+
+
+@pytest.mark.parametrize('old, new', [
+    ('"Thanks" }', '"Thanks" } }'),      # Closes the block early
+    ('max_sponsors 3 }', 'max_sponsors 3 // }'),
+    ('"Sticker"', '"Sticker'),
+    ('tier "Gold"', 'goal "Gold"'),
+])
+def test_edits_breaking_the_document_raise_like_a_full_parse(old, new):
+    result = IncrementalParser().parse(DSL)
+    with pytest.raises(ParseError):
+        full_parse(result.text.replace(old, new, 1))
+    with pytest.raises(ParseError):
+        replace(result, old, new)
+
+
+def test_comment_swallowing_text_after_the_edit_is_seen():
+    text = DSL.replace('tier "Silver"', '/* */ tier "Silver"')
+    result = IncrementalParser().parse(text)
+    # The comment opened after Bronze runs on to the '*/' already in front of Silver
+    edited = replace(result, '"Thanks" }', '"Thanks" } /*')
+    assert edited.config == full_parse(edited.text)
+    assert [t.name for t in edited.config.tiers] == ["Bronze", "Silver", "Gold"]
+
+
+def test_edit_outside_the_text_is_rejected():
+    result = IncrementalParser().parse(DSL)
+    with pytest.raises(ValueError):
+        result.edit(len(DSL), 1, '')
+
+
+def test_random_edits_match_a_full_parse():
+    rng = random.Random(7)
+    result = IncrementalParser(money='cents').parse(generate_synthetic_dsl(1, sources=15, tiers=6))
+    reference = FundingDSLParser(engine='tokenizer', money='cents')
+    snippets = ['', ' ', 'x', '1', '"', '{', '}', '\n', '// note\n', '/*', '*/', 'tier "New" { amount 3 USD }']
+    for _ in range(300):
+        offset = rng.randrange(len(result.text) + 1)
+        removed = min(rng.choice([0, 0, 1, 3, 12]), len(result.text) - offset)
+        inserted = rng.choice(snippets)
+        text = result.text[:offset] + inserted + result.text[offset + removed:]
+        try:
+            expected = reference.parse_text(text)
+        except ParseError:
+            with pytest.raises(ParseError):
+                result.edit(offset, removed, inserted)
+            continue
+        result = result.edit(offset, removed, inserted)
+        assert result.text == text
+        assert result.config == expected
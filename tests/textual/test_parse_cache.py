@@ -0,0 +1,111 @@
+"""
+Tests for the content-addressed parse cache
+"""
+
+import shutil
+
+import pytest
+
+from textual.funding_dsl_parser import FundingDSLParser
+from textual.parse_cache import ParseCache
+
+
+def test_second_parse_is_a_cache_hit(tmp_path):
+    """Parsing an unchanged file twice parses it only once"""
+    cache = ParseCache(tmp_path / "cache")
+    parser = FundingDSLParser(cache=cache)
+
+    first = parser.parse_file('examples/example_funding.dsl')
+    second = parser.parse_file('examples/example_funding.dsl')
+
+    assert first == second
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_cache_persists_across_instances(tmp_path):
+    """A new cache on the same directory serves entries written by an earlier run"""
+    FundingDSLParser(cache=ParseCache(tmp_path)).parse_file('examples/minimal_funding.dsl')
+
+    cache = ParseCache(tmp_path)
+    config = FundingDSLParser(cache=cache).parse_file('examples/minimal_funding.dsl')
+
+    assert config.project_name == "octo-package"
+    assert cache.hits == 1 and cache.misses == 0
+
+
+def test_key_depends_on_content_and_parser_version(tmp_path):
+    """Edited files and other engines never see stale entries"""
+    dsl_file = tmp_path / "project.dsl"
+    shutil.copy('examples/example_funding.dsl', dsl_file)
+    cache = ParseCache(tmp_path / "cache")
+
+    FundingDSLParser(cache=cache).parse_file(str(dsl_file))
+    FundingDSLParser(engine='tokenizer', cache=cache).parse_file(str(dsl_file))
+    dsl_file.write_text(dsl_file.read_text().replace("AwesomeLib", "RenamedLib"))
+    renamed = FundingDSLParser(cache=cache).parse_file(str(dsl_file))
+
+    assert renamed.project_name == "RenamedLib"
+    assert cache.misses == 3 and cache.hits == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """The cache stays under its size cap by dropping the oldest entries"""
+    cache = ParseCache(tmp_path)
+    parser = FundingDSLParser()
+    configs = [parser.parse_text(f'funding "P{i}" {{ description "{"x" * 200}" }}') for i in range(3)]
+    keys = [ParseCache.key_for(str(i), "test") for i in range(3)]
+
+    cache.put(keys[0], configs[0])
+    cache.max_bytes = cache.stats()['bytes'] * 2
+    cache.put(keys[1], configs[1])
+    cache.get(keys[0])  # key 1 is now the least recently used
+    cache.put(keys[2], configs[2])
+
+    assert cache.evictions == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).project_name == "P0"
+    assert cache.get(keys[2]).project_name == "P2"
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """Unreadable entries are re-parsed instead of failing"""
+    cache = ParseCache(tmp_path)
+    key = ParseCache.key_for("text", "test")
+    entry = tmp_path / key[:2] / f"{key}.json"
+    entry.parent.mkdir()
+    entry.write_text("{not json")
+
+    assert cache.get(key) is None
+    assert cache.misses == 1
+
+
+def test_textx_parser_uses_cache(tmp_path):
+    """The textX parser shares the same cache layer"""
+    textx_module = pytest.importorskip("textual_textx")
+    cache = ParseCache(tmp_path)
+    parser = textx_module.FundingDSLTextXParser(cache=cache)
+
+    first = parser.parse_file('textual_textx/example_funding_clean.dsl')
+    second = parser.parse_file('textual_textx/example_funding_clean.dsl')
+
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert parser.cache_version != FundingDSLParser().cache_version
+
+
+def test_textx_parser_caches_the_content_it_hashed(tmp_path):
+    """A file changing between hashing and parsing cannot store the new parse under the old hash"""
+    textx_module = pytest.importorskip("textual_textx")
+    source = tmp_path / "funding.dsl"
+    original = open('textual_textx/example_funding_clean.dsl', encoding='utf-8').read()
+    source.write_text(original)
+
+    class RacingCache(ParseCache):
+        def get_or_parse(self, content, parser_version, parse):
+            source.write_text(original.replace("AwesomeLib TextX Edition", "Changed"))
+            return super().get_or_parse(content, parser_version, parse)
+
+    parser = textx_module.FundingDSLTextXParser(cache=RacingCache(tmp_path / "cache"))
+    assert parser.parse_file(str(source)).project_name == "AwesomeLib TextX Edition"
+    assert parser.parse_file(str(source)).project_name == "Changed"
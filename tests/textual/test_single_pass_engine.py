@@ -0,0 +1,102 @@
+"""
+Tests for the single-pass tokenizer engine of FundingDSLParser
+"""
+
+import pytest
+
+from textual.funding_dsl_parser import FundingDSLParser, ParseError, tokenize
+from metamodel.funding_metamodel import FundingPlatform, FundingType, CurrencyType
+
+
+def test_tokenizer_engine_matches_regex_engine():
+    """Both engines should produce the same configuration for the example file"""
+    regex_config = FundingDSLParser().parse_file('examples/example_funding.dsl')
+    token_config = FundingDSLParser(engine='tokenizer').parse_file('examples/example_funding.dsl')
+
+    assert token_config.project_name == regex_config.project_name
+    assert token_config.description == regex_config.description
+    assert token_config.preferred_currency == regex_config.preferred_currency
+    assert token_config.min_amount == regex_config.min_amount
+    assert token_config.max_amount == regex_config.max_amount
+    assert [b.name for b in token_config.beneficiaries] == [b.name for b in regex_config.beneficiaries]
+    assert [(s.platform, s.username) for s in token_config.funding_sources] == \
+        [(s.platform, s.username) for s in regex_config.funding_sources]
+    assert token_config.tiers == regex_config.tiers
+    assert token_config.goals == regex_config.goals
+
+
+def test_tokenizer_engine_reads_keywords_and_urls():
+    """Keyword values and URLs inside strings are read exactly as written"""
+    config = FundingDSLParser(engine='tokenizer').parse_file('examples/minimal_funding.dsl')
+
+    patreon = config.funding_sources[2]
+    assert patreon.platform == FundingPlatform.PATREON
+    assert patreon.funding_type == FundingType.RECURRING
+
+    custom_urls = [s.custom_url for s in config.funding_sources if s.platform == FundingPlatform.CUSTOM]
+    assert custom_urls == [
+        'https://tidelift.com/funding/github/npm/octo-package',
+        'https://www.paypal.me/octocat',
+        'https://octocat.com'
+    ]
+
+
+def test_tokenizer_engine_keeps_source_order():
+    """Sources are returned in document order"""
+    dsl = '''
+    funding "Order" {
+        currency EUR
+        sources {
+            patreon "p" { type recurring }
+            github_sponsors "g" { active false }
+            custom "c" { url "https://c.example" }
+        }
+        tiers {
+            tier "Gold" {
+                amount 50 EUR
+                benefits ["Logo", "Calls",]
+            }
+        }
+    }
+    '''
+    config = FundingDSLParser(engine='tokenizer').parse_text(dsl)
+
+    assert [s.username for s in config.funding_sources] == ['p', 'g', 'c']
+    assert config.funding_sources[1].is_active is False
+    assert config.preferred_currency == CurrencyType.EUR
+    assert config.tiers[0].amount.value == 50.0
+    assert config.tiers[0].benefits == ['Logo', 'Calls']
+
+
+def test_tokenizer_engine_reports_line_of_syntax_error():
+    """Syntax errors carry the line number of the offending token"""
+    dsl = 'funding "Broken" {\n    sources {\n        unknown_platform "x" { }\n    }\n}\n'
+
+    with pytest.raises(ParseError, match="Line 3"):
+        FundingDSLParser(engine='tokenizer').parse_text(dsl)
+
+
+def test_tokenize_skips_comments_outside_strings():
+    """Comments are dropped but '//' inside string literals is preserved"""
+    tokens = tokenize('// header\nurl "https://x.dev" /* note */ 5.00')
+
+    assert [(t.kind, t.value) for t in tokens] == [
+        ('ident', 'url'), ('string', 'https://x.dev'), ('number', '5.00')
+    ]
+
+
+def test_unknown_engine_is_rejected():
+    """Only the documented engines can be selected"""
+    with pytest.raises(ValueError):
+        FundingDSLParser(engine='antlr')
+
+
+def test_regex_engine_keeps_urls_in_strings():
+    """'//' inside a string literal is not a comment"""
+    config = FundingDSLParser(engine='regex').parse_file('examples/minimal_funding.dsl')
+
+    assert [s.custom_url for s in config.funding_sources if s.platform == FundingPlatform.CUSTOM] == [
+        'https://tidelift.com/funding/github/npm/octo-package',
+        'https://www.paypal.me/octocat',
+        'https://octocat.com'
+    ]
@@ -0,0 +1,51 @@
+"""
+Tests for the seeded synthetic DSL corpus generator
+"""
+
+import os
+
+import pytest
+
+from benchmarks.synthetic import generate_synthetic_dsl, write_corpus
+from metamodel.funding_metamodel import FundingModelValidator, FundingPlatform
+from textual.batch_parser import parse_many
+from textual.funding_dsl_parser import FundingDSLParser
+from textual_textx.funding_dsl_textx_parser import FundingDSLTextXParser
+
+
+def test_same_seed_gives_same_document():
+    assert generate_synthetic_dsl(5) == generate_synthetic_dsl(5)
+    assert generate_synthetic_dsl(5) != generate_synthetic_dsl(6)
+
+
+@pytest.mark.parametrize("parser", [FundingDSLParser(), FundingDSLParser('tokenizer'), FundingDSLTextXParser()],
+                         ids=["regex", "tokenizer", "textx"])
+def test_documents_parse_validate_and_cover_every_platform(parser):
+    for seed in range(10):
+        config = parser.parse_text(generate_synthetic_dsl(seed))
+
+        assert FundingModelValidator.validate_configuration(config) == []
+        assert {source.platform for source in config.funding_sources} == set(FundingPlatform)
+        assert any(source.platform_specific_config for source in config.funding_sources)
+        assert all(goal.deadline for goal in config.goals)
+
+
+def test_block_sizes_are_exact():
+    sizes = {'beneficiaries': 1, 'sources': 40, 'tiers': 300, 'goals': 7}
+    config = FundingDSLParser('tokenizer').parse_text(generate_synthetic_dsl(1, **sizes))
+
+    assert [len(config.beneficiaries), len(config.funding_sources), len(config.tiers), len(config.goals)] == \
+        list(sizes.values())
+    assert any(tier.benefits for tier in config.tiers)
+    assert FundingModelValidator.validate_configuration(config) == []
+
+
+def test_write_corpus_is_reproducible_and_parses(tmp_path):
+    paths = write_corpus(str(tmp_path / "a"), 5, seed=3, per_directory=2)
+    again = write_corpus(str(tmp_path / "b"), 5, seed=3, per_directory=2)
+
+    assert len({os.path.dirname(path) for path in paths}) == 3
+    assert [open(p).read() for p in paths] == [open(p).read() for p in again]
+    results = dict(parse_many([str(tmp_path / "a")], workers=1))
+    assert len(results) == 5
+    assert not any(isinstance(result, Exception) for result in results.values())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide textX metamodel cache
+"""
+
+import unittest
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import textual_textx.funding_dsl_textx_parser as textx_parser
+from textual_textx import (
+    FundingDSLTextXParser,
+    get_cached_metamodel,
+    clear_metamodel_cache
+)
+
+
+class TestMetamodelCache(unittest.TestCase):
+    """Test cases for get_cached_metamodel"""
+
+    def setUp(self):
+        clear_metamodel_cache()
+
+    def tearDown(self):
+        clear_metamodel_cache()
+
+    def test_parsers_share_one_metamodel(self):
+        """Every parser instance reuses the same compiled grammar"""
+        first = FundingDSLTextXParser()
+        second = FundingDSLTextXParser()
+
+        self.assertIs(first.metamodel, second.metamodel)
+        self.assertIs(first.metamodel, get_cached_metamodel())
+
+    def test_concurrent_first_use_compiles_once(self):
+        """Threads racing on a cold cache compile the grammar only once"""
+        real_builder = textx_parser.metamodel_from_file
+        with mock.patch.object(textx_parser, 'metamodel_from_file', side_effect=real_builder) as builder:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(get_cached_metamodel())) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(builder.call_count, 1)
+        self.assertEqual(len({id(mm) for mm in results}), 1)
+
+    def test_cache_key_follows_grammar_content(self):
+        """An identical copy of the grammar hits the cache; an edited copy does not"""
+        default_metamodel = get_cached_metamodel()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            grammar_copy = Path(tmp_dir) / "funding_dsl.tx"
+            shutil.copy(textx_parser.DEFAULT_GRAMMAR_FILE, grammar_copy)
+            self.assertIs(get_cached_metamodel(grammar_copy), default_metamodel)
+
+            with open(grammar_copy, 'a', encoding='utf-8') as f:
+                f.write("\n// edited\n")
+            self.assertIsNot(get_cached_metamodel(grammar_copy), default_metamodel)
+
+    def test_grammar_is_hashed_once_until_it_changes(self):
+        """Constructing parsers does not re-read the grammar; editing it does"""
+        FundingDSLTextXParser()
+        with mock.patch.object(textx_parser.hashlib, 'sha256', wraps=textx_parser.hashlib.sha256) as sha256:
+            FundingDSLTextXParser()
+            FundingDSLTextXParser()
+            self.assertEqual(sha256.call_count, 0)
+
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                grammar_copy = Path(tmp_dir) / "funding_dsl.tx"
+                shutil.copy(textx_parser.DEFAULT_GRAMMAR_FILE, grammar_copy)
+                first = textx_parser.get_grammar_hash(grammar_copy)
+                with open(grammar_copy, 'a', encoding='utf-8') as f:
+                    f.write("\n// edited\n")
+                self.assertNotEqual(textx_parser.get_grammar_hash(grammar_copy), first)
+            self.assertEqual(sha256.call_count, 2)
+
+    def test_clear_forces_rebuild(self):
+        """Clearing the cache builds a fresh metamodel on next use"""
+        before = get_cached_metamodel()
+        clear_metamodel_cache()
+
+        self.assertIsNot(get_cached_metamodel(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
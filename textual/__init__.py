@@ -6,7 +6,12 @@ that converts DSL text files into metamodel objects.
 """
 
 from .funding_dsl_parser import FundingDSLParser
+from .parse_cache import ParseCache
+from .dsl_serializer import serialize_dsl, write_dsl
 
 __all__ = [
-    'FundingDSLParser'
+    'FundingDSLParser',
+    'ParseCache',
+    'serialize_dsl',
+    'write_dsl'
 ] 
\ No newline at end of file
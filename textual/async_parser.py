@@ -0,0 +1,137 @@
+"""
+Async parsing - parse Funding DSL files and text from asyncio code.
+
+AsyncFundingParser never blocks the event loop: files are read on the
+loop's default thread pool and parsing runs on a bounded executor - worker
+processes by default, each building its parser once as batch_parser's
+workers do, or threads. At most `max_pending` parses are in flight; further
+callers wait for a slot before their file is even read, so a burst of
+uploads cannot queue unbounded text in memory.
+
+    async with AsyncFundingParser(workers=4) as parser:
+        config = await parser.parse_file("funding.dsl")
+        async for path, result in parser.parse_many(["repos/"]):
+            ...
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional, Set, Union
+
+from metamodel.funding_metamodel import FundingConfiguration
+from textual.batch_parser import BACKENDS, ParseOutcome, create_parser, expand_paths
+
+
+EXECUTORS = ('process', 'thread')
+
+# Parser of the current worker process or thread, built once by _init_worker
+_worker = threading.local()
+
+
+def _init_worker(backend: str) -> None:
+    _worker.parser = create_parser(backend)
+
+
+def _parse_text(text: str) -> FundingConfiguration:
+    return _worker.parser.parse_text(text)
+
+
+def read_text(path: Union[str, Path]) -> str:
+    """Read a UTF-8 file (run on an I/O thread)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class AsyncFundingParser:
+    """
+    Parses DSL files and text on a bounded executor without blocking the event loop
+
+    Args:
+        backend: Parser backend ('regex', 'tokenizer' or 'textx')
+        workers: Worker processes or threads (default: CPU count)
+        max_pending: Parses in flight at once; further calls wait for a slot
+            (default: twice the workers)
+        executor: 'process' to parse in parallel on worker processes,
+            'thread' to parse on threads of this process (no pickling, but
+            parses share the GIL)
+    """
+
+    def __init__(self, backend: str = 'regex', workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 executor: str = 'process'):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend} (expected one of: {', '.join(BACKENDS)})")
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unsupported executor: {executor} (expected one of: {', '.join(EXECUTORS)})")
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        executor_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+        self._executor: Executor = executor_class(self.workers, initializer=_init_worker, initargs=(backend,))
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created on first use, inside the running loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    async def parse_text(self, text: str) -> FundingConfiguration:
+        """Parse DSL text on the executor"""
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, _parse_text, text)
+
+    async def parse_file(self, path: Union[str, Path]) -> FundingConfiguration:
+        """Read a DSL file on an I/O thread and parse it on the executor"""
+        loop = asyncio.get_running_loop()
+        async with self._semaphore():
+            text = await loop.run_in_executor(None, read_text, path)
+            return await loop.run_in_executor(self._executor, _parse_text, text)
+
+    async def _outcome(self, path: str) -> ParseOutcome:
+        try:
+            return path, await self.parse_file(path)
+        except Exception as e:
+            return path, e
+
+    async def parse_many(self, paths: Iterable[Union[str, Path]], pattern: str = '*.dsl') -> AsyncIterator[ParseOutcome]:
+        """
+        Parse many files and yield (path, FundingConfiguration | Exception) as each finishes
+
+        Directories are searched recursively for `pattern` on an I/O thread.
+        Only max_pending files are started at a time, so any number of paths
+        runs in bounded memory.
+        """
+        files = await asyncio.get_running_loop().run_in_executor(None, expand_paths, list(paths), pattern)
+        remaining = iter(files)
+        pending: Set[asyncio.Task] = set()
+        try:
+            while True:
+                for path in remaining:
+                    pending.add(asyncio.ensure_future(self._outcome(path)))
+                    if len(pending) >= self.max_pending:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def close(self) -> None:
+        """Shut the executor down, cancelling parses that have not started"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aclose(self) -> None:
+        """close() on an I/O thread, so the event loop keeps running meanwhile"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aenter__(self) -> "AsyncFundingParser":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
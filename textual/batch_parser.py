@@ -0,0 +1,133 @@
+"""
+Batch parsing - parse many Funding DSL files in parallel.
+
+Files are fanned out over a process pool whose workers each build their
+parser once (including the compiled textX metamodel), and results stream
+back in completion order.
+"""
+
+import glob
+import multiprocessing
+import os
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from metamodel.funding_metamodel import FundingConfiguration
+from textual.funding_dsl_parser import FundingDSLParser
+from textual.parse_cache import ParseCache
+
+
+BACKENDS = ('regex', 'tokenizer', 'textx')
+
+ParseOutcome = Tuple[str, Union[FundingConfiguration, Exception]]
+
+# A task runs in a worker with that worker's parser: task(parser, path) -> result
+BatchTask = Callable[[Any, str], Any]
+
+# Parser owned by the current worker process, built once by _init_worker
+_worker_parser = None
+
+
+def create_parser(backend: str = 'regex', cache_dir: Optional[str] = None):
+    """Create a parser for a backend name ('regex', 'tokenizer' or 'textx')"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend} (expected one of: {', '.join(BACKENDS)})")
+    cache = ParseCache(cache_dir) if cache_dir else None
+    if backend == 'textx':
+        from textual_textx.funding_dsl_textx_parser import FundingDSLTextXParser
+        return FundingDSLTextXParser(cache=cache)
+    return FundingDSLParser(engine=backend, cache=cache)
+
+
+def expand_paths(inputs: Iterable[Union[str, Path]], pattern: str = '*.dsl') -> List[str]:
+    """Expand files, directories (searched recursively for `pattern`) and glob patterns"""
+    paths = []
+    seen = set()
+    for item in inputs:
+        item = str(item)
+        if os.path.isdir(item):
+            matches = sorted(str(p) for p in Path(item).rglob(pattern))
+        elif glob.has_magic(item):
+            matches = sorted(glob.glob(item, recursive=True))
+        else:
+            matches = [item]
+        for path in matches:
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def _init_worker(backend: Optional[str], cache_dir: Optional[str]) -> None:
+    global _worker_parser
+    _worker_parser = create_parser(backend, cache_dir) if backend else None
+
+
+def _parse_file(parser, path: str) -> FundingConfiguration:
+    return parser.parse_file(path)
+
+
+def _attempt(task: BatchTask, parser, path: str) -> Tuple[str, Any]:
+    try:
+        return path, task(parser, path)
+    except Exception as e:
+        return path, e
+
+
+def _run_task(task: BatchTask, path: str) -> Tuple[str, Any]:
+    """Run a task in a pool worker, with the parser _init_worker built"""
+    return _attempt(task, _worker_parser, path)
+
+
+def parse_many(paths: Iterable[Union[str, Path]], workers: Optional[int] = None, backend: str = 'regex',
+               cache_dir: Optional[str] = None) -> Iterator[ParseOutcome]:
+    """
+    Parse many DSL files and yield (path, FundingConfiguration | Exception) as each finishes
+
+    Args:
+        paths: Files, directories or glob patterns
+        workers: Number of worker processes (default: CPU count); 1 parses in-process
+        backend: Parser backend ('regex', 'tokenizer' or 'textx')
+        cache_dir: Optional ParseCache directory shared by all workers
+
+    Returns:
+        Iterator of (path, result) tuples in completion order
+    """
+    return run_many(paths, _parse_file, workers=workers, backend=backend, cache_dir=cache_dir)
+
+
+def run_many(paths: Iterable[Union[str, Path]], task: BatchTask, workers: Optional[int] = None,
+             backend: Optional[str] = 'regex', cache_dir: Optional[str] = None,
+             pattern: str = '*.dsl') -> Iterator[Tuple[str, Any]]:
+    """
+    Run task(parser, path) for many DSL files and yield (path, result | Exception) as each finishes
+
+    The task must be picklable (a module-level function or a functools.partial
+    of one) and runs in a worker process with that worker's warm parser, or
+    with None when backend is None. Directories are searched recursively for
+    files matching `pattern`.
+    """
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend} (expected one of: {', '.join(BACKENDS)})")
+
+    files = expand_paths(paths, pattern)
+    workers = min(workers or os.cpu_count() or 1, max(len(files), 1))
+    return _iter_outcomes(files, task, workers, backend, cache_dir)
+
+
+def _iter_outcomes(files: List[str], task: BatchTask, workers: int, backend: Optional[str],
+                   cache_dir: Optional[str]) -> Iterator[Tuple[str, Any]]:
+    if not files:
+        return
+
+    if workers == 1:  # In-process: the parser stays local, so interleaved runs never share one
+        parser = create_parser(backend, cache_dir) if backend else None
+        for path in files:
+            yield _attempt(task, parser, path)
+        return
+
+    chunksize = max(1, min(64, len(files) // (workers * 4)))
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(backend, cache_dir)) as pool:
+        for outcome in pool.imap_unordered(partial(_run_task, task), files, chunksize=chunksize):
+            yield outcome
@@ -0,0 +1,171 @@
+"""
+DSL Serializer - Write FundingConfiguration objects back as funding DSL text.
+
+write_dsl() streams a configuration to a text file object one entity at a
+time, with elements in the order the textX grammar requires, so the output
+parses with every FundingDSLParser engine and with FundingDSLTextXParser.
+Parsing it with the tokenizer engine or with textX gives back an equal
+configuration for everything the DSL can express (textX also requires a
+url on custom sources); the regex engine lists sources grouped by platform.
+
+The DSL has no escape sequences (textX alone reads a backslash before a
+quote as an escape), so a string containing a double quote, a line break
+or a backslash before a quote - including a trailing one - cannot be
+written and raises ValueError rather than producing text that parses
+differently. Zero amount limits mean "no limit" and are left out.
+"""
+
+import io
+import math
+import re
+from decimal import Decimal
+from typing import IO, Optional
+
+from metamodel.funding_metamodel import (
+    FundingConfiguration, Beneficiary, FundingSource, FundingTier, FundingGoal,
+    FundingAmount, FundingPlatform
+)
+from metamodel.money import CentsAmount, MINOR_UNITS
+from textual.funding_dsl_parser import PLATFORM_KEYWORDS
+
+
+# Platform -> source keyword, the reverse of PLATFORM_KEYWORDS
+SOURCE_KEYWORDS = {platform: keyword for keyword, platform in PLATFORM_KEYWORDS.items()}
+
+# DSL property -> attribute, in grammar order
+BENEFICIARY_PROPERTIES = (
+    ('email', 'email'), ('github', 'github_username'), ('website', 'website'), ('description', 'description')
+)
+
+_UNREPRESENTABLE = re.compile(r'["\n\r]|\\\'|\\\Z')
+
+
+def dsl_string(value: str) -> str:
+    """Quote a string as a DSL string literal"""
+    if _UNREPRESENTABLE.search(value):
+        raise ValueError(f"Cannot write {value!r} as a DSL string: "
+                         "it contains a double quote, a line break or a backslash before a quote")
+    return f'"{value}"'
+
+
+def dsl_number(amount: FundingAmount) -> str:
+    """The DSL number literal of an amount, read back as the same value in either money mode"""
+    if isinstance(amount, CentsAmount):
+        cents = amount.cents
+        if cents < 0:
+            raise ValueError(f"Cannot write negative amount {amount}")
+        return f"{cents // MINOR_UNITS}.{cents % MINOR_UNITS:02d}"
+    value = float(amount.value)
+    if value < 0 or not math.isfinite(value):
+        raise ValueError(f"Cannot write amount {amount.value!r}: DSL numbers are finite and non-negative")
+    literal = repr(value)
+    if 'e' in literal:  # The DSL has no exponent notation
+        literal = format(Decimal(literal), 'f')
+    whole, _, fraction = literal.partition('.')
+    return literal if len(fraction) >= 2 else f"{whole}.{fraction:0<2}"
+
+
+def dsl_amount(amount: FundingAmount) -> str:
+    """The DSL `<number> <CURRENCY>` text of an amount"""
+    return f"{dsl_number(amount)} {amount.currency.value}"
+
+
+def _beneficiary_text(beneficiary: Beneficiary) -> str:
+    parts = [f"        beneficiary {dsl_string(beneficiary.name)} {{\n"]
+    for keyword, attribute in BENEFICIARY_PROPERTIES:
+        value = getattr(beneficiary, attribute)
+        if value is not None:
+            parts.append(f"            {keyword} {dsl_string(value)}\n")
+    parts.append("        }\n")
+    return ''.join(parts)
+
+
+def _source_text(source: FundingSource) -> str:
+    parts = [f"        {SOURCE_KEYWORDS[source.platform]} {dsl_string(source.username)} {{\n"]
+    if source.platform == FundingPlatform.CUSTOM and source.custom_url is not None:
+        parts.append(f"            url {dsl_string(source.custom_url)}\n")
+    parts.append(f"            type {source.funding_type.value}\n")
+    if source.is_active is not None:  # Parsed sources without `active` hold None
+        parts.append(f"            active {'true' if source.is_active else 'false'}\n")
+    if source.platform_specific_config:
+        parts.append("            config {\n")
+        for key, value in source.platform_specific_config.items():
+            parts.append(f"                {dsl_string(key)} {dsl_string(value)}\n")
+        parts.append("            }\n")
+    parts.append("        }\n")
+    return ''.join(parts)
+
+
+def _tier_text(tier: FundingTier) -> str:
+    parts = [f"        tier {dsl_string(tier.name)} {{\n"
+             f"            amount {dsl_amount(tier.amount)}\n"]
+    if tier.description is not None:
+        parts.append(f"            description {dsl_string(tier.description)}\n")
+    if tier.max_sponsors is not None:
+        if tier.max_sponsors < 0:
+            raise ValueError(f"Cannot write negative max_sponsors of tier {tier.name!r}")
+        parts.append(f"            max_sponsors {int(tier.max_sponsors)}\n")
+    if tier.benefits:
+        benefits = ',\n                '.join(dsl_string(benefit) for benefit in tier.benefits)
+        parts.append(f"            benefits [\n                {benefits}\n            ]\n")
+    parts.append("        }\n")
+    return ''.join(parts)
+
+
+def _goal_text(goal: FundingGoal) -> str:
+    parts = [f"        goal {dsl_string(goal.name)} {{\n"
+             f"            target {dsl_amount(goal.target_amount)}\n"
+             f"            current {dsl_amount(goal.current_amount)}\n"]
+    if goal.deadline is not None:
+        deadline = goal.deadline
+        parts.append(f'            deadline "{deadline.year:04d}-{deadline.month:02d}-{deadline.day:02d}"\n')
+    if goal.description is not None:
+        parts.append(f"            description {dsl_string(goal.description)}\n")
+    parts.append("        }\n")
+    return ''.join(parts)
+
+
+def write_dsl(config: FundingConfiguration, fp: IO[str], header: Optional[str] = None) -> None:
+    """
+    Stream a configuration as funding DSL text to a writable text file object
+
+    Args:
+        config: The configuration to write
+        fp: Text stream; each entity is written as soon as it is formatted
+        header: Optional text written first as `//` comment lines
+            (the textX grammar does not accept comments)
+
+    Raises:
+        ValueError: For strings or amounts the DSL cannot represent
+    """
+    write = fp.write
+    if header:
+        write(''.join(f"// {line}\n" for line in header.splitlines()) + "\n")
+
+    write(f"funding {dsl_string(config.project_name)} {{\n")
+    if config.description is not None:
+        write(f"    description {dsl_string(config.description)}\n")
+    write(f"    currency {config.preferred_currency.value}\n")
+    for keyword, limit in (('min_amount', config.min_amount), ('max_amount', config.max_amount)):
+        if limit is not None and limit.value:
+            write(f"    {keyword} {dsl_number(limit)}\n")
+
+    for block, entries, entry_text in (
+        ('beneficiaries', config.beneficiaries, _beneficiary_text),
+        ('sources', config.funding_sources, _source_text),
+        ('tiers', config.tiers, _tier_text),
+        ('goals', config.goals, _goal_text),
+    ):
+        if entries:
+            write(f"\n    {block} {{\n")
+            for entry in entries:
+                write(entry_text(entry))
+            write("    }\n")
+    write("}\n")
+
+
+def serialize_dsl(config: FundingConfiguration, header: Optional[str] = None) -> str:
+    """Return a configuration as funding DSL text"""
+    output = io.StringIO()
+    write_dsl(config, output, header)
+    return output.getvalue()
@@ -4,7 +4,7 @@ Uses simplified parsing (would use ANTLR-generated parser in production).
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, NamedTuple, Iterable
 from datetime import datetime
 
 from metamodel.funding_metamodel import (
@@ -12,6 +12,16 @@ from metamodel.funding_metamodel import (
     FundingGoal, FundingAmount, FundingPlatform, FundingType, 
     CurrencyType, FundingModelValidator
 )
+from metamodel.instrumentation import configuration_entities, span
+from metamodel.money import MONEY_MODES, amount_from_literal
+from textual.parse_cache import ParseCache
+
+
+# Bump when parsing changes what a document produces, to invalidate parse caches
+PARSER_VERSION = "2"
+
+# Comments, or a string literal that may contain comment markers
+_COMMENT_PATTERN = re.compile(r'(?P<string>"[^"\n]*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
 
 
 class ParseError(Exception):
@@ -19,25 +29,65 @@ class ParseError(Exception):
     pass
 
 
+# Source platforms in the order the regex engine scans for them
+SOURCE_PLATFORMS = [
+    'github_sponsors', 'patreon', 'ko_fi', 'open_collective', 'buy_me_a_coffee', 'liberapay', 'paypal',
+    'tidelift', 'issuehunt', 'community_bridge', 'polar', 'thanks_dev', 'custom'
+]
+
+# Source keyword -> platform (FundingPlatform.GITHUB_SPONSORS is `github_sponsors` in the DSL)
+PLATFORM_KEYWORDS = {
+    'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
+    'patreon': FundingPlatform.PATREON,
+    'ko_fi': FundingPlatform.KO_FI,
+    'open_collective': FundingPlatform.OPEN_COLLECTIVE,
+    'buy_me_a_coffee': FundingPlatform.BUY_ME_A_COFFEE,
+    'liberapay': FundingPlatform.LIBERAPAY,
+    'paypal': FundingPlatform.PAYPAL,
+    'tidelift': FundingPlatform.TIDELIFT,
+    'issuehunt': FundingPlatform.ISSUEHUNT,
+    'community_bridge': FundingPlatform.COMMUNITY_BRIDGE,
+    'polar': FundingPlatform.POLAR,
+    'thanks_dev': FundingPlatform.THANKS_DEV,
+    'custom': FundingPlatform.CUSTOM
+}
+
+# Entry headers (`keyword "name" {`) searched by position within each block
+_BENEFICIARY_PATTERN = re.compile(r'beneficiary\s+"([^"]+)"\s*\{')
+_TIER_PATTERN = re.compile(r'tier\s+"([^"]+)"\s*\{')
+_GOAL_PATTERN = re.compile(r'goal\s+"([^"]+)"\s*\{')
+_SOURCE_PATTERNS = {
+    platform: re.compile(rf'{platform}\s+"([^"]+)"\s*\{{') for platform in SOURCE_PLATFORMS
+}
+
+
 class FundingDSLParser:
-    """Parser that converts DSL text to metamodel objects"""
-    
-    def __init__(self):
-        self.platform_mapping = {
-            'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
-            'patreon': FundingPlatform.PATREON,
-            'ko_fi': FundingPlatform.KO_FI,
-            'open_collective': FundingPlatform.OPEN_COLLECTIVE,
-            'buy_me_a_coffee': FundingPlatform.BUY_ME_A_COFFEE,
-            'liberapay': FundingPlatform.LIBERAPAY,
-            'paypal': FundingPlatform.PAYPAL,
-            'tidelift': FundingPlatform.TIDELIFT,
-            'issuehunt': FundingPlatform.ISSUEHUNT,
-            'community_bridge': FundingPlatform.COMMUNITY_BRIDGE,
-            'polar': FundingPlatform.POLAR,
-            'thanks_dev': FundingPlatform.THANKS_DEV,
-            'custom': FundingPlatform.CUSTOM
-        }
+    """Parser that converts DSL text to metamodel objects
+    
+    Two engines build the same intermediate ``config_data`` dict:
+    
+    - ``"regex"`` (default): the original property-by-property regex scanner
+    - ``"tokenizer"``: tokenizes the input once and walks it with a
+      recursive-descent parser, so parse time grows linearly with file size
+    
+    Amounts are kept as their literal text until the configuration is built,
+    so ``money="cents"`` yields exact integer CentsAmount values straight
+    from literals like ``5.00 USD`` (the default ``"float"`` keeps FundingAmount).
+    """
+    
+    ENGINES = ('regex', 'tokenizer')
+    
+    def __init__(self, engine: str = 'regex', cache: Optional[ParseCache] = None, money: str = 'float'):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unsupported parser engine: {engine} (expected one of: {', '.join(self.ENGINES)})")
+        if money not in MONEY_MODES:
+            raise ValueError(f"Unsupported money mode: {money} (expected one of: {', '.join(MONEY_MODES)})")
+        self.engine = engine
+        self.money = money
+        self.cache = cache
+        self.cache_version = f"{engine}-{PARSER_VERSION}" if money == 'float' else f"{engine}-{money}-{PARSER_VERSION}"
+        
+        self.platform_mapping = dict(PLATFORM_KEYWORDS)
         
         self.funding_type_mapping = {
             'one_time': FundingType.ONE_TIME,
@@ -58,6 +108,8 @@ class FundingDSLParser:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
+            if self.cache is not None:
+                return self.cache.get_or_parse(content, self.cache_version, lambda: self.parse_text(content))
             return self.parse_text(content)
         except FileNotFoundError:
             raise ParseError(f"File not found: {file_path}")
@@ -67,17 +119,27 @@ class FundingDSLParser:
     def parse_text(self, text: str) -> FundingConfiguration:
         """Parse DSL text and return a FundingConfiguration object"""
         try:
-            config_data = self._simple_parse(text)
-            return self._build_configuration(config_data)
+            with span('parse.' + self.engine, chars=len(text)):
+                if self.engine == 'tokenizer':
+                    config_data = self._single_pass_parse(text)
+                else:
+                    config_data = self._simple_parse(text)
+            with span('build') as build:
+                config = self._build_configuration(config_data)
+                build.entities = configuration_entities(config)
+            return config
         except Exception as e:
             raise ParseError(f"Parse error: {str(e)}")
     
+    def _single_pass_parse(self, text: str) -> Dict[str, Any]:
+        """Tokenize the text once and build config_data in a single linear pass"""
+        return SinglePassParser(text, self.platform_mapping).parse()
+    
     def _simple_parse(self, text: str) -> Dict[str, Any]:
         """Simple parser for demonstration - would be replaced by ANTLR parser"""
         
-        # Remove comments
-        text = re.sub(r'//.*?$', '', text, flags=re.MULTILINE)
-        text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+        # Remove comments, keeping string literals such as "https://..." intact
+        text = _COMMENT_PATTERN.sub(lambda m: m.group('string') or '', text)
         
         # Extract project name
         funding_match = re.search(r'funding\s+"([^"]+)"\s*\{', text)
@@ -89,8 +151,8 @@ class FundingDSLParser:
         # Extract basic properties
         description = self._extract_string_property(text, 'description')
         currency = self._extract_keyword_property(text, 'currency')
-        min_amount = self._extract_number_property(text, 'min_amount')
-        max_amount = self._extract_number_property(text, 'max_amount')
+        min_amount = self._extract_number_literal(text, 'min_amount')
+        max_amount = self._extract_number_literal(text, 'max_amount')
         
         # Extract blocks
         beneficiaries = self._extract_beneficiaries(text)
@@ -128,6 +190,11 @@ class FundingDSLParser:
         match = re.search(pattern, text)
         return float(match.group(1)) if match else None
     
+    def _extract_number_literal(self, text: str, property_name: str) -> Optional[str]:
+        """Extract the literal text of a numeric property value"""
+        match = re.search(rf'{property_name}\s+([\d.]+)', text)
+        return match.group(1) if match else None
+    
     def _extract_balanced_block(self, text: str, block_name: str) -> Optional[str]:
         """Extract a block with balanced braces"""
         pattern = rf'{block_name}\s*\{{'
@@ -143,19 +210,49 @@ class FundingDSLParser:
         if start_pos >= len(text) or text[start_pos] != '{':
             return ""
         
-        brace_count = 0
-        pos = start_pos
+        end_pos = self._find_closing_brace(text, start_pos)
+        if end_pos == -1:
+            return ""  # Unbalanced braces
+        return text[start_pos + 1:end_pos]  # Content between braces
+    
+    def _find_closing_brace(self, text: str, start_pos: int) -> int:
+        """Return the position of the brace closing the one at start_pos, or -1.
+        
+        Jumps between braces with str.find instead of stepping over every character.
+        """
+        find = text.find
+        depth = 1
+        next_open = find('{', start_pos + 1)
+        pos = start_pos + 1
         
-        while pos < len(text):
-            if text[pos] == '{':
-                brace_count += 1
-            elif text[pos] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    return text[start_pos + 1:pos]  # Content between braces
-            pos += 1
+        while True:
+            close_pos = find('}', pos)
+            if close_pos == -1:
+                return -1
+            while next_open != -1 and next_open < close_pos:
+                depth += 1
+                next_open = find('{', next_open + 1)
+            depth -= 1
+            if depth == 0:
+                return close_pos
+            pos = close_pos + 1
+    
+    def _iter_block_entries(self, block_text: str, pattern: "re.Pattern[str]"):
+        """Yield (header match, properties text) for each entry of a block.
         
-        return ""  # Unbalanced braces
+        Entries are searched from a running position, so the block is never re-sliced.
+        """
+        pos = 0
+        while True:
+            match = pattern.search(block_text, pos)
+            if not match:
+                return
+            
+            start_pos = match.end() - 1  # Position of opening brace
+            props_text = self._extract_balanced_content(block_text, start_pos)
+            yield match, props_text
+            
+            pos = start_pos + len(props_text) + 2  # Move past this entry
     
     def _extract_beneficiaries(self, text: str) -> List[Dict[str, Any]]:
         """Extract beneficiaries block"""
@@ -167,27 +264,15 @@ class FundingDSLParser:
             return beneficiaries
         
         # Find individual beneficiaries
-        beneficiary_pattern = r'beneficiary\s+"([^"]+)"\s*\{'
-        pos = 0
-        while True:
-            match = re.search(beneficiary_pattern, beneficiaries_text[pos:])
-            if not match:
-                break
-            
-            name = match.group(1)
-            start_pos = pos + match.end() - 1  # Position of opening brace
-            props_text = self._extract_balanced_content(beneficiaries_text, start_pos)
-            
+        for match, props_text in self._iter_block_entries(beneficiaries_text, _BENEFICIARY_PATTERN):
             beneficiary = {
-                'name': name,
+                'name': match.group(1),
                 'email': self._extract_string_property(props_text, 'email'),
                 'github': self._extract_string_property(props_text, 'github'),
                 'website': self._extract_string_property(props_text, 'website'),
                 'description': self._extract_string_property(props_text, 'description')
             }
             beneficiaries.append(beneficiary)
-            
-            pos = start_pos + len(props_text) + 2  # Move past this beneficiary
         
         return beneficiaries
     
@@ -201,23 +286,11 @@ class FundingDSLParser:
             return sources
         
         # Find all sources (platform and custom)
-        all_platforms = ['github_sponsors', 'patreon', 'ko_fi', 'open_collective', 'buy_me_a_coffee', 'liberapay', 'paypal', 'tidelift', 'issuehunt', 'community_bridge', 'polar', 'thanks_dev', 'custom']
-        
-        for platform in all_platforms:
-            pattern = rf'{platform}\s+"([^"]+)"\s*\{{'
-            pos = 0
-            while True:
-                match = re.search(pattern, sources_text[pos:])
-                if not match:
-                    break
-                
-                username = match.group(1)
-                start_pos = pos + match.end() - 1  # Position of opening brace
-                props_text = self._extract_balanced_content(sources_text, start_pos)
-                
+        for platform in SOURCE_PLATFORMS:
+            for match, props_text in self._iter_block_entries(sources_text, _SOURCE_PATTERNS[platform]):
                 source = {
                     'platform': platform,
-                    'username': username,
+                    'username': match.group(1),
                     'type': self._extract_keyword_property(props_text, 'type'),
                     'active': self._extract_boolean_property(props_text, 'active'),
                     'config': self._extract_config_block(props_text)
@@ -227,7 +300,6 @@ class FundingDSLParser:
                     source['url'] = self._extract_string_property(props_text, 'url')
                 
                 sources.append(source)
-                pos = start_pos + len(props_text) + 2  # Move past this source
         
         return sources
     
@@ -263,32 +335,20 @@ class FundingDSLParser:
             return tiers
         
         # Find individual tiers
-        tier_pattern = r'tier\s+"([^"]+)"\s*\{'
-        pos = 0
-        while True:
-            match = re.search(tier_pattern, tiers_text[pos:])
-            if not match:
-                break
-            
-            name = match.group(1)
-            start_pos = pos + match.end() - 1  # Position of opening brace
-            props_text = self._extract_balanced_content(tiers_text, start_pos)
-            
+        for match, props_text in self._iter_block_entries(tiers_text, _TIER_PATTERN):
             # Extract amount
             amount_match = re.search(r'amount\s+([\d.]+)\s+([A-Z]+)', props_text)
-            amount_value = float(amount_match.group(1)) if amount_match else 0.0
+            amount_value = amount_match.group(1) if amount_match else '0.0'
             amount_currency = amount_match.group(2) if amount_match else 'USD'
             
             tier = {
-                'name': name,
+                'name': match.group(1),
                 'amount': {'value': amount_value, 'currency': amount_currency},
                 'description': self._extract_string_property(props_text, 'description'),
                 'max_sponsors': self._extract_number_property(props_text, 'max_sponsors'),
                 'benefits': self._extract_string_list(props_text, 'benefits')
             }
             tiers.append(tier)
-            
-            pos = start_pos + len(props_text) + 2  # Move past this tier
         
         return tiers
     
@@ -302,37 +362,25 @@ class FundingDSLParser:
             return goals
         
         # Find individual goals
-        goal_pattern = r'goal\s+"([^"]+)"\s*\{'
-        pos = 0
-        while True:
-            match = re.search(goal_pattern, goals_text[pos:])
-            if not match:
-                break
-            
-            name = match.group(1)
-            start_pos = pos + match.end() - 1  # Position of opening brace
-            props_text = self._extract_balanced_content(goals_text, start_pos)
-            
+        for match, props_text in self._iter_block_entries(goals_text, _GOAL_PATTERN):
             # Extract target amount
             target_match = re.search(r'target\s+([\d.]+)\s+([A-Z]+)', props_text)
-            target_value = float(target_match.group(1)) if target_match else 0.0
+            target_value = target_match.group(1) if target_match else '0.0'
             target_currency = target_match.group(2) if target_match else 'USD'
             
             # Extract current amount
             current_match = re.search(r'current\s+([\d.]+)\s+([A-Z]+)', props_text)
-            current_value = float(current_match.group(1)) if current_match else 0.0
+            current_value = current_match.group(1) if current_match else '0.0'
             current_currency = current_match.group(2) if current_match else 'USD'
             
             goal = {
-                'name': name,
+                'name': match.group(1),
                 'target_amount': {'value': target_value, 'currency': target_currency},
                 'current_amount': {'value': current_value, 'currency': current_currency},
                 'description': self._extract_string_property(props_text, 'description'),
                 'deadline': self._extract_string_property(props_text, 'deadline')
             }
             goals.append(goal)
-            
-            pos = start_pos + len(props_text) + 2  # Move past this goal
         
         return goals
     
@@ -360,108 +408,377 @@ class FundingDSLParser:
             )
         )
         
-        # Set amount limits
-        if config_data.get('min_amount'):
-            config.min_amount = FundingAmount(
-                config_data['min_amount'], 
-                config.preferred_currency
-            )
+        # Set amount limits (a zero limit means no limit)
+        if config_data.get('min_amount') and float(config_data['min_amount']):
+            config.min_amount = self._amount(config_data['min_amount'], config.preferred_currency)
         
-        if config_data.get('max_amount'):
-            config.max_amount = FundingAmount(
-                config_data['max_amount'], 
-                config.preferred_currency
-            )
+        if config_data.get('max_amount') and float(config_data['max_amount']):
+            config.max_amount = self._amount(config_data['max_amount'], config.preferred_currency)
         
-        # Add beneficiaries
+        # Add beneficiaries, funding sources, tiers and goals
         for ben_data in config_data.get('beneficiaries', []):
-            beneficiary = Beneficiary(
-                name=ben_data['name'],
-                email=ben_data.get('email'),
-                github_username=ben_data.get('github'),
-                website=ben_data.get('website'),
-                description=ben_data.get('description')
-            )
-            config.add_beneficiary(beneficiary)
-        
-        # Add funding sources
+            config.add_beneficiary(self._build_beneficiary(ben_data))
         for source_data in config_data.get('sources', []):
-            platform = self.platform_mapping.get(
-                source_data['platform'], FundingPlatform.CUSTOM
-            )
-            funding_type = self.funding_type_mapping.get(
-                source_data.get('type', 'both'), FundingType.BOTH
-            )
-            
-            source = FundingSource(
-                platform=platform,
-                username=source_data['username'],
-                funding_type=funding_type,
-                is_active=source_data.get('active', True),
-                custom_url=source_data.get('url'),
-                platform_specific_config=source_data.get('config', {})
-            )
-            config.add_funding_source(source)
-        
-        # Add tiers
+            config.add_funding_source(self._build_source(source_data))
         for tier_data in config_data.get('tiers', []):
-            amount_data = tier_data['amount']
-            amount = FundingAmount(
-                amount_data['value'],
-                self.currency_mapping.get(amount_data['currency'], CurrencyType.USD)
-            )
-            
-            tier = FundingTier(
-                name=tier_data['name'],
-                amount=amount,
-                description=tier_data.get('description'),
-                benefits=tier_data.get('benefits', []),
-                max_sponsors=int(tier_data['max_sponsors']) if tier_data.get('max_sponsors') else None
-            )
-            config.add_tier(tier)
-        
-        # Add goals
+            config.add_tier(self._build_tier(tier_data))
         for goal_data in config_data.get('goals', []):
-            target_data = goal_data['target_amount']
-            target_amount = FundingAmount(
-                target_data['value'],
-                self.currency_mapping.get(target_data['currency'], CurrencyType.USD)
-            )
-            
-            current_data = goal_data['current_amount']
-            current_amount = FundingAmount(
-                current_data['value'],
-                self.currency_mapping.get(current_data['currency'], CurrencyType.USD)
-            )
-            
-            deadline = None
-            if goal_data.get('deadline'):
-                try:
-                    deadline = datetime.strptime(goal_data['deadline'], '%Y-%m-%d')
-                except ValueError:
-                    pass  # Invalid date format, skip
-            
-            goal = FundingGoal(
-                name=goal_data['name'],
-                target_amount=target_amount,
-                current_amount=current_amount,
-                description=goal_data.get('description'),
-                deadline=deadline
-            )
-            config.add_goal(goal)
+            config.add_goal(self._build_goal(goal_data))
         
         return config
+    
+    def _build_beneficiary(self, ben_data: Dict[str, Any]) -> Beneficiary:
+        """Build one Beneficiary from its parsed entry"""
+        return Beneficiary(
+            name=ben_data['name'],
+            email=ben_data.get('email'),
+            github_username=ben_data.get('github'),
+            website=ben_data.get('website'),
+            description=ben_data.get('description')
+        )
+    
+    def _build_source(self, source_data: Dict[str, Any]) -> FundingSource:
+        """Build one FundingSource from its parsed entry"""
+        platform = self.platform_mapping.get(
+            source_data['platform'], FundingPlatform.CUSTOM
+        )
+        funding_type = self.funding_type_mapping.get(
+            source_data.get('type', 'both'), FundingType.BOTH
+        )
+        
+        return FundingSource(
+            platform=platform,
+            username=source_data['username'],
+            funding_type=funding_type,
+            is_active=source_data.get('active', True),
+            custom_url=source_data.get('url'),
+            platform_specific_config=source_data.get('config', {})
+        )
+    
+    def _build_tier(self, tier_data: Dict[str, Any]) -> FundingTier:
+        """Build one FundingTier from its parsed entry"""
+        amount_data = tier_data['amount']
+        amount = self._amount(
+            amount_data['value'],
+            self.currency_mapping.get(amount_data['currency'], CurrencyType.USD)
+        )
+        
+        return FundingTier(
+            name=tier_data['name'],
+            amount=amount,
+            description=tier_data.get('description'),
+            benefits=tier_data.get('benefits', []),
+            max_sponsors=int(tier_data['max_sponsors']) if tier_data.get('max_sponsors') else None
+        )
+    
+    def _build_goal(self, goal_data: Dict[str, Any]) -> FundingGoal:
+        """Build one FundingGoal from its parsed entry"""
+        target_data = goal_data['target_amount']
+        target_amount = self._amount(
+            target_data['value'],
+            self.currency_mapping.get(target_data['currency'], CurrencyType.USD)
+        )
+        
+        current_data = goal_data['current_amount']
+        current_amount = self._amount(
+            current_data['value'],
+            self.currency_mapping.get(current_data['currency'], CurrencyType.USD)
+        )
+        
+        deadline = None
+        if goal_data.get('deadline'):
+            try:
+                deadline = datetime.strptime(goal_data['deadline'], '%Y-%m-%d')
+            except ValueError:
+                pass  # Invalid date format, skip
+        
+        return FundingGoal(
+            name=goal_data['name'],
+            target_amount=target_amount,
+            current_amount=current_amount,
+            description=goal_data.get('description'),
+            deadline=deadline
+        )
+    
+    def _amount(self, literal: str, currency: CurrencyType) -> FundingAmount:
+        """Build an amount from a number literal in the parser's money mode"""
+        return amount_from_literal(literal, currency, self.money)
+
+
+class Token(NamedTuple):
+    """A lexical token produced by :func:`tokenize`"""
+    kind: str   # 'string', 'number', 'ident' or 'punct'
+    value: str  # Token text (string tokens without their quotes)
+    pos: int    # Offset of the token in the source text
+
+
+_TOKEN_PATTERN = re.compile(r'''
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+  | "(?P<string>[^"\n]*)"
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<punct>[{}\[\],])
+  | (?P<error>.)
+''', re.VERBOSE | re.DOTALL)
+
+
+def _line_of(text: str, pos: int) -> int:
+    """Return the 1-based line number of an offset"""
+    return text.count('\n', 0, pos) + 1
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split DSL text into tokens in one pass, dropping whitespace and comments"""
+    tokens = []
+    append = tokens.append
+    for m in _TOKEN_PATTERN.finditer(text):
+        kind = m.lastgroup
+        if kind == 'skip':
+            continue
+        if kind == 'error':
+            raise ParseError(f"Line {_line_of(text, m.start())}: unexpected character {m.group()!r}")
+        append(Token(kind, m.group(kind), m.start()))
+    return tokens
+
+
+class SinglePassParser:
+    """Recursive-descent parser over the token list of one funding DSL document.
+    
+    Produces the same ``config_data`` dict as ``FundingDSLParser._simple_parse``,
+    visiting every token exactly once.
+    """
+    
+    # DSL property -> (config_data key, value reader) per entity kind
+    BENEFICIARY_PROPERTIES = {
+        'email': ('email', 'string'),
+        'github': ('github', 'string'),
+        'website': ('website', 'string'),
+        'description': ('description', 'string')
+    }
+    
+    SOURCE_PROPERTIES = {
+        'type': ('type', 'keyword'),
+        'active': ('active', 'boolean'),
+        'config': ('config', 'config')
+    }
+    
+    CUSTOM_SOURCE_PROPERTIES = dict(SOURCE_PROPERTIES, url=('url', 'string'))
+    
+    TIER_PROPERTIES = {
+        'amount': ('amount', 'amount'),
+        'description': ('description', 'string'),
+        'max_sponsors': ('max_sponsors', 'number'),
+        'benefits': ('benefits', 'string_list')
+    }
+    
+    GOAL_PROPERTIES = {
+        'target': ('target_amount', 'amount'),
+        'current': ('current_amount', 'amount'),
+        'deadline': ('deadline', 'string'),
+        'description': ('description', 'string')
+    }
+    
+    def __init__(self, text: str, platforms: Iterable[str]):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.index = 0
+        self.platforms = frozenset(platforms)
+        self._readers = {
+            'string': self._expect_string,
+            'keyword': self._expect_ident,
+            'number': self._expect_number,
+            'boolean': self._expect_boolean,
+            'amount': self._read_amount,
+            'string_list': self._read_string_list,
+            'config': self._read_config
+        }
+    
+    def parse(self) -> Dict[str, Any]:
+        """Parse the whole document and return the config_data dict"""
+        self._expect_keyword('funding')
+        config_data = {
+            'project_name': self._expect_string(),
+            'description': None,
+            'currency': None,
+            'min_amount': None,
+            'max_amount': None,
+            'beneficiaries': [],
+            'sources': [],
+            'tiers': [],
+            'goals': []
+        }
+        self._expect_punct('{')
+        
+        while not self._at_punct('}'):
+            token = self._next()
+            if token.kind != 'ident':
+                raise self._error(token, "a configuration element")
+            keyword = token.value
+            
+            if keyword == 'description':
+                config_data['description'] = self._expect_string()
+            elif keyword == 'currency':
+                config_data['currency'] = self._expect_ident()
+            elif keyword in ('min_amount', 'max_amount'):
+                config_data[keyword] = self._expect_number_literal()
+            elif keyword == 'beneficiaries':
+                self._parse_entries(config_data['beneficiaries'], ('beneficiary',), self.BENEFICIARY_PROPERTIES)
+            elif keyword == 'sources':
+                self._parse_sources(config_data['sources'])
+            elif keyword == 'tiers':
+                self._parse_entries(config_data['tiers'], ('tier',), self.TIER_PROPERTIES)
+            elif keyword == 'goals':
+                self._parse_entries(config_data['goals'], ('goal',), self.GOAL_PROPERTIES)
+            else:
+                raise self._error(token, "a configuration element")
+        
+        self._expect_punct('}')
+        if self.index < len(self.tokens):
+            raise self._error(self.tokens[self.index], "end of input")
+        
+        return config_data
+    
+    def _parse_entries(self, entries: List[Dict[str, Any]], keywords: Iterable[str],
+                       properties: Dict[str, Any]) -> None:
+        """Parse a ``block { keyword "name" { ... } ... }`` list of entities"""
+        self._expect_punct('{')
+        while not self._at_punct('}'):
+            entries.append(self._parse_entry(keywords, properties))
+        self._expect_punct('}')
+    
+    def _parse_entry(self, keywords: Iterable[str], properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse one ``keyword "name" { ... }`` entity"""
+        self._expect_keyword(*keywords)
+        entry = self._new_entry(properties, name=self._expect_string())
+        self._parse_properties(entry, properties)
+        return entry
+    
+    def _parse_sources(self, sources: List[Dict[str, Any]]) -> None:
+        """Parse the sources block, where the entry keyword names the platform"""
+        self._expect_punct('{')
+        while not self._at_punct('}'):
+            sources.append(self._parse_source())
+        self._expect_punct('}')
+    
+    def _parse_source(self) -> Dict[str, Any]:
+        """Parse one ``platform "username" { ... }`` source"""
+        token = self._next()
+        if token.kind != 'ident' or token.value not in self.platforms:
+            raise self._error(token, "a funding platform")
+        
+        platform = token.value
+        properties = self.CUSTOM_SOURCE_PROPERTIES if platform == 'custom' else self.SOURCE_PROPERTIES
+        source = self._new_entry(properties, platform=platform, username=self._expect_string())
+        source['config'] = {}
+        self._parse_properties(source, properties)
+        return source
+    
+    def _new_entry(self, properties: Dict[str, Any], **head: Any) -> Dict[str, Any]:
+        """Create an entry dict with the defaults the regex engine produces"""
+        entry = dict(head)
+        for key, reader in properties.values():
+            if reader == 'amount':
+                entry[key] = {'value': '0.0', 'currency': 'USD'}
+            elif reader == 'string_list':
+                entry[key] = []
+            else:
+                entry[key] = None
+        return entry
+    
+    def _parse_properties(self, entry: Dict[str, Any], properties: Dict[str, Any]) -> None:
+        """Parse a ``{ property value ... }`` body into entry"""
+        self._expect_punct('{')
+        while not self._at_punct('}'):
+            token = self._next()
+            spec = properties.get(token.value) if token.kind == 'ident' else None
+            if spec is None:
+                raise self._error(token, f"one of: {', '.join(properties)}")
+            key, reader = spec
+            entry[key] = self._readers[reader]()
+        self._expect_punct('}')
+    
+    def _read_amount(self) -> Dict[str, Any]:
+        value = self._expect_number_literal()
+        return {'value': value, 'currency': self._expect_ident()}
+    
+    def _read_string_list(self) -> List[str]:
+        items = []
+        self._expect_punct('[')
+        while not self._at_punct(']'):
+            items.append(self._expect_string())
+            if not self._at_punct(']'):
+                self._expect_punct(',')
+        self._expect_punct(']')
+        return items
+    
+    def _read_config(self) -> Dict[str, str]:
+        config = {}
+        self._expect_punct('{')
+        while not self._at_punct('}'):
+            key = self._expect_string()
+            config[key] = self._expect_string()
+        self._expect_punct('}')
+        return config
+    
+    def _next(self) -> Token:
+        if self.index >= len(self.tokens):
+            raise ParseError(f"Line {_line_of(self.text, len(self.text))}: unexpected end of input")
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+    
+    def _at_punct(self, value: str) -> bool:
+        if self.index >= len(self.tokens):
+            raise ParseError(f"Line {_line_of(self.text, len(self.text))}: unexpected end of input, expected '{value}'")
+        token = self.tokens[self.index]
+        return token.kind == 'punct' and token.value == value
+    
+    def _expect(self, kind: str, expected: str) -> Token:
+        token = self._next()
+        if token.kind != kind:
+            raise self._error(token, expected)
+        return token
+    
+    def _expect_punct(self, value: str) -> None:
+        token = self._next()
+        if token.kind != 'punct' or token.value != value:
+            raise self._error(token, f"'{value}'")
+    
+    def _expect_keyword(self, *keywords: str) -> str:
+        token = self._next()
+        if token.kind != 'ident' or token.value not in keywords:
+            raise self._error(token, ' or '.join(f"'{k}'" for k in keywords))
+        return token.value
+    
+    def _expect_string(self) -> str:
+        return self._expect('string', 'a string').value
+    
+    def _expect_ident(self) -> str:
+        return self._expect('ident', 'a keyword').value
+    
+    def _expect_number(self) -> float:
+        return float(self._expect_number_literal())
+    
+    def _expect_number_literal(self) -> str:
+        return self._expect('number', 'a number').value
+    
+    def _expect_boolean(self) -> bool:
+        return self._expect_keyword('true', 'false') == 'true'
+    
+    def _error(self, token: Token, expected: str) -> ParseError:
+        found = f'"{token.value}"' if token.kind == 'string' else token.value
+        return ParseError(f"Line {_line_of(self.text, token.pos)}: expected {expected}, found {found}")
 
 
-def parse_funding_dsl_file(file_path: str) -> FundingConfiguration:
+def parse_funding_dsl_file(file_path: str, engine: str = 'regex', money: str = 'float') -> FundingConfiguration:
     """Parse a funding DSL file and return a FundingConfiguration object"""
-    parser = FundingDSLParser()
+    parser = FundingDSLParser(engine, money=money)
     return parser.parse_file(file_path)
 
 
-def parse_funding_dsl_text(text: str) -> FundingConfiguration:
+def parse_funding_dsl_text(text: str, engine: str = 'regex', money: str = 'float') -> FundingConfiguration:
     """Parse funding DSL text and return a FundingConfiguration object"""
-    parser = FundingDSLParser()
+    parser = FundingDSLParser(engine, money=money)
     return parser.parse_text(text)
 
 
@@ -0,0 +1,285 @@
+"""
+Incremental parsing - re-parse only the part of a DSL document an edit touched.
+
+IncrementalParser parses a document with the tokenizer engine and keeps,
+besides the configuration, where each block and each entry of the
+beneficiaries, sources, tiers and goals blocks lies in the text. An edit
+(offset, removed length, inserted text) that falls inside one block is
+applied by re-tokenizing only the entries it overlaps, from the end of the
+entry before it to the end of the entry after it; every other entry keeps
+its entity object and the following offsets are shifted. Edits outside the
+blocks (the project name, description, currency and amount limits) or
+spanning several blocks fall back to a full parse, which still reuses the
+entity of every entry whose text is unchanged.
+
+    parser = IncrementalParser()
+    result = parser.parse(text)
+    result = result.edit(offset, removed, inserted)
+    result.config  # Equal to parsing result.text with the tokenizer engine
+
+The configurations share their unchanged entities (structural sharing), so
+an entity edited in place shows in every configuration holding it; the lists
+themselves are never shared.
+"""
+
+import dataclasses
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from metamodel.funding_metamodel import FundingConfiguration
+from metamodel.instrumentation import configuration_entities, span
+from textual.funding_dsl_parser import FundingDSLParser, ParseError, SinglePassParser
+
+
+# Block keyword -> (entry keywords, entry properties) of the blocks entries are tracked in;
+# sources are parsed by SinglePassParser._parse_source instead
+_ENTRY_SYNTAX = {
+    'beneficiaries': (('beneficiary',), SinglePassParser.BENEFICIARY_PROPERTIES),
+    'tiers': (('tier',), SinglePassParser.TIER_PROPERTIES),
+    'goals': (('goal',), SinglePassParser.GOAL_PROPERTIES)
+}
+_BLOCK_OF_KEYWORD = {keywords[0]: block for block, (keywords, _) in _ENTRY_SYNTAX.items()}
+
+# Block keyword -> (FundingConfiguration list, FundingDSLParser builder)
+_BLOCK_FIELDS = {
+    'beneficiaries': ('beneficiaries', '_build_beneficiary'),
+    'sources': ('funding_sources', '_build_source'),
+    'tiers': ('tiers', '_build_tier'),
+    'goals': ('goals', '_build_goal')
+}
+
+
+class _Block(NamedTuple):
+    """Where a block and its entries lie in the text, with the entries' entities"""
+    kind: str            # Block keyword: 'beneficiaries', 'sources', 'tiers' or 'goals'
+    start: int           # Offset of the block's '{'
+    end: int             # Offset just past its '}'
+    starts: List[int]    # Entry offsets, relative to start
+    ends: List[int]      # Offsets just past each entry's '}', relative to start
+    entities: List[Any]
+
+
+class _LayoutParser(SinglePassParser):
+    """SinglePassParser that records the offsets of blocks and entries"""
+
+    def __init__(self, text: str, platforms):
+        super().__init__(text, platforms)
+        self.blocks: List[tuple] = []  # (kind, start, end, starts, ends, entry dicts)
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+
+    def _offset(self) -> int:
+        return self.tokens[self.index].pos if self.index < len(self.tokens) else len(self.text)
+
+    def _record_block(self, kind: str, entries: List[Dict[str, Any]], parse: Callable[[], None]) -> None:
+        start = self._offset()
+        self.starts, self.ends = [], []
+        parse()
+        end = self.tokens[self.index - 1].pos + 1
+        self.blocks.append((kind, start, end, self.starts, self.ends, entries))
+
+    def _parse_entries(self, entries, keywords, properties) -> None:
+        self._record_block(_BLOCK_OF_KEYWORD[keywords[0]], entries,
+                           lambda: SinglePassParser._parse_entries(self, entries, keywords, properties))
+
+    def _parse_sources(self, sources) -> None:
+        self._record_block('sources', sources, lambda: SinglePassParser._parse_sources(self, sources))
+
+    def _record_entry(self, parse: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        self.starts.append(self._offset())
+        entry = parse()
+        self.ends.append(self.tokens[self.index - 1].pos + 1)
+        return entry
+
+    def _parse_entry(self, keywords, properties) -> Dict[str, Any]:
+        return self._record_entry(lambda: SinglePassParser._parse_entry(self, keywords, properties))
+
+    def _parse_source(self) -> Dict[str, Any]:
+        return self._record_entry(lambda: SinglePassParser._parse_source(self))
+
+    def parse_region(self, kind: str, closes_block: bool) -> List[Dict[str, Any]]:
+        """
+        Parse a run of entries of one block, followed by the block's '}' when closes_block
+
+        The text must end with the '}' of its last entry (or of the block), so
+        no token or comment of the region runs on into the text after it.
+        """
+        if kind == 'sources':
+            parse_entry = self._parse_source
+        else:
+            keywords, properties = _ENTRY_SYNTAX[kind]
+            parse_entry = lambda: self._parse_entry(keywords, properties)
+
+        entries = []
+        if closes_block:
+            while not self._at_punct('}'):
+                entries.append(parse_entry())
+            self._expect_punct('}')
+        else:
+            while self.index < len(self.tokens):
+                entries.append(parse_entry())
+        if self.index < len(self.tokens):
+            raise self._error(self.tokens[self.index], "end of input")
+        if not self.tokens or self.tokens[-1].pos != len(self.text) - 1:
+            raise ParseError("The edited region does not end with a '}'")
+        return entries
+
+
+class IncrementalParse:
+    """
+    The result of an IncrementalParser: a document's text and configuration
+
+    Attributes:
+        text: The parsed DSL text
+        config: Its FundingConfiguration
+        mode: How it was parsed - 'full', or 'block' when only the entries
+            around an edit were re-parsed
+    """
+
+    def __init__(self, parser: "IncrementalParser", text: str, header: FundingConfiguration,
+                 blocks: List[_Block], mode: str):
+        self.parser = parser
+        self.text = text
+        self.mode = mode
+        self._header = header  # The configuration without entities
+        self._blocks = blocks
+        lists: Dict[str, List[Any]] = {field: [] for field, _ in _BLOCK_FIELDS.values()}
+        for block in blocks:
+            lists[_BLOCK_FIELDS[block.kind][0]].extend(block.entities)
+        self.config: FundingConfiguration = dataclasses.replace(header, **lists)
+
+    def edit(self, offset: int, removed: int, inserted: str) -> "IncrementalParse":
+        """Parse the text with `removed` characters at `offset` replaced by `inserted`"""
+        return self.parser.edit(self, offset, removed, inserted)
+
+
+class IncrementalParser:
+    """
+    Parses DSL text and re-parses it after edits, reusing what an edit did not touch
+
+    Configurations equal those of FundingDSLParser(engine='tokenizer').
+
+    Args:
+        money: Money mode ('float' or 'cents', see FundingDSLParser)
+    """
+
+    def __init__(self, money: str = 'float'):
+        self._parser = FundingDSLParser('tokenizer', money=money)
+        self._builders = {kind: getattr(self._parser, builder) for kind, (_, builder) in _BLOCK_FIELDS.items()}
+
+    def parse(self, text: str) -> IncrementalParse:
+        """Parse a whole document"""
+        with span('parse.incremental', chars=len(text), mode='full') as parse:
+            result = self._parse(text)
+            parse.entities = configuration_entities(result.config)
+        return result
+
+    def edit(self, previous: IncrementalParse, offset: int, removed: int, inserted: str) -> IncrementalParse:
+        """
+        Apply an edit to a parsed document and parse the result
+
+        Args:
+            previous: The parse of the text before the edit
+            offset: Offset of the edit in previous.text
+            removed: Number of characters removed at offset
+            inserted: Text inserted at offset
+
+        Returns:
+            The parse of the edited text; previous is left as it was
+        """
+        text = previous.text
+        if offset < 0 or removed < 0 or offset + removed > len(text):
+            raise ValueError(f"Edit {offset}:{offset + removed} is outside the text (length {len(text)})")
+        new_text = text[:offset] + inserted + text[offset + removed:]
+        with span('parse.incremental', chars=len(inserted)) as parse:
+            result = self._reparse_block(previous, new_text, offset, removed, len(inserted) - removed)
+            if result is None:
+                result = self._parse(new_text, previous)
+            parse.attributes['mode'] = result.mode
+            parse.entities = configuration_entities(result.config)
+        return result
+
+    def _parse(self, text: str, previous: Optional[IncrementalParse] = None) -> IncrementalParse:
+        """Parse a whole document, reusing the entities of previous whose entry text is unchanged"""
+        reusable: Dict[str, Dict[str, List[Any]]] = {}
+        if previous is not None:
+            for block in previous._blocks:
+                pool = reusable.setdefault(block.kind, {})
+                for start, end, entity in zip(block.starts, block.ends, block.entities):
+                    pool.setdefault(previous.text[block.start + start:block.start + end], []).append(entity)
+
+        try:
+            layout = _LayoutParser(text, self._parser.platform_mapping)
+            config_data = layout.parse()
+            header = self._parser._build_configuration(
+                dict(config_data, beneficiaries=[], sources=[], tiers=[], goals=[])
+            )
+            blocks = []
+            for kind, start, end, starts, ends, entries in layout.blocks:
+                pool = reusable.get(kind, {})
+                entities = [
+                    self._reuse(pool, text[s:e]) or self._builders[kind](entry)
+                    for s, e, entry in zip(starts, ends, entries)
+                ]
+                blocks.append(_Block(kind, start, end, [s - start for s in starts], [e - start for e in ends],
+                                     entities))
+        except Exception as e:
+            raise ParseError(f"Parse error: {str(e)}")
+        return IncrementalParse(self, text, header, blocks, 'full')
+
+    @staticmethod
+    def _reuse(pool: Dict[str, List[Any]], entry_text: str) -> Any:
+        """Take an unused entity parsed from the same entry text, if any"""
+        entities = pool.get(entry_text)
+        return entities.pop(0) if entities else None
+
+    def _reparse_block(self, previous: IncrementalParse, new_text: str, offset: int, removed: int,
+                       delta: int) -> Optional[IncrementalParse]:
+        """Re-parse the entries an edit inside one block overlaps, or None when it cannot"""
+        edit_end = offset + removed
+        for index, block in enumerate(previous._blocks):
+            if block.start < offset and edit_end < block.end:  # Both braces of the block are kept
+                break
+        else:
+            return None
+
+        # The region runs from the end of the last entry before the edit (or the
+        # block's '{') to the end of the first entry ending after it (or the block)
+        relative, relative_end = offset - block.start, edit_end - block.start
+        first = bisect_right(block.ends, relative)
+        stop = bisect_right(block.ends, relative_end)
+        region_start = block.ends[first - 1] if first else 1
+        closes_block = stop == len(block.ends)
+        if closes_block:
+            region_end = block.end - block.start
+        else:
+            region_end = block.ends[stop]
+            stop += 1
+
+        region = new_text[block.start + region_start:block.start + region_end + delta]
+        pool: Dict[str, List[Any]] = {}
+        for start, end, entity in zip(block.starts[first:stop], block.ends[first:stop], block.entities[first:stop]):
+            pool.setdefault(previous.text[block.start + start:block.start + end], []).append(entity)
+        try:
+            layout = _LayoutParser(region, self._parser.platform_mapping)
+            entries = layout.parse_region(block.kind, closes_block)
+            entities = [
+                self._reuse(pool, region[start:end]) or self._builders[block.kind](entry)
+                for start, end, entry in zip(layout.starts, layout.ends, entries)
+            ]
+        except Exception:
+            return None  # A full parse reports the error, or sees the edit escape the block
+
+        edited = _Block(
+            block.kind, block.start, block.end + delta,
+            block.starts[:first] + [region_start + start for start in layout.starts]
+            + [start + delta for start in block.starts[stop:]],
+            block.ends[:first] + [region_start + end for end in layout.ends]
+            + [end + delta for end in block.ends[stop:]],
+            block.entities[:first] + entities + block.entities[stop:]
+        )
+        following = previous._blocks[index + 1:]
+        if delta:
+            following = [later._replace(start=later.start + delta, end=later.end + delta) for later in following]
+        blocks = previous._blocks[:index] + [edited] + following
+        return IncrementalParse(self, new_text, previous._header, blocks, 'block')
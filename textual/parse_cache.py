@@ -0,0 +1,170 @@
+"""
+Content-addressed parse cache for Funding DSL files.
+
+Parsed configurations are stored on local disk under the SHA-256 of the file
+content plus the parser version, so an unchanged file is never parsed twice -
+not even across runs. Entries are evicted least-recently-used first once the
+cache grows past its size cap.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from metamodel.funding_metamodel import FundingConfiguration
+from metamodel.serialization import configuration_to_dict, configuration_from_dict
+
+
+# Bump when the on-disk entry format changes, to orphan old entries
+CACHE_FORMAT_VERSION = "1"
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    'FUNDING_DSL_CACHE_DIR', Path.home() / '.cache' / 'funding-dsl' / 'parse'
+))
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ParseCache:
+    """On-disk LRU cache of parsed FundingConfiguration objects"""
+
+    def __init__(self, cache_dir: Union[str, Path, None] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: Optional["OrderedDict[str, int]"] = None  # key -> size, oldest first
+        self._total_bytes = 0
+
+    @staticmethod
+    def key_for(content: Union[str, bytes], parser_version: str) -> str:
+        """Return the cache key of a document for a given parser version"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_FORMAT_VERSION}:{parser_version}:".encode('utf-8'))
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[FundingConfiguration]:
+        """Return the cached configuration for key, or None on a miss"""
+        path = self._path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            config = configuration_from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # Record the access for LRU order across runs
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+            entries = self._load_index()
+            if key in entries:
+                entries.move_to_end(key)
+        return config
+
+    def put(self, key: str, config: FundingConfiguration) -> None:
+        """Store a configuration under key, evicting old entries if needed"""
+        payload = json.dumps(configuration_to_dict(config), ensure_ascii=False, separators=(',', ':'))
+        data = payload.encode('utf-8')
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and rename, so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            entries = self._load_index()
+            self._total_bytes -= entries.pop(key, 0)
+            entries[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def get_or_parse(self, content: Union[str, bytes], parser_version: str, parse) -> FundingConfiguration:
+        """Return the cached configuration for content, calling parse() on a miss"""
+        key = self.key_for(content, parser_version)
+        config = self.get(key)
+        if config is None:
+            config = parse()
+            self.put(key, config)
+        return config
+
+    def clear(self) -> None:
+        """Remove every entry from the cache"""
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current cache size"""
+        with self._lock:
+            entries = self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Scan the cache directory once, ordering entries by last use (mtime)"""
+        if self._entries is None:
+            found = []
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob('*/*.json'):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    found.append((stat.st_mtime, path.stem, stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+            self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits max_bytes"""
+        entries = self._entries
+        while entries and self._total_bytes > self.max_bytes:
+            oldest = next(iter(entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.unlink(self._path_for(key))
+        except OSError:
+            pass
@@ -8,11 +8,15 @@ definition and parsing framework.
 from .funding_dsl_textx_parser import (
     FundingDSLTextXParser, 
     parse_funding_dsl_file_textx, 
-    parse_funding_dsl_text_textx
+    parse_funding_dsl_text_textx,
+    get_cached_metamodel,
+    clear_metamodel_cache
 )
 
 __all__ = [
     'FundingDSLTextXParser',
     'parse_funding_dsl_file_textx',
-    'parse_funding_dsl_text_textx'
+    'parse_funding_dsl_text_textx',
+    'get_cached_metamodel',
+    'clear_metamodel_cache'
 ] 
\ No newline at end of file
@@ -4,16 +4,22 @@ Uses TextX grammar to parse DSL files and convert to metamodel objects.
 """
 
 import os
-from typing import Dict, List, Optional, Any
+import hashlib
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 
+import textx
 from textx import metamodel_from_file, TextXSyntaxError
 from metamodel.funding_metamodel import (
     FundingConfiguration, Beneficiary, FundingSource, FundingTier, 
     FundingGoal, FundingAmount, FundingPlatform, FundingType, 
     CurrencyType, FundingModelValidator
 )
+from metamodel.instrumentation import configuration_entities, span
+from metamodel.money import MONEY_MODES, amount_from_literal
+from textual.parse_cache import ParseCache
 
 
 class TextXParseError(Exception):
@@ -21,20 +27,76 @@ class TextXParseError(Exception):
     pass
 
 
+DEFAULT_GRAMMAR_FILE = Path(__file__).parent / "funding_dsl.tx"
+
+# Bump when _transform_model changes what a document produces, to invalidate parse caches
+TRANSFORM_VERSION = "1"
+
+# Process-wide metamodel cache keyed by the SHA-256 of the grammar source.
+# textX clones its parser for every model, so one metamodel can serve all threads.
+_metamodel_cache: Dict[str, Any] = {}
+_metamodel_cache_lock = threading.Lock()
+
+# Grammar hashes keyed by (resolved path, mtime in ns, size), so a parser
+# construction costs a stat() rather than reading and hashing the grammar
+_grammar_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def get_cached_metamodel(grammar_file: Union[str, Path, None] = None):
+    """Return the textX metamodel for a grammar file, building it at most once per process"""
+    grammar_path = Path(grammar_file) if grammar_file else DEFAULT_GRAMMAR_FILE
+    grammar_hash = get_grammar_hash(grammar_path)
+    
+    metamodel = _metamodel_cache.get(grammar_hash)
+    if metamodel is None:
+        with _metamodel_cache_lock:
+            metamodel = _metamodel_cache.get(grammar_hash)
+            if metamodel is None:
+                metamodel = metamodel_from_file(str(grammar_path))
+                _metamodel_cache[grammar_hash] = metamodel
+    return metamodel
+
+
+def get_grammar_hash(grammar_file: Union[str, Path, None] = None) -> str:
+    """Return the SHA-256 of a grammar file's source, re-read only when the file's mtime or size changes"""
+    grammar_path = (Path(grammar_file) if grammar_file else DEFAULT_GRAMMAR_FILE).resolve()
+    stat = grammar_path.stat()
+    key = (str(grammar_path), stat.st_mtime_ns, stat.st_size)
+    grammar_hash = _grammar_hashes.get(key)
+    if grammar_hash is None:
+        grammar_hash = _grammar_hashes[key] = hashlib.sha256(grammar_path.read_bytes()).hexdigest()
+    return grammar_hash
+
+
+def clear_metamodel_cache() -> None:
+    """Drop all cached metamodels (e.g. after editing the grammar in a long-running process)"""
+    with _metamodel_cache_lock:
+        _metamodel_cache.clear()
+        _grammar_hashes.clear()
+
+
 class FundingDSLTextXParser:
     """TextX-based parser that converts DSL text to metamodel objects"""
     
-    def __init__(self):
-        # Load the TextX grammar
-        self.grammar_file = Path(__file__).parent / "funding_dsl.tx"
+    def __init__(self, cache: Optional[ParseCache] = None, money: str = 'float'):
+        # Load the TextX grammar (compiled once per process, see get_cached_metamodel)
+        self.grammar_file = DEFAULT_GRAMMAR_FILE
         if not self.grammar_file.exists():
             raise TextXParseError(f"Grammar file not found: {self.grammar_file}")
         
         try:
-            self.metamodel = metamodel_from_file(str(self.grammar_file))
+            self.metamodel = get_cached_metamodel(self.grammar_file)
         except Exception as e:
             raise TextXParseError(f"Error loading TextX grammar: {e}")
         
+        if money not in MONEY_MODES:
+            raise TextXParseError(f"Unsupported money mode: {money} (expected one of: {', '.join(MONEY_MODES)})")
+        self.money = money
+        self.cache = cache
+        self.cache_version = f"textx-{textx.__version__}-{TRANSFORM_VERSION}-{get_grammar_hash(self.grammar_file)}"
+        if money != 'float':
+            self.cache_version += f"-{money}"
+        
         # Mapping dictionaries for enum conversion
         self.platform_mapping = {
             'github_sponsors': FundingPlatform.GITHUB_SPONSORS,
@@ -69,9 +131,14 @@ class FundingDSLTextXParser:
     def parse_file(self, file_path: str) -> FundingConfiguration:
         """Parse a .funding file and return a FundingConfiguration object"""
         try:
-            # Parse with TextX
-            textx_model = self.metamodel.model_from_file(file_path)
-            return self._transform_model(textx_model)
+            if self.cache is not None:
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+                # Parse the bytes that were hashed, not the file again, which may have changed since
+                return self.cache.get_or_parse(
+                    content, self.cache_version, lambda: self._parse_content(content.decode('utf-8'), file_path)
+                )
+            return self._parse_file_uncached(file_path)
         except FileNotFoundError:
             raise TextXParseError(f"File not found: {file_path}")
         except TextXSyntaxError as e:
@@ -79,17 +146,35 @@ class FundingDSLTextXParser:
         except Exception as e:
             raise TextXParseError(f"Error parsing file {file_path}: {str(e)}")
     
+    def _parse_file_uncached(self, file_path: str) -> FundingConfiguration:
+        # Parse with TextX
+        with span('parse.textx', path=file_path):
+            textx_model = self.metamodel.model_from_file(file_path)
+        return self._transform(textx_model)
+    
+    def _parse_content(self, text: str, file_path: str) -> FundingConfiguration:
+        with span('parse.textx', path=file_path):
+            textx_model = self.metamodel.model_from_str(text, file_name=file_path)
+        return self._transform(textx_model)
+    
     def parse_text(self, text: str) -> FundingConfiguration:
         """Parse DSL text and return a FundingConfiguration object"""
         try:
             # Parse with TextX
-            textx_model = self.metamodel.model_from_str(text)
-            return self._transform_model(textx_model)
+            with span('parse.textx', chars=len(text)):
+                textx_model = self.metamodel.model_from_str(text)
+            return self._transform(textx_model)
         except TextXSyntaxError as e:
             raise TextXParseError(f"Syntax error: {e}")
         except Exception as e:
             raise TextXParseError(f"Parse error: {str(e)}")
     
+    def _transform(self, textx_model) -> FundingConfiguration:
+        with span('transform.textx') as transform:
+            config = self._transform_model(textx_model)
+            transform.entities = configuration_entities(config)
+        return config
+    
     def _transform_model(self, textx_model) -> FundingConfiguration:
         """Transform TextX model object to our metamodel objects"""
         
@@ -102,15 +187,17 @@ class FundingDSLTextXParser:
         
         # Set amount limits
         if textx_model.min_amount:
-            config.min_amount = FundingAmount(
+            config.min_amount = amount_from_literal(
                 textx_model.min_amount.value, 
-                config.preferred_currency
+                config.preferred_currency,
+                self.money
             )
         
         if textx_model.max_amount:
-            config.max_amount = FundingAmount(
+            config.max_amount = amount_from_literal(
                 textx_model.max_amount.value, 
-                config.preferred_currency
+                config.preferred_currency,
+                self.money
             )
         
         # Transform beneficiaries
@@ -223,7 +310,7 @@ class FundingDSLTextXParser:
         # Transform amounts
         target_amount = self._transform_amount(goal_elem.target.amount)
         
-        current_amount = FundingAmount(0.0, target_amount.currency)  # default
+        current_amount = amount_from_literal('0', target_amount.currency, self.money)  # default
         if goal_elem.current:
             current_amount = self._transform_amount(goal_elem.current.amount)
         
@@ -247,7 +334,7 @@ class FundingDSLTextXParser:
     def _transform_amount(self, amount_elem) -> FundingAmount:
         """Transform TextX amount element to FundingAmount object"""
         currency = self.currency_mapping.get(amount_elem.currency, CurrencyType.USD)
-        return FundingAmount(amount_elem.value, currency)
+        return amount_from_literal(amount_elem.value, currency, self.money)
     
     def _get_currency(self, currency_elem) -> CurrencyType:
         """Get currency type from TextX element"""